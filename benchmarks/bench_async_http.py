@@ -0,0 +1,91 @@
+"""
+Benchmark HTTP: 200 GETs sequenciais (HTTPClient) x 200 concorrentes (AsyncHTTPClient)
+
+Sobe um servidor local (ThreadingHTTPServer, em outro processo para não
+disputar o GIL com o cliente) que responde cada GET depois de um pequeno
+atraso, simulando a latência da API, e compara o tempo total.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_async_http.py [requisições] [atraso_ms]
+"""
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bench_decoding import timed  # noqa: E402
+
+DELAY = 0.01
+BODY = json.dumps([{"id": str(i), "value": i * 1.5} for i in range(20)]).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    wbufsize = -1  # cabeçalho e corpo no mesmo segmento (evita o atraso do Nagle)
+
+    def do_GET(self):
+        time.sleep(DELAY)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(delay: float, ready) -> None:
+    global DELAY
+    DELAY = delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    ready.send(server.server_address[1])
+    server.serve_forever()
+
+
+def start_stub(delay: float):
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=(delay, child), daemon=True)
+    process.start()
+    return process, parent.recv()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    delay = (float(sys.argv[2]) if len(sys.argv) > 2 else 10) / 1000
+
+    server, port = start_stub(delay)
+    base_url = f"http://127.0.0.1:{port}"
+    # Environment exige BASE_URL; PORT dispensa o .env
+    os.environ.setdefault("BASE_URL", base_url)
+    os.environ.setdefault("PORT", "0")
+
+    from infrastructure.http import HTTPClient, AsyncHTTPClient
+    from infrastructure.http.async_http_client import run
+
+    sync_client = HTTPClient(base_url=base_url)
+    async_client = AsyncHTTPClient(base_url=base_url)
+
+    async def concurrent():
+        return await asyncio.gather(*(async_client.get(f"/items/{i}") for i in range(count)))
+
+    print(f"{count} GETs, atraso do servidor {delay * 1000:.0f} ms\n")
+    sequential, baseline = timed(
+        "HTTPClient sequencial", lambda: [sync_client.get(f"/items/{i}") for i in range(count)]
+    )
+    parallel, _ = timed("AsyncHTTPClient concorrente", lambda: run(concurrent()), baseline)
+
+    assert sequential == parallel, "respostas divergiram"
+    print("\nRespostas idênticas")
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Micro-benchmark: decodificação de lançamentos (from_dict x decode em lote)
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_decoding.py [quantidade]
+"""
+import gc
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from domain.entities import FinancialEntry  # noqa: E402
+from domain.entities.decoding import decode_financial_entries  # noqa: E402
+
+
+def _legacy_parse(value) -> Optional[datetime]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def legacy_from_dict(data: dict) -> FinancialEntry:
+    """Cópia do FinancialEntry.from_dict anterior (data convertida duas vezes)"""
+    parsed_date = _legacy_parse(data["date"])
+    if parsed_date is None:
+        raise ValueError("Data é obrigatória")
+    return FinancialEntry(
+        id=data.get("id"),
+        value=float(data["value"]),
+        date=_legacy_parse(data["date"]),
+        modality_id=data["modality_id"],
+        modality_name=data["modality_name"],
+        modality_color=data.get("modality_color", "#9333EA"),
+        type=data.get("type", "received"),
+        entry_type=data.get("entry_type", "normal"),
+        is_credit_plan=data.get("is_credit_plan", False),
+        credit_payment=data.get("credit_payment", False),
+        created_at=_legacy_parse(data.get("created_at")),
+        updated_at=_legacy_parse(data.get("updated_at")),
+    )
+
+
+def synthetic_rows(count: int) -> list:
+    rng = random.Random(42)
+    start = datetime(2025, 1, 1)
+    days = [(start + timedelta(days=d)).strftime("%Y-%m-%dT00:00:00") for d in range(60)]
+    rows = []
+    for i in range(count):
+        created = start + timedelta(seconds=i * 37)
+        rows.append(
+            {
+                "id": f"{i:024x}",
+                "value": round(rng.uniform(5, 5000), 2),
+                "date": rng.choice(days),
+                "modality_id": f"mod{i % 12}",
+                "modality_name": f"Modalidade {i % 12}",
+                "modality_color": "#9333EA",
+                "type": "received",
+                "entry_type": "normal",
+                "is_credit_plan": i % 7 == 0,
+                "credit_payment": i % 11 == 0,
+                "created_at": created.isoformat() + "Z",
+                "updated_at": created.isoformat() + "Z",
+            }
+        )
+    return rows
+
+
+def timed(label: str, fn, baseline: Optional[float] = None, repeat: int = 3):
+    """Melhor tempo de `repeat` execuções, com o GC desligado durante a medição"""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            result = fn()
+            elapsed = min(elapsed, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    speedup = f"  ({baseline / elapsed:.2f}x)" if baseline else ""
+    print(f"{label:<44} {elapsed * 1000:9.1f} ms{speedup}")
+    return result, elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = synthetic_rows(count)
+    print(f"{count} lançamentos sintéticos\n")
+
+    legacy, baseline = timed("from_dict legado", lambda: [legacy_from_dict(r) for r in rows])
+    timed("FinancialEntry.from_dict atual", lambda: [FinancialEntry.from_dict(r) for r in rows], baseline)
+    bulk, _ = timed("decode_financial_entries", lambda: decode_financial_entries(rows), baseline)
+    timed(
+        "decode_financial_entries (sem timestamps)",
+        lambda: decode_financial_entries(rows, timestamps=False),
+        baseline,
+    )
+
+    assert bulk == legacy, "decodificação em lote divergiu do from_dict legado"
+    print("\nResultado idêntico ao from_dict legado")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+Benchmark da grade de lançamentos (views/Database.py)
+
+Compara a montagem anterior (concatenação com += de todos os dias, estilos
+inline e hex_to_rgba redefinida por célula) com o entry_grid atual, tanto
+para o período inteiro quanto para a janela paginada que vai ao navegador.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_entry_grid.py [dias] [lançamentos_por_dia]
+"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bench_decoding import timed  # noqa: E402
+from domain.entities import FinancialEntry  # noqa: E402
+from presentation.components.entry_grid import (  # noqa: E402
+    DEFAULT_PAGE_DAYS,
+    build_cell_table,
+    group_entries_by_day,
+    paginate_days,
+    render_entry_grid_html,
+)
+from presentation.colors import hex_to_rgba  # noqa: E402
+
+COLORS = ["#9333EA", "#2563EB", "#DC2626", "#16A34A", "#F59E0B", "#0EA5E9"]
+
+
+def synthetic_entries(days: int, per_day: int):
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1)
+    entries = []
+    for d in range(days):
+        for i in range(per_day):
+            n = d * per_day + i
+            entries.append(
+                FinancialEntry(
+                    value=round(rng.uniform(5, 5000), 2),
+                    date=start + timedelta(days=d),
+                    modality_id=f"mod{n % 12}",
+                    modality_name=f"Modalidade {n % 12}",
+                    modality_color=COLORS[n % len(COLORS)],
+                    is_credit_plan=n % 7 == 0,
+                    credit_payment=n % 11 == 0,
+                    id=f"{n:024x}",
+                    created_at=start + timedelta(days=d, seconds=i * 60),
+                )
+            )
+    return entries
+
+
+def legacy_grid(entries, modality_color_map, modality_name_map) -> str:
+    """Cópia da montagem anterior em views/Database.py"""
+    entries_by_date = {}
+    for entry in sorted(entries, key=lambda x: x.created_at or x.date, reverse=False):
+        date_str = entry.date.strftime("%d/%m/%Y")
+        if date_str not in entries_by_date:
+            entries_by_date[date_str] = []
+        entries_by_date[date_str].append(entry)
+
+    max_entries = max(len(date_entries) for date_entries in entries_by_date.values())
+    dates_sorted = sorted(
+        entries_by_date.keys(), key=lambda d: datetime.strptime(d, "%d/%m/%Y"), reverse=True
+    )
+
+    html_content = "<style>/* ... */</style><div class='scroll-container'>"
+    html_content += "<table style='border-collapse: collapse;'>"
+    html_content += "<thead><tr>"
+    for date_str in dates_sorted:
+        daily_total = sum(e.value for e in entries_by_date[date_str])
+        header_label = (
+            f"{date_str} - Total: R$ {daily_total:,.2f}".replace(",", "X")
+            .replace(".", ",")
+            .replace("X", ".")
+        )
+        html_content += f"<th colspan='2' style='background-color: #f0f0f0; padding: 12px; text-align: center; border: 1px solid #ddd; font-weight: bold;'>{header_label}</th>"
+    html_content += "</tr></thead><tbody>"
+
+    for i in range(max_entries):
+        html_content += "<tr>"
+        for date_str in dates_sorted:
+            date_entries = entries_by_date[date_str]
+            if i < len(date_entries):
+                entry = date_entries[i]
+                value_formatted = (
+                    f"R$ {entry.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                )
+                modality_color = modality_color_map.get(entry.modality_id, entry.modality_color)
+                modality_name = modality_name_map.get(entry.modality_id, entry.modality_name)
+                html_content += f"<td style='padding: 10px; text-align: right; border: 1px solid #ddd; min-width: 180px; white-space: nowrap;'>{value_formatted}</td>"
+
+                def hex_to_rgba(hex_color, opacity=0.6):
+                    hex_color = hex_color.lstrip("#")
+                    r, g, b = tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+                    return f"rgba({r}, {g}, {b}, {opacity})"
+
+                if entry.credit_payment:
+                    bg_color = "rgba(34, 197, 94, 0.7)"
+                    display_text = f"Recebimento Crediário<br><span style='font-size: 11px; font-weight: normal;'>{modality_name}</span>"
+                elif entry.is_credit_plan:
+                    bg_color = hex_to_rgba(modality_color, 0.6)
+                    display_text = f"{modality_name}<br><span style='font-size: 11px; font-weight: normal;'>Pgto Crediário</span>"
+                else:
+                    bg_color = hex_to_rgba(modality_color, 0.6)
+                    display_text = modality_name
+
+                html_content += (
+                    f"<td style='padding: 10px; text-align: center; border: 1px solid #ddd; min-width: 180px; white-space: nowrap; "
+                    f"background-color: {bg_color}; color: #333; font-weight: bold;'>"
+                    f"{display_text}</td>"
+                )
+            else:
+                html_content += "<td style='padding: 10px; border: 1px solid #ddd; min-width: 180px;'></td>"
+                html_content += "<td style='padding: 10px; border: 1px solid #ddd; min-width: 180px;'></td>"
+        html_content += "</tr>"
+    html_content += "</tbody></table></div>"
+    return html_content
+
+
+def grid(entries, modality_rgba_map, modality_name_map, page_days=None) -> str:
+    entries_by_day, days = group_entries_by_day(entries)
+    if page_days:
+        days = paginate_days(days, 1, page_days)
+    cells = build_cell_table(
+        (entry for day in days for entry in entries_by_day[day]),
+        modality_rgba_map,
+        modality_name_map,
+    )
+    return render_entry_grid_html(entries_by_day, days, cells)
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 90
+    per_day = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    entries = synthetic_entries(days, per_day)
+    color_map = {f"mod{i}": COLORS[i % len(COLORS)] for i in range(12)}
+    name_map = {f"mod{i}": f"Modalidade {i} (Banco)" for i in range(12)}
+    # Como o ModalityCatalog.rgba, montado uma vez por versão do catálogo
+    rgba_map = {modality_id: hex_to_rgba(color) for modality_id, color in color_map.items()}
+    print(f"{days} dias x {per_day} lançamentos\n")
+
+    legacy, baseline = timed("legado (+=, período inteiro)", lambda: legacy_grid(entries, color_map, name_map))
+    full, _ = timed("entry_grid (período inteiro)", lambda: grid(entries, rgba_map, name_map), baseline)
+    page, _ = timed(
+        f"entry_grid (janela de {DEFAULT_PAGE_DAYS} dias)",
+        lambda: grid(entries, rgba_map, name_map, DEFAULT_PAGE_DAYS),
+        baseline,
+    )
+
+    print()
+    for label, payload in (("legado", legacy), ("período inteiro", full), ("janela", page)):
+        print(f"payload {label:<37} {len(payload.encode()) / 1024:9.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark de memória (tracemalloc): lançamentos em sessão
+
+Compara o FinancialEntry anterior (dataclass com __dict__ e strings de
+modalidade duplicadas por linha) com o atual (slots + strings internadas)
+e com o EntryFrame colunar.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_memory.py [quantidade]
+"""
+import gc
+import json
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bench_decoding import synthetic_rows  # noqa: E402
+from domain.entities import EntryFrame  # noqa: E402
+from domain.entities.decoding import decode_financial_entries  # noqa: E402
+
+
+@dataclass
+class LegacyFinancialEntry:
+    """Cópia do FinancialEntry anterior (sem slots)"""
+
+    value: float
+    date: datetime
+    modality_id: str
+    modality_name: str
+    modality_color: str = "#9333EA"
+    type: str = "received"
+    entry_type: str = "normal"
+    is_credit_plan: bool = False
+    credit_payment: bool = False
+    id: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+def _parse(value) -> Optional[datetime]:
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def legacy_decode(rows: list) -> list:
+    return [
+        LegacyFinancialEntry(
+            id=data.get("id"),
+            value=float(data["value"]),
+            date=_parse(data["date"]),
+            modality_id=data["modality_id"],
+            modality_name=data["modality_name"],
+            modality_color=data.get("modality_color", "#9333EA"),
+            type=data.get("type", "received"),
+            entry_type=data.get("entry_type", "normal"),
+            is_credit_plan=data.get("is_credit_plan", False),
+            credit_payment=data.get("credit_payment", False),
+            created_at=_parse(data.get("created_at")),
+            updated_at=_parse(data.get("updated_at")),
+        )
+        for data in rows
+    ]
+
+
+def measure(label: str, build, baseline: Optional[int] = None) -> int:
+    """Memória retida pelo resultado de build() (a resposta JSON é liberada em seguida)"""
+    # Cada execução decodifica a própria resposta, como acontece a cada requisição.
+    # Ela entra no tracemalloc para contar as strings que o resultado mantém vivas
+    gc.collect()
+    tracemalloc.start()
+    rows = json.loads(payload)
+    result = build(rows)
+    del rows
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    ratio = f"  ({retained / baseline:.0%} do legado)" if baseline else ""
+    print(f"{label:<40} {retained / 1024 / 1024:8.1f} MiB  {retained / len(result):6.0f} B/linha{ratio}")
+    del result
+    return retained
+
+
+def main():
+    global payload
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = json.dumps(synthetic_rows(count))
+    print(f"{count} lançamentos sintéticos\n")
+
+    baseline = measure("dataclass legado (__dict__)", legacy_decode)
+    measure("FinancialEntry (slots + intern)", decode_financial_entries, baseline)
+    measure(
+        "FinancialEntry sem timestamps",
+        lambda rows: decode_financial_entries(rows, timestamps=False),
+        baseline,
+    )
+    measure("EntryFrame (colunas, sem source)", _frame_without_source, baseline)
+
+
+def _frame_without_source(rows: list) -> EntryFrame:
+    frame = EntryFrame.from_records(rows)
+    # O frame mantém a resposta para materializar linhas sob demanda;
+    # aqui medimos só as colunas
+    frame._source = ()
+    return frame
+
+
+payload = ""
+
+
+if __name__ == "__main__":
+    main()
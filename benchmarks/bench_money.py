@@ -0,0 +1,78 @@
+"""
+Benchmark de domain.money: formatar e ler valores em reais
+
+Compara o padrão anterior das views (f-string + três replace) e o
+limpar_valor dos scripts de importação com format_brl, format_brl_array
+e parse_brl, e confere que os resultados são os mesmos.
+
+parse_brl valida o texto (limpar_valor devolve 0.0 para qualquer coisa
+inválida) e por isso não é mais rápido que ele; a leitura fica aqui para
+mostrar quanto custa essa validação.
+
+Uso (a partir da raiz do projeto):
+    python benchmarks/bench_money.py [quantidade]
+"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from bench_decoding import timed  # noqa: E402
+from domain.money import format_brl, format_brl_array, parse_brl  # noqa: E402
+
+
+def legacy_format(value: float) -> str:
+    """Padrão repetido nas views antes de domain.money"""
+    return f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+
+
+def legacy_parse(valor_str: str) -> float:
+    """Cópia do limpar_valor dos scripts de importação"""
+    if not valor_str or valor_str.strip() == "":
+        return 0.0
+    valor_str = valor_str.replace("R$", "").replace(" ", "").strip()
+    negativo = valor_str.startswith("-")
+    valor_str = valor_str.lstrip("-")
+    valor_str = valor_str.replace(".", "").replace(",", ".")
+    try:
+        valor = float(valor_str)
+        return -valor if negativo else valor
+    except ValueError:
+        return 0.0
+
+
+def synthetic_values(count: int) -> np.ndarray:
+    rng = np.random.default_rng(7)
+    # Maioria de valores de balcão, alguns grandes e alguns negativos (estornos)
+    values = np.round(rng.lognormal(mean=5, sigma=2, size=count), 2)
+    values[rng.random(count) < 0.05] *= -1
+    return values
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    values = synthetic_values(count)
+    as_list = values.tolist()
+    print(f"{count} valores\n")
+
+    print("formatação")
+    expected, baseline = timed("f-string + 3 replace (legado)", lambda: [legacy_format(v) for v in as_list])
+    scalar, _ = timed("format_brl (um por vez)", lambda: [format_brl(v) for v in as_list], baseline)
+    vector, _ = timed("format_brl_array (ndarray)", lambda: format_brl_array(values), baseline)
+    series = pd.Series(values)
+    timed("format_brl_array (Series)", lambda: format_brl_array(series), baseline)
+    assert scalar == expected and vector.tolist() == expected
+
+    print("\nleitura")
+    column = expected
+    parsed, baseline = timed("limpar_valor (legado)", lambda: [legacy_parse(text) for text in column])
+    scalar, _ = timed("parse_brl (um por vez)", lambda: [parse_brl(text) for text in column], baseline)
+    assert scalar == parsed
+
+
+if __name__ == "__main__":
+    main()
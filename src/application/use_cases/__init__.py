@@ -1,4 +1,5 @@
 from .payment_modality_use_cases import PaymentModalityUseCases
 from .financial_entry_use_cases import FinancialEntryUseCases
+from .modality_catalog import ModalityCatalog
 
-__all__ = ["PaymentModalityUseCases", "FinancialEntryUseCases"]
+__all__ = ["PaymentModalityUseCases", "FinancialEntryUseCases", "ModalityCatalog"]
@@ -1,41 +1,189 @@
-from typing import List, Optional
+import hashlib
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from domain.entities.account import Account
+from domain.entities.bulk_result import BulkResult
 from domain.repositories.account_repository import AccountRepository
 
 
 class AccountUseCases:
-    def __init__(self, repository: AccountRepository):
+    """
+    Casos de uso de contas (despesas, boletos, investimentos)
+
+    cache (get_or_load/get/set/invalidate, ex.: TenantCache) guarda, por
+    tenant, as listagens por período e um índice id -> Account alimentado
+    pelas listagens e escritas; get_account não precisa baixar todas as
+    contas e trocar entre Despesas, Boletos e Investimentos reaproveita
+    a mesma busca do período.
+    """
+
+    INDEX_KEY = "accounts_by_id"
+    LIST_KEY = "accounts"
+
+    def __init__(self, repository: AccountRepository, cache: Optional[Any] = None):
         self.repository = repository
+        self.cache = cache
+
+    def _index(self) -> Dict[str, Account]:
+        if self.cache is None:
+            return {}
+        return self.cache.get_or_load(self.INDEX_KEY, dict)
+
+    def _remember(self, accounts: List[Account]) -> None:
+        index = self._index()
+        for account in accounts:
+            if account.id is not None:
+                index[account.id] = account
+
+    def _invalidate_lists(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate(
+                lambda key: isinstance(key, tuple) and key[0] == self.LIST_KEY
+            )
+
+    def get_account(self, account_id: str, account_type: Optional[str] = None) -> Optional[Account]:
+        """Conta pelo id (do índice, ou uma única requisição), opcionalmente do tipo informado"""
+        index = self._index()
+        account = index.get(account_id)
+        if account is None:
+            account = self.repository.get_by_id(account_id)
+            if account is not None:
+                index[account_id] = account
+        if account is None or (account_type is not None and account.type != account_type):
+            return None
+        return account
 
     def create_account(
         self, value: float, date: datetime, description: str, account_type: str
     ) -> Account:
         """Create a new account entry"""
-        return self.repository.create(value, date, description, account_type)
+        account = self.repository.create(value, date, description, account_type)
+        self._remember([account])
+        self._invalidate_lists()
+        return account
 
     def create_recurring_account(
-        self, value: float, date: datetime, description: str, account_type: str, recurrence: int = 1
-    ) -> List[Account]:
-        """Create recurring account entries for the specified number of months"""
-        accounts = []
-        for i in range(recurrence):
-            entry_date = date + relativedelta(months=i)
-            account = self.repository.create(value, entry_date, description, account_type)
-            accounts.append(account)
-        return accounts
+        self,
+        value: float,
+        date: datetime,
+        description: str,
+        account_type: str,
+        recurrence: int = 1,
+        batch_key: Optional[str] = None,
+        created: Optional[Dict[str, Account]] = None,
+    ) -> BulkResult:
+        """
+        Create recurring account entries for the specified number of months
+
+        Todas as parcelas vão em um único create_many. Cada mês tem uma chave
+        de idempotência derivada de batch_key e dos dados da conta, e chamar
+        de novo com o mesmo batch_key (ex.: reenvio do formulário após falha
+        parcial) reenvia as mesmas chaves.
+
+        created (chave -> Account) é o registro do lote, mantido pelo
+        chamador enquanto o formulário estiver aberto (ex.: em
+        st.session_state): meses já registrados não são reenviados. Fora
+        dele (outro processo, registro perdido), evitar duplicatas depende do
+        backend deduplicar por idempotency_key / Idempotency-Key.
+        """
+        created = {} if created is None else created
+        batch_key = batch_key or uuid.uuid4().hex
+        drafts = [
+            Account(value, date + relativedelta(months=i), description, account_type)
+            for i in range(recurrence)
+        ]
+        keys = [self._idempotency_key(batch_key, account) for account in drafts]
+
+        result = BulkResult(total=len(drafts))
+        pending = []
+        for index, key in enumerate(keys):
+            if key in created:
+                result.succeeded[index] = created[key]
+            else:
+                pending.append(index)
+
+        if pending:
+            batch = self.repository.create_many(
+                [drafts[index] for index in pending], [keys[index] for index in pending]
+            )
+            for position, index in enumerate(pending):
+                if position in batch.succeeded:
+                    account = batch.succeeded[position]
+                    result.succeeded[index] = created[keys[index]] = account
+                else:
+                    result.errors[index] = batch.errors.get(position, "Conta não criada")
+
+            self._remember([result.succeeded[index] for index in pending if index in result.succeeded])
+            self._invalidate_lists()
+        return result
+
+    @staticmethod
+    def _idempotency_key(batch_key: str, account: Account) -> str:
+        digest = hashlib.sha1(
+            f"{account.type}|{account.date.isoformat()}|{account.value:.2f}|{account.description}".encode()
+        ).hexdigest()[:16]
+        return f"{batch_key}-{digest}"
 
     def list_accounts(
-        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_type: Optional[str] = None,
     ) -> List[Account]:
-        """List all accounts, optionally filtered by date range"""
-        return self.repository.list_all(start_date, end_date)
+        """
+        List accounts, optionally filtered by date range and type
+
+        Com filtro de tipo no backend, busca só o tipo pedido; sem ele, busca
+        o período inteiro uma vez e filtra localmente para cada tipo.
+        """
+        if self.cache is not None:
+            full = self.cache.get((self.LIST_KEY, start_date, end_date, None))
+            if full is not None:
+                return self._of_type(full, account_type)
+
+        typed = account_type is not None and self.repository.supports_type_filter
+        key = (self.LIST_KEY, start_date, end_date, account_type if typed else None)
+
+        def load() -> List[Account]:
+            accounts = self.repository.list_all(
+                start_date, end_date, account_type if typed else None
+            )
+            self._remember(accounts)
+            return accounts
+
+        accounts = self.cache.get_or_load(key, load) if self.cache is not None else load()
+        return self._of_type(accounts, account_type)
+
+    @staticmethod
+    def _of_type(accounts: List[Account], account_type: Optional[str]) -> List[Account]:
+        if account_type is None:
+            return list(accounts)
+        return [account for account in accounts if account.type == account_type]
 
     def update_account(self, account_id: str, paid: bool = None, value: float = None, date: datetime = None, description: str = None) -> Account:
         """Update an account (principalmente o status paid, mas também outros campos)"""
-        return self.repository.update(account_id, paid=paid, value=value, date=date, description=description)
+        account = self.repository.update(account_id, paid=paid, value=value, date=date, description=description)
+        self._remember([account])
+        self._invalidate_lists()
+        return account
+
+    def update_accounts(self, updates: List[Tuple[str, Dict[str, Any]]]) -> BulkResult:
+        """
+        Atualiza várias contas de uma vez: (account_id, campos) por linha
+
+        Os campos são os mesmos de update_account (paid, value, date,
+        description); falhas são reportadas por linha no BulkResult.
+        """
+        result = self.repository.update_many(updates)
+        self._remember(result.items)
+        self._invalidate_lists()
+        return result
 
     def delete_account(self, account_id: str) -> bool:
         """Delete an account by ID"""
-        return self.repository.delete(account_id)
+        result = self.repository.delete(account_id)
+        self._index().pop(account_id, None)
+        self._invalidate_lists()
+        return result
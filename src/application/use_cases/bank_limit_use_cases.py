@@ -3,6 +3,7 @@ Bank Limit Use Cases
 """
 from typing import List
 from domain.entities.bank_limit import BankLimit
+from domain.entities.bulk_result import BulkResult
 from domain.repositories.bank_limit_repository import BankLimitRepository
 
 
@@ -49,6 +50,10 @@ class BankLimitUseCases:
             rotativo_rate, cheque_rate, interest_rate
         )
 
+    def update_bank_limits(self, limits: List[BankLimit]) -> BulkResult:
+        """Update several bank limits at once; failures are reported per row"""
+        return self.repository.update_many(limits)
+
     def delete_bank_limit(self, limit_id: str) -> bool:
         """Delete a bank limit"""
         return self.repository.delete(limit_id)
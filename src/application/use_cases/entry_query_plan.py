@@ -0,0 +1,124 @@
+import threading
+from typing import List, Optional, Sequence, Tuple
+from datetime import date, datetime
+from domain.entities import EntryFrame
+from domain.repositories import FinancialEntryRepository
+
+
+Period = Tuple[Optional[datetime], Optional[datetime]]
+
+
+class EntryQueryPlan:
+    """
+    Plano de consultas de lançamentos para uma única renderização
+
+    Recebe de antemão todos os períodos que a página vai usar, junta os que
+    se sobrepõem (ou estão a até max_gap_days de distância) e busca cada
+    intervalo resultante uma única vez. Listas e totais dos períodos são
+    derivados em memória a partir desse resultado.
+
+    Períodos em totals só precisam da soma: quando o repositório agrega no
+    servidor eles não entram na busca de lançamentos e viram uma consulta
+    de agregação; caso contrário são buscados junto com os demais.
+    """
+
+    def __init__(
+        self,
+        repository: FinancialEntryRepository,
+        periods: Sequence[Period],
+        totals: Sequence[Period] = (),
+        max_gap_days: int = 31,
+    ):
+        self.repository = repository
+        self.max_gap_days = max_gap_days
+        self._periods = [self._as_days(start, end) for start, end in periods]
+        self._totals = [self._as_days(start, end) for start, end in totals]
+        self._ranges = self._merged_ranges()
+        self._fetched: Optional[List[Tuple[date, date, EntryFrame]]] = None
+        # Períodos do mesmo plano podem ser lidos em paralelo (FetchBatch)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _as_days(
+        start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> Tuple[date, date]:
+        # A API filtra por dia; None significa período aberto
+        return (
+            start_date.date() if start_date else date.min,
+            end_date.date() if end_date else date.max,
+        )
+
+    def _merged_ranges(self) -> List[Tuple[date, date]]:
+        periods = list(self._periods)
+        if not self.repository.supports_remote_aggregation:
+            periods += self._totals
+
+        merged: List[Tuple[date, date]] = []
+        for start, end in sorted(periods):
+            if merged:
+                last_start, last_end = merged[-1]
+                gap = (start - last_end).days if last_end < date.max else 0
+                if gap <= self.max_gap_days:
+                    merged[-1] = (last_start, max(last_end, end))
+                    continue
+            merged.append((start, end))
+        return merged
+
+    def _fetch(self, start: date, end: date) -> EntryFrame:
+        start_date = (
+            datetime.combine(start, datetime.min.time()) if start > date.min else None
+        )
+        end_date = datetime.combine(end, datetime.max.time()) if end < date.max else None
+        return self.repository.get_all(start_date, end_date)
+
+    def _execute(self) -> List[Tuple[date, date, EntryFrame]]:
+        with self._lock:
+            if self._fetched is None:
+                self._fetched = [
+                    (start, end, self._fetch(start, end))
+                    for start, end in self._ranges
+                ]
+            return self._fetched
+
+    def _planned(self, start: date, end: date) -> bool:
+        """True se o período cabe em um dos intervalos buscados (sem buscar nada)"""
+        return any(
+            range_start <= start and end <= range_end
+            for range_start, range_end in self._ranges
+        )
+
+    def _covered(self, start: date, end: date) -> Optional[EntryFrame]:
+        if not self._planned(start, end):
+            return None
+        for fetched_start, fetched_end, entries in self._execute():
+            if fetched_start <= start and end <= fetched_end:
+                return entries.between(
+                    start if start > date.min else None,
+                    end if end < date.max else None,
+                )
+        return None
+
+    def list_entries(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> EntryFrame:
+        entries = self._covered(*self._as_days(start_date, end_date))
+        if entries is not None:
+            return entries
+
+        # Período não declarado no plano: busca direta
+        return self.repository.get_all(start_date, end_date)
+
+    def get_total_by_period(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> float:
+        entries = self._covered(*self._as_days(start_date, end_date))
+        if entries is not None:
+            return entries.total()
+
+        # Período só de total (ou fora do plano): agrega sem esperar a busca
+        # dos intervalos de listagem
+        return sum(group["total"] for group in self.repository.aggregate(start_date, end_date))
@@ -1,7 +1,8 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence, Tuple
 from datetime import datetime
-from domain.entities import FinancialEntry
+from domain.entities import FinancialEntry, EntryFrame
 from domain.repositories import FinancialEntryRepository
+from application.use_cases.entry_query_plan import EntryQueryPlan
 
 
 class FinancialEntryUseCases:
@@ -41,9 +42,23 @@ class FinancialEntryUseCases:
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List[FinancialEntry]:
+    ) -> EntryFrame:
         return self.repository.get_all(start_date, end_date)
 
+    def plan_queries(
+        self,
+        periods: Sequence[Tuple[Optional[datetime], Optional[datetime]]],
+        totals: Sequence[Tuple[Optional[datetime], Optional[datetime]]] = (),
+    ) -> EntryQueryPlan:
+        """
+        Cria um plano que busca os períodos informados com o mínimo de requisições
+
+        Use quando a mesma renderização precisa de vários períodos
+        (ex.: período filtrado + acumulado anual). Períodos dos quais só se
+        usa a soma vão em totals.
+        """
+        return EntryQueryPlan(self.repository, periods, totals)
+
     def update_entry(
         self,
         entry_id: str,
@@ -68,8 +83,30 @@ class FinancialEntryUseCases:
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
     ) -> float:
-        entries = self.list_entries(start_date, end_date)
-        return sum(entry.value for entry in entries)
+        return sum(group["total"] for group in self.aggregate(start_date, end_date))
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Soma e contagem por modality, day, month, is_credit_plan, credit_payment
+        e/ou entry_type, sem baixar os lançamentos quando o backend agrega
+        """
+        return self.repository.aggregate(start_date, end_date, group_by)
+
+    def get_totals_by_modality(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """{modality_id: {"total": float, "count": int}}"""
+        return {
+            group["modality"]: {"total": group["total"], "count": group["count"]}
+            for group in self.aggregate(start_date, end_date, ("modality",))
+        }
 
     def get_entries_grouped_by_modality(
         self,
@@ -1,12 +1,35 @@
+import calendar
 from typing import List, Optional, Dict, Any
 from datetime import datetime
+from domain.entities.credit_month import CreditMonth, MonthKey, month_range
 from domain.entities.installment import Installment
 from domain.repositories.installment_repository import InstallmentRepository
 
 
 class InstallmentUseCases:
-    def __init__(self, repository: InstallmentRepository):
+    """
+    Casos de uso de parcelas do crediário
+
+    cache (get/set/invalidate, ex.: TenantCache) guarda, por tenant, o
+    resumo diário em blocos por mês (CreditMonth). Meses passados mudam
+    pouco e ficam past_month_ttl segundos: pay/unpay desta sessão os
+    invalidam na hora, e o TTL limita quanto tempo escritas de outras
+    sessões ficam invisíveis. O mês atual é sempre buscado de novo e os
+    futuros seguem o TTL do cache (novas vendas parceladas criam parcelas
+    neles).
+    """
+
+    MONTH_KEY = "credit_month"
+
+    def __init__(
+        self,
+        repository: InstallmentRepository,
+        cache: Optional[Any] = None,
+        past_month_ttl: float = 600.0,
+    ):
         self.repository = repository
+        self.cache = cache
+        self.past_month_ttl = past_month_ttl
 
     def list_installments(self, financial_entry_id: str) -> List[Installment]:
         """List all installments for a financial entry"""
@@ -20,11 +43,22 @@ class InstallmentUseCases:
         self, installment_id: str, payment_date: Optional[datetime] = None
     ) -> Installment:
         """Mark an installment as paid"""
-        return self.repository.pay_installment(installment_id, payment_date)
+        installment = self.repository.pay_installment(installment_id, payment_date)
+        self._invalidate_months()
+        return installment
 
     def unpay_installment(self, installment_id: str) -> Installment:
         """Mark an installment as unpaid"""
-        return self.repository.unpay_installment(installment_id)
+        installment = self.repository.unpay_installment(installment_id)
+        self._invalidate_months()
+        return installment
+
+    def _invalidate_months(self) -> None:
+        # Pagar uma parcela atrasada altera um mês passado
+        if self.cache is not None:
+            self.cache.invalidate(
+                lambda key: isinstance(key, tuple) and key[0] == self.MONTH_KEY
+            )
 
     def get_daily_summary(
         self,
@@ -42,3 +76,56 @@ class InstallmentUseCases:
             - difference: Diferença (recebido - a receber)
         """
         return self.repository.get_daily_summary(start_date, end_date)
+
+    def get_monthly_summary(
+        self, start_date: datetime, end_date: datetime, today: Optional[datetime] = None
+    ) -> List[CreditMonth]:
+        """
+        Resumo diário do crediário em blocos por mês, de start_date a end_date
+
+        Só os meses ausentes do cache (e o mês atual) são buscados, com uma
+        chamada a get_daily_summary por sequência contínua de meses. Os dias
+        fora do período ficam zerados nos blocos do primeiro e do último mês.
+        """
+        months = month_range(start_date, end_date)
+        now = today or datetime.now()
+        current = (now.year, now.month)
+
+        blocks: Dict[MonthKey, CreditMonth] = {}
+        if self.cache is not None:
+            for key in months:
+                if key != current:
+                    block = self.cache.get((self.MONTH_KEY, key))
+                    if block is not None:
+                        blocks[key] = block
+
+        missing = [key for key in months if key not in blocks]
+        for run in self._runs(missing):
+            first, last = run[0], run[-1]
+            days = self.repository.get_daily_summary(
+                datetime(first[0], first[1], 1),
+                datetime(last[0], last[1], calendar.monthrange(*last)[1]),
+            )
+            fetched = CreditMonth.from_daily_summary(days or [], run)
+            blocks.update(fetched)
+            if self.cache is not None:
+                for key, block in fetched.items():
+                    if key < current:
+                        self.cache.set((self.MONTH_KEY, key), block, ttl=self.past_month_ttl)
+                    elif key > current:
+                        self.cache.set((self.MONTH_KEY, key), block)
+
+        return [blocks[key].clipped(start_date.date(), end_date.date()) for key in months]
+
+    @staticmethod
+    def _runs(months: List[MonthKey]) -> List[List[MonthKey]]:
+        """Agrupa meses (ordenados) em sequências contínuas"""
+        runs: List[List[MonthKey]] = []
+        for key in months:
+            if runs:
+                year, month = runs[-1][-1]
+                if key == ((year + 1, 1) if month == 12 else (year, month + 1)):
+                    runs[-1].append(key)
+                    continue
+            runs.append([key])
+        return runs
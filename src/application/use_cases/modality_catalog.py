@@ -0,0 +1,65 @@
+import itertools
+from types import MappingProxyType
+from typing import Callable, FrozenSet, List, Mapping, Optional, Sequence
+from domain.entities import PaymentModality
+
+
+_versions = itertools.count(1)
+
+
+class ModalityCatalog:
+    """
+    Tabelas de consulta das modalidades, montadas uma vez por versão
+
+    Compartilhado entre reruns (e sessões com o mesmo token): as tabelas
+    são somente leitura. version muda a cada nova montagem e pode ser usada
+    como chave de cache de estruturas derivadas nas views.
+
+    to_rgba (ex.: presentation.colors.hex_to_rgba) monta a tabela rgba
+    das cores de fundo; sem ele, rgba fica vazia.
+    """
+
+    def __init__(
+        self,
+        modalities: Sequence[PaymentModality],
+        version: Optional[int] = None,
+        to_rgba: Optional[Callable[[str], str]] = None,
+    ):
+        self.version = version if version is not None else next(_versions)
+        self.modalities: List[PaymentModality] = list(modalities)
+        self.active: List[PaymentModality] = [m for m in self.modalities if m.is_active]
+
+        self.by_id: Mapping[str, PaymentModality] = MappingProxyType(
+            {m.id: m for m in self.modalities}
+        )
+        self.names: Mapping[str, str] = MappingProxyType(
+            {m.id: m.display_name for m in self.modalities}
+        )
+        self.colors: Mapping[str, str] = MappingProxyType(
+            {m.id: m.color for m in self.modalities}
+        )
+        self.banks: Mapping[str, str] = MappingProxyType(
+            {m.id: m.bank_name for m in self.modalities}
+        )
+        self.rgba: Mapping[str, str] = MappingProxyType(
+            {m.id: to_rgba(m.color) for m in self.modalities} if to_rgba else {}
+        )
+        # Nome com banco -> cor (ex.: color_discrete_map dos gráficos)
+        self.colors_by_name: Mapping[str, str] = MappingProxyType(
+            {m.display_name: m.color for m in self.modalities}
+        )
+        self.credit_plan_ids: FrozenSet[str] = frozenset(
+            m.id for m in self.modalities if m.is_credit_plan
+        )
+        self.credit_payment_ids: FrozenSet[str] = frozenset(
+            m.id for m in self.modalities if m.allows_credit_payment
+        )
+
+    def name(self, modality_id: str, default: Optional[str] = None) -> Optional[str]:
+        return self.names.get(modality_id, default)
+
+    def color(self, modality_id: str, default: Optional[str] = None) -> Optional[str]:
+        return self.colors.get(modality_id, default)
+
+    def __len__(self) -> int:
+        return len(self.modalities)
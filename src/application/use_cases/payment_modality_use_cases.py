@@ -1,11 +1,43 @@
-from typing import List
+from typing import Any, Callable, List, Optional
 from domain.entities import PaymentModality
 from domain.repositories import PaymentModalityRepository
+from application.use_cases.modality_catalog import ModalityCatalog
 
 
 class PaymentModalityUseCases:
-    def __init__(self, repository: PaymentModalityRepository):
+    """
+    Casos de uso de modalidades
+
+    Leituras vêm do ModalityCatalog em cache (por tenant); create, update,
+    toggle e delete descartam o catálogo para que a próxima leitura monte
+    uma nova versão. catalogs é qualquer cache com get_or_load/pop (ex.:
+    TenantCache); sem ele o catálogo é montado a cada chamada.
+    """
+
+    CATALOG_KEY = "modality_catalog"
+
+    def __init__(
+        self,
+        repository: PaymentModalityRepository,
+        catalogs: Optional[Any] = None,
+        to_rgba: Optional[Callable[[str], str]] = None,
+    ):
         self.repository = repository
+        self.catalogs = catalogs
+        self.to_rgba = to_rgba
+
+    def catalog(self) -> ModalityCatalog:
+        """Catálogo atual de modalidades (todas, inclusive inativas)"""
+        load = lambda: ModalityCatalog(
+            self.repository.get_all(only_active=False), to_rgba=self.to_rgba
+        )
+        if self.catalogs is None:
+            return load()
+        return self.catalogs.get_or_load(self.CATALOG_KEY, load)
+
+    def invalidate_catalog(self) -> None:
+        if self.catalogs is not None:
+            self.catalogs.pop(self.CATALOG_KEY)
 
     def create_modality(
         self,
@@ -30,13 +62,15 @@ class PaymentModalityUseCases:
             allows_anticipation=allows_anticipation,
             allows_credit_payment=allows_credit_payment,
         )
-        return self.repository.create(modality)
+        result = self.repository.create(modality)
+        self.invalidate_catalog()
+        return result
 
     def list_modalities(self) -> List[PaymentModality]:
-        return self.repository.get_all(only_active=False)
+        return list(self.catalog().modalities)
 
     def list_active_modalities(self) -> List[PaymentModality]:
-        return self.repository.get_all(only_active=True)
+        return list(self.catalog().active)
 
     def update_modality(
         self,
@@ -63,10 +97,16 @@ class PaymentModalityUseCases:
             allows_anticipation=allows_anticipation,
             allows_credit_payment=allows_credit_payment,
         )
-        return self.repository.update(modality_id, modality)
+        result = self.repository.update(modality_id, modality)
+        self.invalidate_catalog()
+        return result
 
     def delete_modality(self, modality_id: str) -> bool:
-        return self.repository.delete(modality_id)
+        result = self.repository.delete(modality_id)
+        self.invalidate_catalog()
+        return result
 
     def toggle_modality(self, modality_id: str) -> PaymentModality:
-        return self.repository.toggle(modality_id)
+        result = self.repository.toggle(modality_id)
+        self.invalidate_catalog()
+        return result
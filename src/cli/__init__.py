@@ -0,0 +1,5 @@
+"""
+dashboard-cli: importação e exclusão em lote sobre a camada de repositórios
+
+Uso (a partir de src/): python -m cli --help
+"""
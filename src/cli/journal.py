@@ -0,0 +1,92 @@
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class ImportJournal:
+    """
+    Diário das linhas já gravadas no backend, um lote confirmado por linha
+
+    Arquivo JSON Lines só de acréscimo: cada lote confirmado vira uma linha
+    {"batch", "committed_at", "rows": {chave: id}} gravada com fsync, então
+    o custo por lote não cresce com o tamanho da importação. Uma interrupção
+    no meio da gravação deixa no máximo a última linha incompleta, que é
+    ignorada na leitura (o lote é reenviado com a mesma chave de idempotência).
+
+    As chaves são de conteúdo, não de posição no arquivo: o mesmo diário
+    pode ser usado para vários CSVs com trechos repetidos.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str, kind: str):
+        self.path = path
+        self.kind = kind
+        # chave da linha -> id criado no backend (None se a API não devolveu)
+        self.done: Dict[str, Optional[str]] = {}
+        self.batches = 0
+        self._lock = threading.Lock()
+
+        if os.path.exists(path):
+            self._load()
+        else:
+            self._append({"journal": self.VERSION, "kind": kind})
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            content = f.read()
+        lines = content.splitlines()
+        for number, line in enumerate(lines, start=1):
+            try:
+                data = json.loads(line)
+            except ValueError:
+                if number == len(lines):
+                    # Última gravação interrompida: descarta antes de acrescentar
+                    self._rewrite(lines[:-1])
+                    break
+                raise ValueError(f"Diário {self.path} corrompido na linha {number}") from None
+            if "journal" in data:
+                if data.get("kind") != self.kind:
+                    raise ValueError(f"Diário {self.path} é de outra importação ({data.get('kind')})")
+                continue
+            self.done.update(data.get("rows") or {})
+            self.batches = max(self.batches, int(data.get("batch", 0)))
+        else:
+            if content and not content.endswith("\n"):
+                self._rewrite(lines)
+
+    def _rewrite(self, lines: List[str]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("".join(f"{line}\n" for line in lines))
+        os.replace(tmp_path, self.path)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.done
+
+    def __len__(self) -> int:
+        return len(self.done)
+
+    def commit(self, rows: Iterable[Tuple[str, Optional[str]]]) -> None:
+        """Registra um lote confirmado pelo backend"""
+        rows = dict(rows)
+        if not rows:
+            return
+        with self._lock:
+            self.batches += 1
+            self._append(
+                {
+                    "batch": self.batches,
+                    "committed_at": datetime.now().isoformat(timespec="seconds"),
+                    "rows": rows,
+                }
+            )
+            self.done.update(rows)
+
+    def _append(self, data: dict) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
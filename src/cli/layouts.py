@@ -0,0 +1,138 @@
+import csv
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from cli.normalize import month_number, normalize_name, parse_date
+
+
+# (número da linha no arquivo, campos em texto) - ainda não normalizados
+Record = Tuple[int, Dict[str, str]]
+
+LAYOUTS = ("table", "daily", "monthly")
+
+# Nomes aceitos no cabeçalho da planilha "table" para cada campo
+COLUMNS = {
+    "date": ("date", "data"),
+    "value": ("value", "valor"),
+    "modality": ("modality", "modalidade", "modality_id"),
+    "credit_payment": ("credit_payment", "is_credit_payment", "recebimento_crediario"),
+    "description": ("description", "descricao", "descrição"),
+    "type": ("type", "tipo"),
+    "paid": ("paid", "pago", "status"),
+}
+
+# Colunas por mês no layout "monthly" e o campo de cada uma
+MONTHLY_GROUPS = {
+    2: ("day", "value"),
+    4: ("day", "description", "value", "paid"),
+}
+
+
+def _rows(path: str) -> Iterator[Tuple[int, List[str]]]:
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        for line, values in enumerate(csv.reader(f), start=1):
+            yield line, values
+
+
+def _cell(values: Sequence[str], index: int) -> str:
+    return values[index].strip() if index < len(values) else ""
+
+
+def _columns(header: List[str], required: Sequence[str]) -> Dict[str, int]:
+    normalized = [normalize_name(name).replace(" ", "_") for name in header]
+    positions: Dict[str, int] = {}
+    for field, aliases in COLUMNS.items():
+        for alias in aliases:
+            alias = normalize_name(alias).replace(" ", "_")
+            if alias in normalized:
+                positions[field] = normalized.index(alias)
+                break
+    missing = [field for field in required if field not in positions]
+    if missing:
+        raise ValueError(f"Colunas obrigatórias ausentes no CSV: {', '.join(missing)}")
+    return positions
+
+
+def read_table(path: str, required: Sequence[str] = ()) -> Iterator[Record]:
+    """Uma linha por registro, com cabeçalho (date, value, modality...)"""
+    rows = _rows(path)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError(f"CSV vazio: {path}")
+    columns = _columns(header[1], required)
+    for line, values in rows:
+        if any(value.strip() for value in values):
+            yield line, {field: _cell(values, index) for field, index in columns.items()}
+
+
+def _is_date(text: str) -> bool:
+    try:
+        parse_date(text)
+        return True
+    except ValueError:
+        return False
+
+
+def read_daily(path: str) -> Iterator[Record]:
+    """
+    Grade diária das planilhas de vendas: linha de cabeçalho com as datas
+    (data, "Modalidade", data, "Modalidade"...) e, abaixo, pares valor /
+    modalidade por dia. Linhas antes do cabeçalho (ex.: total) são ignoradas.
+    """
+    dates: Optional[List[Tuple[int, str]]] = None
+    for line, values in _rows(path):
+        if dates is None:
+            found = [(index, value.strip()) for index, value in enumerate(values) if _is_date(value)]
+            if found:
+                dates = found
+            continue
+        for index, date in dates:
+            value, modality = _cell(values, index), _cell(values, index + 1)
+            if value or modality:
+                yield line, {"date": date, "value": value, "modality": modality}
+    if dates is None:
+        raise ValueError(f"Nenhuma linha de datas (DD/MM/AAAA) encontrada em {path}")
+
+
+def read_monthly(path: str, year: int) -> Iterator[Record]:
+    """
+    Planilhas por mês (boletos, contas): linha com os nomes dos meses e,
+    abaixo, grupos de colunas por mês - dia, valor (2 colunas) ou dia,
+    descrição, valor, status (4 colunas). Linhas sem dia (totais) são ignoradas.
+    """
+    months: Optional[List[Tuple[int, int, Tuple[str, ...]]]] = None
+    for line, values in _rows(path):
+        if months is None:
+            found = [(index, month_number(value)) for index, value in enumerate(values) if month_number(value)]
+            if not found:
+                continue
+            starts = [index for index, _ in found]
+            widths = [b - a for a, b in zip(starts, starts[1:])]
+            width = widths[0] if widths else len(values) - starts[0]
+            if width not in MONTHLY_GROUPS or any(w != width for w in widths):
+                raise ValueError(f"Layout mensal não reconhecido na linha {line} de {path}")
+            months = [(index, month, MONTHLY_GROUPS[width]) for index, month in found]
+            continue
+
+        for start, month, fields in months:
+            cells = {field: _cell(values, start + offset) for offset, field in enumerate(fields)}
+            day = cells.pop("day")
+            if not day.isdigit() or not cells["value"]:
+                continue
+            cells["date"] = f"{int(day):02d}/{month:02d}/{year}"
+            yield line, cells
+    if months is None:
+        raise ValueError(f"Nenhuma linha com nomes de meses encontrada em {path}")
+
+
+def read_records(
+    path: str, layout: str, required: Sequence[str] = (), year: Optional[int] = None
+) -> Iterator[Record]:
+    """Registros do CSV conforme o layout, lidos sob demanda (streaming)"""
+    if layout == "table":
+        return read_table(path, required)
+    if layout == "daily":
+        return read_daily(path)
+    if layout == "monthly":
+        if year is None:
+            raise ValueError("O layout monthly exige --year")
+        return read_monthly(path, year)
+    raise ValueError(f"Layout desconhecido: {layout}")
@@ -0,0 +1,310 @@
+import argparse
+import getpass
+import os
+import sys
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from config.environment import BASE_URL, HTTP_POOL_SIZE
+from domain.entities.auth import LoginCredentials
+from domain.money import format_brl
+from infrastructure.api import FinancialEntryAPIRepository, PaymentModalityAPIRepository
+from infrastructure.api.account_api_repository import AccountAPIRepository
+from infrastructure.api.auth_api_repository import AuthAPIRepository
+from infrastructure.api.bulk import BULK_MAX_WORKERS
+from infrastructure.concurrency import map_bounded
+from infrastructure.http import HTTPClient, APIError
+from cli.journal import ImportJournal
+from cli.layouts import LAYOUTS, read_records
+from cli.normalize import modality_lookup, parse_date
+from cli.pipeline import (
+    ImportRow,
+    ImportStats,
+    batched,
+    dedupe,
+    normalize_accounts,
+    normalize_entries,
+    upload,
+)
+from cli.progress import Progress
+
+
+# Variável de ambiente com o token (alternativa a --token)
+TOKEN_VARIABLE = "DASHBOARD_TOKEN"
+
+DEFAULT_WORKERS = 4
+DEFAULT_BATCH_SIZE = 100
+
+# Linhas mostradas nas prévias e listas de erro
+PREVIEW_ROWS = 10
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="dashboard-cli",
+        description="Importação e exclusão em lote de lançamentos e contas",
+    )
+    parser.add_argument("--base-url", help=f"URL da API (padrão: {BASE_URL} do .env)")
+    parser.add_argument("--token", help=f"Token de acesso (padrão: ${TOKEN_VARIABLE})")
+    parser.add_argument("--email", help="Login por e-mail/senha quando não há token")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Lotes/requisições simultâneos (padrão: {DEFAULT_WORKERS})",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    importer = subparsers.add_parser(
+        "import",
+        help="Importa um CSV de lançamentos ou contas",
+        description=(
+            "Layout table: cabeçalho com date, value, modality[, credit_payment] "
+            "(lançamentos) ou date, value[, description, type, paid] (contas). "
+            "daily: grade de vendas com pares valor/modalidade por data. "
+            "monthly: colunas por mês (dia, valor ou dia, descrição, valor, status). "
+            "Linhas já gravadas (diário) são puladas ao reexecutar."
+        ),
+    )
+    importer.add_argument("csv", help="Arquivo CSV")
+    importer.add_argument("--kind", choices=("entries", "accounts"), default="entries")
+    importer.add_argument("--layout", choices=LAYOUTS, default="table")
+    importer.add_argument("--year", type=int, help="Ano das planilhas monthly")
+    importer.add_argument(
+        "--type",
+        dest="account_type",
+        choices=("boleto", "payment", "investment"),
+        default="payment",
+        help="Tipo das contas sem a coluna type (padrão: payment)",
+    )
+    importer.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Linhas por requisição de lote (padrão: {DEFAULT_BATCH_SIZE})",
+    )
+    importer.add_argument(
+        "--journal",
+        help="Diário de lotes confirmados (padrão: <csv>.journal.jsonl); pode ser compartilhado entre CSVs",
+    )
+    importer.add_argument("--dry-run", action="store_true", help="Só valida e mostra a prévia")
+
+    deleter = subparsers.add_parser(
+        "delete",
+        help="Exclui os lançamentos ou contas de um período",
+        description="Reexecutar retoma a exclusão: a listagem do período já não traz os excluídos.",
+    )
+    deleter.add_argument(
+        "--period",
+        nargs=2,
+        metavar=("INICIO", "FIM"),
+        required=True,
+        help="Datas inicial e final (DD/MM/AAAA ou AAAA-MM-DD), inclusive",
+    )
+    deleter.add_argument("--kind", choices=("entries", "accounts"), default="entries")
+    deleter.add_argument(
+        "--type",
+        dest="account_type",
+        choices=("boleto", "payment", "investment"),
+        help="Só contas deste tipo",
+    )
+    deleter.add_argument("--dry-run", action="store_true", help="Só mostra o que seria excluído")
+    deleter.add_argument("--yes", action="store_true", help="Não pede confirmação")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.workers < 1:
+        print("--workers deve ser pelo menos 1", file=sys.stderr)
+        return 2
+
+    # Antes do primeiro Environment(): o tamanho do pool é lido uma única
+    # vez. O pool comporta todos os workers, inclusive quando o backend não
+    # tem endpoint de lote e cada lote vira POSTs individuais. --base-url
+    # dispensa o .env; se ele existir, sobrescreve os.environ, por isso a
+    # URL também vai direto para o HTTPClient.
+    if args.base_url:
+        os.environ[BASE_URL] = args.base_url
+    os.environ.setdefault(HTTP_POOL_SIZE, str(args.workers * BULK_MAX_WORKERS))
+
+    try:
+        client = _connect(args)
+        if args.command == "import":
+            return cmd_import(args, client)
+        return cmd_delete(args, client)
+    except KeyboardInterrupt:
+        print("\nInterrompido; reexecute o mesmo comando para continuar.", file=sys.stderr)
+        return 130
+    except Exception as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+
+
+def _connect(args: argparse.Namespace) -> HTTPClient:
+    client = HTTPClient(base_url=args.base_url)
+    token = args.token or os.getenv(TOKEN_VARIABLE)
+    if not token:
+        if not args.email:
+            raise ValueError(f"Informe --token, ${TOKEN_VARIABLE} ou --email")
+        password = getpass.getpass(f"Senha de {args.email}: ")
+        token = AuthAPIRepository(client).login(LoginCredentials(args.email, password)).token
+    client.set_auth_token(token)
+    return client
+
+
+def _print_errors(title: str, errors: List[Tuple[Any, str]]) -> None:
+    if not errors:
+        return
+    print(f"\n{title} ({len(errors)}):")
+    for where, message in errors[:PREVIEW_ROWS]:
+        print(f"  {where}: {message}")
+    if len(errors) > PREVIEW_ROWS:
+        print(f"  ... e mais {len(errors) - PREVIEW_ROWS}")
+
+
+def _print_pool(client: HTTPClient) -> None:
+    stats = client.pool_stats()
+    print(
+        f"Conexões: {stats['connections_opened']} abertas, "
+        f"{stats['connections_reused']} reaproveitadas em {stats['requests']} requisições"
+    )
+
+
+def cmd_import(args: argparse.Namespace, client: HTTPClient) -> int:
+    """
+    Pipeline em streaming: CSV -> normalização -> dedupe pelo diário ->
+    lotes (create_many) com até --workers simultâneos; cada lote confirmado
+    é acrescentado ao diário.
+    """
+    if args.batch_size < 1:
+        raise ValueError("--batch-size deve ser pelo menos 1")
+
+    if args.kind == "entries":
+        repository = FinancialEntryAPIRepository(client)
+        records = read_records(args.csv, args.layout, ("date", "value", "modality"), args.year)
+        modalities = modality_lookup(PaymentModalityAPIRepository(client).get_all())
+        rows = normalize_entries(records, modalities)
+    else:
+        repository = AccountAPIRepository(client)
+        records = read_records(args.csv, args.layout, ("date", "value"), args.year)
+        rows = normalize_accounts(records, args.account_type)
+
+    journal = ImportJournal(args.journal or f"{args.csv}.journal.jsonl", args.kind)
+    stats = ImportStats()
+    pending = dedupe(rows, journal, stats)
+
+    if args.dry_run:
+        preview = []
+        count, total = 0, 0.0
+        for row in pending:
+            count += 1
+            total += row.item.value
+            if len(preview) < PREVIEW_ROWS:
+                preview.append(row)
+        _print_summary(stats, journal)
+        print(f"\nDRY RUN: {count} linhas seriam importadas, total {format_brl(total)}")
+        for row in preview:
+            item = row.item
+            label = getattr(item, "modality_name", None) or getattr(item, "description", "")
+            print(f"  linha {row.line}: {item.date:%d/%m/%Y} {format_brl(item.value)} {label}")
+        return 0
+
+    progress = Progress("import")
+
+    def send(batch: List[ImportRow]) -> Any:
+        try:
+            result = repository.create_many([row.item for row in batch], [row.key for row in batch])
+        except Exception:
+            progress.advance(failed=len(batch))
+            raise
+        journal.commit(
+            (batch[index].key, getattr(item, "id", None)) for index, item in result.succeeded.items()
+        )
+        progress.advance(len(result.succeeded), len(result.errors))
+        return result
+
+    failed: List[Tuple[str, str]] = []
+    for batch, result, error in upload(batched(pending, args.batch_size), send, args.workers):
+        if error is not None:
+            failed.extend((f"linha {row.line}", str(error)) for row in batch)
+        else:
+            failed.extend((f"linha {batch[i].line}", message) for i, message in sorted(result.errors.items()))
+    if progress.done or progress.failed:
+        progress.finish()
+    else:
+        print("Nada a importar.")
+
+    _print_summary(stats, journal)
+    _print_errors("Linhas com erro (serão reenviadas ao reexecutar)", failed)
+    _print_pool(client)
+    return 1 if failed or stats.invalid else 0
+
+
+def _print_summary(stats: ImportStats, journal: ImportJournal) -> None:
+    print(
+        f"{stats.valid} linhas válidas, {len(stats.invalid)} inválidas, "
+        f"{len(stats.ignored)} ignoradas"
+    )
+    if stats.already_done:
+        print(f"{stats.already_done} já importadas (diário {journal.path})")
+    _print_errors("Linhas inválidas", [(f"linha {r.line}", r.reason) for r in stats.invalid])
+    _print_errors("Linhas ignoradas", [(f"linha {r.line}", r.reason) for r in stats.ignored])
+
+
+def _parse_period(values: Sequence[str]) -> Tuple[datetime, datetime]:
+    start, end = (parse_date(value) for value in values)
+    if end < start:
+        raise ValueError("A data final é anterior à inicial")
+    return start, end
+
+
+def cmd_delete(args: argparse.Namespace, client: HTTPClient) -> int:
+    """Lista o período pelo repositório e exclui com até --workers requisições simultâneas"""
+    start, end = _parse_period(args.period)
+    if args.kind == "entries":
+        repository = FinancialEntryAPIRepository(client)
+        items = list(repository.get_all(start, end))
+        describe: Callable[[Any], str] = lambda e: e.modality_name
+    else:
+        repository = AccountAPIRepository(client)
+        items = repository.list_all(start, end, account_type=args.account_type)
+        describe = lambda a: f"{a.description} ({a.type})"
+
+    print(
+        f"{len(items)} registros entre {start:%d/%m/%Y} e {end:%d/%m/%Y}, "
+        f"total {format_brl(sum(item.value for item in items))}"
+    )
+    for item in items[:PREVIEW_ROWS]:
+        print(f"  {item.date:%d/%m/%Y} {format_brl(item.value)} {describe(item)}")
+    if len(items) > PREVIEW_ROWS:
+        print(f"  ... e mais {len(items) - PREVIEW_ROWS}")
+
+    if not items or args.dry_run:
+        return 0
+    if not args.yes:
+        answer = input(f"Excluir {len(items)} registros? Digite 'sim' para confirmar: ")
+        if answer.strip().casefold() != "sim":
+            print("Operação cancelada.")
+            return 1
+
+    progress = Progress("delete", len(items))
+
+    def delete(item) -> str:
+        try:
+            if not repository.delete(item.id):
+                raise APIError("Exclusão não confirmada pela API")
+        except Exception:
+            progress.advance(failed=1)
+            raise
+        progress.advance(1)
+        return item.id
+
+    result = map_bounded(delete, items, args.workers, "cli-delete")
+    progress.finish()
+
+    _print_errors(
+        "Falhas (reexecute para tentar de novo)",
+        [(items[index].id, message) for index, message in sorted(result.errors.items())],
+    )
+    _print_pool(client)
+    return 0 if result.ok else 1
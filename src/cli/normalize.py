@@ -0,0 +1,93 @@
+import re
+import unicodedata
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+from domain.entities import PaymentModality
+from domain.money import parse_brl
+
+
+_TRUE = {"1", "true", "sim", "s", "yes", "y", "x", "pago"}
+
+MONTHS = {
+    "janeiro": 1, "fevereiro": 2, "marco": 3, "abril": 4, "maio": 5, "junho": 6,
+    "julho": 7, "agosto": 8, "setembro": 9, "outubro": 10, "novembro": 11, "dezembro": 12,
+}
+
+
+def fix_encoding(text: str) -> str:
+    """
+    Desfaz UTF-8 lido como Latin-1/CP1252 ("CrÃ©dito" -> "Crédito")
+
+    Substitui as tabelas de troca (Ã© -> é, Ã¡ -> á...) dos scripts de
+    importação; texto que não é mojibake volta inalterado.
+    """
+    if "Ã" not in text and "Â" not in text:
+        return text
+    for encoding in ("cp1252", "latin-1"):
+        try:
+            return text.encode(encoding).decode("utf-8")
+        except UnicodeError:
+            continue
+    return text
+
+
+def clean_text(text: Optional[str]) -> Optional[str]:
+    """Texto da célula com encoding corrigido e espaços colapsados; None se vazio"""
+    if not text:
+        return None
+    text = " ".join(fix_encoding(text).split())
+    return text or None
+
+
+def parse_value(text: Optional[str]) -> Optional[float]:
+    """
+    Valor em reais: R$ 1.234,56, -R$ 4.037,61, 1234,56 ou 1234.56
+
+    Célula vazia (ou -, \\) é None; texto que não é valor levanta ValueError.
+    Unifica limpar_valor e parse_brazilian_currency dos scripts antigos
+    (domain.money.parse_brl).
+    """
+    return parse_brl(text)
+
+
+def parse_date(text: str) -> datetime:
+    """Aceita DD/MM/AAAA e AAAA-MM-DD"""
+    text = text.strip()
+    for fmt in ("%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Data inválida: {text!r}")
+
+
+def parse_bool(text: Optional[str]) -> bool:
+    return (text or "").strip().casefold() in _TRUE
+
+
+def normalize_name(text: str) -> str:
+    """Nome sem acentos, caixa e pontuação (Crédito Av  (Sicoob) -> credito av sicoob)"""
+    text = unicodedata.normalize("NFKD", fix_encoding(text))
+    text = "".join(c for c in text if not unicodedata.combining(c)).casefold()
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text).split())
+
+
+def month_number(text: str) -> Optional[int]:
+    return MONTHS.get(normalize_name(text))
+
+
+def is_credit_payment_name(name: str) -> bool:
+    """Recebimento de crediário pelo nome da modalidade (Recebimento Crediario)"""
+    return normalize_name(name).startswith("recebimento credi")
+
+
+def modality_lookup(modalities: Sequence[PaymentModality]) -> Dict[str, PaymentModality]:
+    """Modalidades por id, nome e nome com o banco (normalizados)"""
+    lookup: Dict[str, PaymentModality] = {}
+    for modality in modalities:
+        for alias in (modality.name, modality.display_name, f"{modality.name} {modality.bank_name}"):
+            lookup.setdefault(normalize_name(alias), modality)
+    for modality in modalities:
+        if modality.id:
+            lookup[modality.id] = modality
+    return lookup
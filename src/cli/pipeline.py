@@ -0,0 +1,201 @@
+import hashlib
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from domain.entities import FinancialEntry, PaymentModality
+from domain.entities.account import Account
+from cli.journal import ImportJournal
+from cli.layouts import Record
+from cli.normalize import (
+    clean_text,
+    is_credit_payment_name,
+    normalize_name,
+    parse_bool,
+    parse_date,
+    parse_value,
+)
+
+
+ACCOUNT_TYPES = ("boleto", "payment", "investment")
+
+# Descrição das contas em planilhas sem essa coluna (ex.: boletos por dia)
+DEFAULT_DESCRIPTIONS = {"boleto": "Boleto", "payment": "Despesa", "investment": "Investimento"}
+
+
+@dataclass(slots=True)
+class ImportRow:
+    """Linha normalizada, pronta para envio"""
+
+    line: int  # número da linha no arquivo (1-based)
+    key: str  # chave de conteúdo: diário e idempotência
+    item: Any  # FinancialEntry ou Account
+
+
+@dataclass(slots=True)
+class Rejected:
+    """Linha descartada na normalização; ignored = regra de negócio, não erro"""
+
+    line: int
+    reason: str
+    ignored: bool = False
+
+
+@dataclass
+class ImportStats:
+    """Contadores das etapas, atualizados enquanto o fluxo é consumido"""
+
+    valid: int = 0
+    already_done: int = 0
+    invalid: List[Rejected] = field(default_factory=list)
+    ignored: List[Rejected] = field(default_factory=list)
+
+
+def _content_key(kind: str, parts: Tuple[Any, ...], seen: Counter) -> str:
+    # Linhas idênticas no mesmo arquivo (duas vendas iguais no dia) são
+    # legítimas: a ocorrência entra na chave para importar as duas
+    digest = hashlib.sha1("|".join(map(str, (kind, *parts))).encode()).hexdigest()[:16]
+    occurrence = seen[digest]
+    seen[digest] += 1
+    return f"{digest}-{occurrence}"
+
+
+def normalize_entries(
+    records: Iterable[Record], modalities: Dict[str, PaymentModality]
+) -> Iterator[Union[ImportRow, Rejected]]:
+    """
+    Registros -> lançamentos à vista
+
+    A modalidade é resolvida por id ou nome (sem acento/caixa, com ou sem o
+    banco). Modalidades de crediário são ignoradas: a venda parcelada é
+    lançada pela tela de crediário. "Recebimento Crediario" (ou a coluna
+    credit_payment) marca recebimento de crediário.
+    """
+    seen: Counter = Counter()
+    for line, fields in records:
+        try:
+            value = parse_value(fields.get("value"))
+            name = clean_text(fields.get("modality"))
+            # Células vazias ou zeradas (totais, dias sem movimento) não são linhas
+            if not value or name is None:
+                continue
+            if value < 0:
+                raise ValueError(f"Valor negativo: {value:.2f}")
+            date = parse_date(fields["date"])
+            modality = modalities.get(name) or modalities.get(normalize_name(name))
+            if modality is None:
+                raise ValueError(f"Modalidade não encontrada: {name!r}")
+        except ValueError as e:
+            yield Rejected(line, str(e))
+            continue
+
+        if modality.is_credit_plan:
+            yield Rejected(line, f"Crediário ({modality.name}): lançar pela tela de crediário", ignored=True)
+            continue
+
+        credit_payment = parse_bool(fields.get("credit_payment")) or is_credit_payment_name(name)
+        entry = FinancialEntry(
+            value=value,
+            date=date,
+            modality_id=modality.id,
+            modality_name=modality.name,
+            modality_color=modality.color,
+            credit_payment=credit_payment,
+        )
+        key = _content_key(
+            "entry", (date.date().isoformat(), f"{value:.2f}", modality.id, credit_payment), seen
+        )
+        yield ImportRow(line, key, entry)
+
+
+def normalize_accounts(
+    records: Iterable[Record], default_type: str = "payment"
+) -> Iterator[Union[ImportRow, Rejected]]:
+    """
+    Registros -> contas
+
+    type ausente usa default_type; sem descrição, usa a do tipo (Boleto...).
+    paid aceita sim/true/1/pago.
+    """
+    seen: Counter = Counter()
+    for line, fields in records:
+        try:
+            value = parse_value(fields.get("value"))
+            if not value:
+                continue
+            if value < 0:
+                raise ValueError(f"Valor negativo: {value:.2f}")
+            date = parse_date(fields["date"])
+            account_type = (fields.get("type") or default_type).strip().casefold()
+            if account_type not in ACCOUNT_TYPES:
+                raise ValueError(f"Tipo de conta inválido: {account_type!r}")
+        except ValueError as e:
+            yield Rejected(line, str(e))
+            continue
+
+        account = Account(
+            value=value,
+            date=date,
+            description=clean_text(fields.get("description")) or DEFAULT_DESCRIPTIONS[account_type],
+            type=account_type,
+            paid=parse_bool(fields.get("paid")),
+        )
+        key = _content_key(
+            "account", (account_type, date.date().isoformat(), f"{value:.2f}", account.description), seen
+        )
+        yield ImportRow(line, key, account)
+
+
+def dedupe(
+    rows: Iterable[Union[ImportRow, Rejected]], journal: ImportJournal, stats: ImportStats
+) -> Iterator[ImportRow]:
+    """Só as linhas válidas que ainda não estão no diário; o resto vai para stats"""
+    for row in rows:
+        if isinstance(row, Rejected):
+            (stats.ignored if row.ignored else stats.invalid).append(row)
+            continue
+        stats.valid += 1
+        if row.key in journal:
+            stats.already_done += 1
+            continue
+        yield row
+
+
+def batched(rows: Iterable[ImportRow], size: int) -> Iterator[List[ImportRow]]:
+    batch: List[ImportRow] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def upload(
+    batches: Iterable[List[ImportRow]],
+    send: Callable[[List[ImportRow]], Any],
+    workers: int,
+) -> Iterator[Tuple[List[ImportRow], Any, Optional[BaseException]]]:
+    """
+    Envia os lotes com até workers simultâneos, na ordem de leitura
+
+    Lê o próximo lote do CSV só quando há vaga (no máximo 2 x workers lotes
+    em memória), então o arquivo não precisa caber inteiro na memória.
+    Produz (lote, resultado, exceção) na ordem de envio.
+    """
+    def collect(item: Tuple[List[ImportRow], Future]):
+        batch, future = item
+        try:
+            return batch, future.result(), None
+        except Exception as e:
+            return batch, None, e
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cli-import") as executor:
+        in_flight: deque = deque()
+        for batch in batches:
+            in_flight.append((batch, executor.submit(send, batch)))
+            if len(in_flight) >= 2 * workers:
+                yield collect(in_flight.popleft())
+        while in_flight:
+            yield collect(in_flight.popleft())
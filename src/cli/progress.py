@@ -0,0 +1,80 @@
+import sys
+import threading
+import time
+from typing import Optional, TextIO
+
+
+class Progress:
+    """
+    Progresso e vazão (linhas/s) de um comando em lote
+
+    advance pode ser chamado de várias threads. Em terminal a linha é
+    reescrita no lugar; redirecionado para arquivo, imprime a cada 10% (ou
+    a cada 10 x interval segundos quando o total não é conhecido, como na
+    importação em streaming).
+    """
+
+    def __init__(
+        self, label: str, total: Optional[int] = None, stream: TextIO = sys.stderr, interval: float = 0.5
+    ):
+        self.label = label
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.stream = stream
+        self.interval = interval
+        self._interactive = stream.isatty()
+        self._started = time.perf_counter()
+        self._last_render = 0.0
+        self._last_decile = 0
+        self._lock = threading.Lock()
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._started
+
+    @property
+    def rate(self) -> float:
+        elapsed = self.elapsed
+        return (self.done + self.failed) / elapsed if elapsed > 0 else 0.0
+
+    def advance(self, done: int = 0, failed: int = 0) -> None:
+        with self._lock:
+            self.done += done
+            self.failed += failed
+            processed = self.done + self.failed
+            now = time.perf_counter()
+            if self._interactive:
+                if now - self._last_render >= self.interval or processed == self.total:
+                    self._last_render = now
+                    self.stream.write(f"\r{self._line()}")
+                    self.stream.flush()
+            elif self.total:
+                decile = processed * 10 // self.total
+                if decile > self._last_decile:
+                    self._last_decile = decile
+                    self.stream.write(f"{self._line()}\n")
+            elif now - self._last_render >= 10 * self.interval:
+                self._last_render = now
+                self.stream.write(f"{self._line()}\n")
+
+    def _line(self) -> str:
+        processed = self.done + self.failed
+        if self.total is None:
+            return f"{self.label}: {processed} · {self.rate:,.0f} linhas/s · erros {self.failed}"
+        percent = processed * 100 // self.total if self.total else 100
+        rate = self.rate
+        eta = (self.total - processed) / rate if rate else 0.0
+        return (
+            f"{self.label}: {processed}/{self.total} ({percent}%) · "
+            f"{rate:,.0f} linhas/s · faltam {eta:.0f}s · erros {self.failed}"
+        )
+
+    def finish(self) -> None:
+        if self._interactive:
+            self.stream.write("\n")
+        self.stream.write(
+            f"{self.label}: {self.done} concluídas, {self.failed} com erro "
+            f"em {self.elapsed:.1f}s ({self.rate:,.0f} linhas/s)\n"
+        )
+        self.stream.flush()
@@ -3,6 +3,18 @@ from pathlib import Path
 from typing import List, Optional
 
 BASE_URL = "BASE_URL"
+HTTP_POOL_SIZE = "HTTP_POOL_SIZE"
+HTTP_MAX_RETRIES = "HTTP_MAX_RETRIES"
+HTTP_BACKOFF_FACTOR = "HTTP_BACKOFF_FACTOR"
+HTTP_REQUEST_LOG_SIZE = "HTTP_REQUEST_LOG_SIZE"
+CACHE_TTL_SECONDS = "CACHE_TTL_SECONDS"
+CACHE_MAX_ENTRIES = "CACHE_MAX_ENTRIES"
+CREDIT_PAST_MONTH_TTL_SECONDS = "CREDIT_PAST_MONTH_TTL_SECONDS"
+SYNC_INTERVAL_SECONDS = "SYNC_INTERVAL_SECONDS"
+SYNC_MAX_TENANTS = "SYNC_MAX_TENANTS"
+SNAPSHOT_DB_PATH = "SNAPSHOT_DB_PATH"
+SNAPSHOT_REFRESH_SECONDS = "SNAPSHOT_REFRESH_SECONDS"
+PROFILE_VIEWS = "PROFILE_VIEWS"
 
 class EnvironmentError(Exception):
     pass
@@ -20,6 +32,8 @@ class Environment:
         BASE_URL,
     ]
 
+    ENV_PATH = Path(__file__).parent.parent.parent / '.env'
+
     def __init__(self):
         if not hasattr(self, '_initialized'):
             self._load_env_file()
@@ -28,10 +42,11 @@ class Environment:
             self._initialized = True
 
     def _load_env_file(self) -> None:
-        env_path = Path(__file__).parent.parent.parent / '.env'
+        env_path = self.ENV_PATH
 
         if not env_path.exists():
-            if os.getenv('RENDER') or os.getenv('PORT'):
+            # Sem .env vale o ambiente do processo (Render, --base-url do CLI)
+            if os.getenv('RENDER') or os.getenv('PORT') or all(map(os.getenv, self.REQUIRED_VARIABLES)):
                 return
             else:
                 raise EnvironmentError(
@@ -102,3 +117,93 @@ class Environment:
     @property
     def base_url(self) -> str:
         return self.BASE_URL
+
+    def get_int(self, key: str, default: int) -> int:
+        value = os.getenv(key)
+        if value is None or not value.strip():
+            return default
+        try:
+            return int(value)
+        except ValueError as e:
+            raise EnvironmentError(f"Variável {key} deve ser um número inteiro: {value}") from e
+
+    def get_float(self, key: str, default: float) -> float:
+        value = os.getenv(key)
+        if value is None or not value.strip():
+            return default
+        try:
+            return float(value)
+        except ValueError as e:
+            raise EnvironmentError(f"Variável {key} deve ser um número: {value}") from e
+
+    def get_bool(self, key: str, default: bool) -> bool:
+        value = os.getenv(key)
+        if value is None or not value.strip():
+            return default
+        value = value.strip().casefold()
+        if value in ("1", "true", "yes", "on"):
+            return True
+        if value in ("0", "false", "no", "off"):
+            return False
+        raise EnvironmentError(f"Variável {key} deve ser verdadeiro/falso (1/0): {value}")
+
+    @property
+    def http_pool_size(self) -> int:
+        """Conexões mantidas abertas (keep-alive) por host da API"""
+        return self.get_int(HTTP_POOL_SIZE, 10)
+
+    @property
+    def http_max_retries(self) -> int:
+        """Tentativas extras para erros de conexão e 502/503/504"""
+        return self.get_int(HTTP_MAX_RETRIES, 3)
+
+    @property
+    def http_backoff_factor(self) -> float:
+        """Fator de espera exponencial entre tentativas (segundos)"""
+        return self.get_float(HTTP_BACKOFF_FACTOR, 0.5)
+
+    @property
+    def http_request_log_size(self) -> int:
+        """Últimas chamadas à API guardadas por sessão para o painel de debug"""
+        return self.get_int(HTTP_REQUEST_LOG_SIZE, 500)
+
+    @property
+    def cache_ttl_seconds(self) -> float:
+        """Tempo de vida dos dados da API em cache (segundos)"""
+        return self.get_float(CACHE_TTL_SECONDS, 60.0)
+
+    @property
+    def cache_max_entries(self) -> int:
+        """Quantidade máxima de consultas mantidas em cache (LRU)"""
+        return self.get_int(CACHE_MAX_ENTRIES, 256)
+
+    @property
+    def credit_past_month_ttl_seconds(self) -> float:
+        """Tempo de vida dos meses passados do crediário em cache (segundos)"""
+        return self.get_float(CREDIT_PAST_MONTH_TTL_SECONDS, 600.0)
+
+    @property
+    def sync_interval_seconds(self) -> float:
+        """Intervalo mínimo entre sincronizações incrementais dos lançamentos"""
+        return self.get_float(SYNC_INTERVAL_SECONDS, 15.0)
+
+    @property
+    def sync_max_tenants(self) -> int:
+        """Empresas com histórico sincronizado mantido em memória (LRU)"""
+        return self.get_int(SYNC_MAX_TENANTS, 32)
+
+    @property
+    def snapshot_db_path(self) -> Optional[str]:
+        """Arquivo SQLite do snapshot local; vazio desativa o snapshot"""
+        value = os.getenv(SNAPSHOT_DB_PATH)
+        return value.strip() if value and value.strip() else None
+
+    @property
+    def snapshot_refresh_seconds(self) -> float:
+        """Idade mínima do snapshot antes de reconciliar com a API em segundo plano"""
+        return self.get_float(SNAPSHOT_REFRESH_SECONDS, 30.0)
+
+    @property
+    def profile_views(self) -> bool:
+        """Perfil de tempo/CPU/memória de cada página na barra lateral (mais lento)"""
+        return self.get_bool(PROFILE_VIEWS, False)
@@ -1,4 +1,24 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+from typing import Any, Callable, Dict, Optional
+from config import Environment
 from infrastructure.http import HTTPClient
+from infrastructure.concurrency import FetchBatch
+from infrastructure.cache import (
+    TTLCache,
+    TenantCache,
+    CachedFinancialEntryRepository,
+    SyncedFinancialEntryRepository,
+)
+from infrastructure.snapshot import (
+    SQLiteSnapshotStore,
+    SnapshotRefresher,
+    SnapshotFinancialEntryRepository,
+    SnapshotAccountRepository,
+    SnapshotPaymentModalityRepository,
+    SnapshotInstallmentRepository,
+)
 from infrastructure.api import (
     PaymentModalityAPIRepository,
     FinancialEntryAPIRepository,
@@ -17,62 +37,171 @@ from application.use_cases.platform_settings_use_cases import PlatformSettingsUs
 from application.use_cases.installment_use_cases import InstallmentUseCases
 from application.use_cases.account_use_cases import AccountUseCases
 from application.use_cases.bank_limit_use_cases import BankLimitUseCases
+from presentation.colors import hex_to_rgba
 
 
-class Container:
-    _instance = None
-    _initialized = False
+# Chave do Container de cada sessão no st.session_state
+CONTAINER_SESSION_KEY = "_container"
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+_shared_lock = threading.Lock()
+_shared: Dict[str, Any] = {}
 
-    def __init__(self):
-        if not Container._initialized:
-            self._http_client = HTTPClient()
 
-            self._payment_modality_repository = PaymentModalityAPIRepository(
-                self._http_client
-            )
-            self._financial_entry_repository = FinancialEntryAPIRepository(
-                self._http_client
-            )
+def shared_resource(name: str, factory: Callable[[], Any]) -> Any:
+    """Recurso único por processo (caches, pools), criado na primeira chamada"""
+    resource = _shared.get(name)
+    if resource is None:
+        with _shared_lock:
+            resource = _shared.get(name)
+            if resource is None:
+                resource = _shared[name] = factory()
+    return resource
 
-            self._auth_repository = AuthAPIRepository(self._http_client)
-            self._company_repository = CompanyAPIRepository(self._http_client)
-            self._user_repository = UserAPIRepository(self._http_client)
-            self._platform_settings_repository = PlatformSettingsAPIRepository(self._http_client)
-            self._installment_repository = InstallmentAPIRepository(self._http_client)
-            self._account_repository = AccountAPIRepository(self._http_client)
-            self._bank_limit_repository = BankLimitAPIRepository(self._http_client)
 
-            self._payment_modality_use_cases = PaymentModalityUseCases(
-                self._payment_modality_repository
-            )
-            self._financial_entry_use_cases = FinancialEntryUseCases(
-                self._financial_entry_repository
-            )
+def _build_entry_cache() -> TTLCache:
+    env = Environment()
+    return TTLCache(maxsize=env.cache_max_entries, ttl=env.cache_ttl_seconds)
+
+
+def _build_entry_sync_stores() -> TTLCache:
+    # Sem TTL: o histórico sincronizado só sai da memória pelo LRU de tenants
+    return TTLCache(maxsize=Environment().sync_max_tenants, ttl=None)
+
 
-            self._auth_use_cases = AuthUseCases(self._auth_repository)
-            self._admin_use_cases = AdminUseCases(
-                self._company_repository,
-                self._user_repository
+def _build_modality_catalogs() -> TTLCache:
+    # Escritas da própria sessão invalidam na hora; o TTL limita o quanto
+    # outras sessões da mesma empresa veem uma versão antiga
+    env = Environment()
+    return TTLCache(maxsize=env.cache_max_entries, ttl=env.cache_ttl_seconds)
+
+
+def _build_fetch_executor() -> ThreadPoolExecutor:
+    # Um worker por conexão do pool HTTP: mais threads só ficariam esperando conexão
+    return ThreadPoolExecutor(
+        max_workers=Environment().http_pool_size, thread_name_prefix="fetch"
+    )
+
+
+def get_snapshot_store() -> Optional[SQLiteSnapshotStore]:
+    """Snapshot SQLite do processo, ou None quando SNAPSHOT_DB_PATH não está definido"""
+    path = Environment().snapshot_db_path
+    if not path:
+        return None
+    return shared_resource("snapshot_store", lambda: SQLiteSnapshotStore(path))
+
+
+def warm_snapshot_store() -> None:
+    """Abre o snapshot e aquece os índices uma vez por processo (chamado no startup)"""
+    store = get_snapshot_store()
+    if store is not None:
+        shared_resource("snapshot_warm", store.warm)
+
+
+class Container:
+    """
+    Dependências de uma sessão de usuário
+
+    Cada sessão do Streamlit tem o seu Container (e o seu token), enquanto
+    o pool de conexões HTTP é compartilhado pelo processo inteiro.
+    """
+
+    def __init__(self, http_client: Optional[HTTPClient] = None):
+        self._http_client = http_client or HTTPClient()
+
+        self._payment_modality_repository = PaymentModalityAPIRepository(
+            self._http_client
+        )
+        financial_entry_repository = FinancialEntryAPIRepository(self._http_client)
+        self._installment_repository = InstallmentAPIRepository(self._http_client)
+        self._account_repository = AccountAPIRepository(self._http_client)
+
+        snapshot = get_snapshot_store()
+        if snapshot is not None:
+            # Snapshot em disco por empresa (validada pela API); as atualizações
+            # em segundo plano usam um cliente com o token do momento da leitura
+            snapshot_args = (
+                snapshot,
+                lambda: self._http_client.tenant_id,
+                shared_resource("snapshot_refresher", SnapshotRefresher),
+                Environment().snapshot_refresh_seconds,
             )
-            self._platform_settings_use_cases = PlatformSettingsUseCases(
-                self._platform_settings_repository
+            self._payment_modality_repository = SnapshotPaymentModalityRepository(
+                lambda: PaymentModalityAPIRepository(self._pinned_client()), *snapshot_args
             )
-            self._installment_use_cases = InstallmentUseCases(
-                self._installment_repository
+            financial_entry_repository = SnapshotFinancialEntryRepository(
+                lambda: FinancialEntryAPIRepository(self._pinned_client()), *snapshot_args
             )
-            self._account_use_cases = AccountUseCases(
-                self._account_repository
+            self._installment_repository = SnapshotInstallmentRepository(
+                lambda: InstallmentAPIRepository(self._pinned_client()), *snapshot_args
             )
-            self._bank_limit_use_cases = BankLimitUseCases(
-                self._bank_limit_repository
+            self._account_repository = SnapshotAccountRepository(
+                lambda: AccountAPIRepository(self._pinned_client()), *snapshot_args
             )
 
-            Container._initialized = True
+        # Cache e cópia sincronizada compartilhados entre sessões. O cache
+        # curto é particionado pelo token; a cópia sincronizada, pela empresa
+        # (sessões da mesma empresa compartilham o histórico). Sem empresa
+        # validada, a cópia também fica no token.
+        tenant = lambda: self._http_client.auth_token
+        company = lambda: self._http_client.tenant_id or self._http_client.auth_token
+        self._financial_entry_repository = CachedFinancialEntryRepository(
+            SyncedFinancialEntryRepository(
+                financial_entry_repository,
+                TenantCache(
+                    shared_resource("financial_entries_sync", _build_entry_sync_stores),
+                    company,
+                ),
+                interval=Environment().sync_interval_seconds,
+            ),
+            TenantCache(
+                shared_resource("financial_entries_cache", _build_entry_cache),
+                tenant,
+            ),
+        )
+
+        self._auth_repository = AuthAPIRepository(self._http_client)
+        self._company_repository = CompanyAPIRepository(self._http_client)
+        self._user_repository = UserAPIRepository(self._http_client)
+        self._platform_settings_repository = PlatformSettingsAPIRepository(self._http_client)
+        self._bank_limit_repository = BankLimitAPIRepository(self._http_client)
+
+        self._payment_modality_use_cases = PaymentModalityUseCases(
+            self._payment_modality_repository,
+            TenantCache(shared_resource("modality_catalogs", _build_modality_catalogs), tenant),
+            to_rgba=hex_to_rgba,
+        )
+        self._financial_entry_use_cases = FinancialEntryUseCases(
+            self._financial_entry_repository
+        )
+
+        self._auth_use_cases = AuthUseCases(self._auth_repository)
+        self._admin_use_cases = AdminUseCases(
+            self._company_repository,
+            self._user_repository
+        )
+        self._platform_settings_use_cases = PlatformSettingsUseCases(
+            self._platform_settings_repository
+        )
+        self._installment_use_cases = InstallmentUseCases(
+            self._installment_repository,
+            TenantCache(shared_resource("credit_months", _build_entry_cache), tenant),
+            past_month_ttl=Environment().credit_past_month_ttl_seconds,
+        )
+        self._account_use_cases = AccountUseCases(
+            self._account_repository,
+            TenantCache(shared_resource("accounts_cache", _build_entry_cache), tenant),
+        )
+        self._bank_limit_use_cases = BankLimitUseCases(
+            self._bank_limit_repository
+        )
+
+    def _pinned_client(self) -> HTTPClient:
+        """Cópia do cliente com o token atual (não muda se a sessão trocar de token)"""
+        return self._http_client.with_token(self._http_client.auth_token)
+
+    def fetch_batch(self) -> FetchBatch:
+        """Lote de chamadas independentes executadas em paralelo (pool do processo)"""
+        return FetchBatch(shared_resource("fetch_executor", _build_fetch_executor))
 
     @property
     def http_client(self) -> HTTPClient:
@@ -112,4 +241,7 @@ class Container:
 
 
 def get_container() -> Container:
-    return Container()
+    """Container da sessão atual do Streamlit (criado na primeira chamada)"""
+    if CONTAINER_SESSION_KEY not in st.session_state:
+        st.session_state[CONTAINER_SESSION_KEY] = Container()
+    return st.session_state[CONTAINER_SESSION_KEY]
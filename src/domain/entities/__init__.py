@@ -1,4 +1,5 @@
 from .payment_modality import PaymentModality
 from .financial_entry import FinancialEntry
+from .entry_frame import EntryFrame
 
-__all__ = ["PaymentModality", "FinancialEntry"]
+__all__ = ["PaymentModality", "FinancialEntry", "EntryFrame"]
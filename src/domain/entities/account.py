@@ -1,12 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Literal
+from domain.entities.timestamps import parse_date, parse_datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Account:
     """
     Entidade que representa uma conta (boleto, pagamento ou investimento)
+
+    Imutável: as listas decodificadas ficam no cache compartilhado entre sessões.
     """
     value: float
     date: datetime
@@ -17,16 +20,22 @@ class Account:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "value": self.value,
+            "date": self.date.isoformat() if isinstance(self.date, datetime) else self.date,
+            "description": self.description,
+            "type": self.type,
+            "paid": self.paid,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+        }
+
     @staticmethod
     def _parse_datetime(value) -> Optional[datetime]:
         """Helper para converter string ISO para datetime"""
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value
-        if isinstance(value, str):
-            return datetime.fromisoformat(value.replace('Z', '+00:00'))
-        return None
+        return parse_datetime(value)
 
     @classmethod
     def from_dict(cls, data: dict) -> "Account":
@@ -34,7 +43,7 @@ class Account:
         return cls(
             id=data.get("id"),
             value=data.get("value"),
-            date=cls._parse_datetime(data.get("date")),
+            date=parse_date(data.get("date")),
             description=data.get("description"),
             type=data.get("type"),
             paid=data.get("paid", False),
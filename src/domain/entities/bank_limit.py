@@ -6,10 +6,10 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BankLimit:
     """
-    Bank Limit entity
+    Bank Limit entity (imutável: alterações criam um novo BankLimit)
 
     Attributes:
         bank_name: Nome do banco
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+
+@dataclass(slots=True)
+class BulkResult:
+    """
+    Resultado de uma operação em lote, por linha (índice na entrada)
+
+    succeeded guarda o resultado de cada linha concluída (ex.: a conta
+    criada) e errors a mensagem de cada linha que falhou; as linhas com
+    erro podem ser reenviadas sem repetir as concluídas.
+    """
+
+    total: int = 0
+    succeeded: Dict[int, Any] = field(default_factory=dict)
+    errors: Dict[int, str] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def items(self) -> List[Any]:
+        """Resultados das linhas concluídas, na ordem da entrada"""
+        return [self.succeeded[index] for index in sorted(self.succeeded)]
+
+    @property
+    def failed_rows(self) -> List[int]:
+        return sorted(self.errors)
@@ -0,0 +1,102 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Tuple
+import numpy as np
+
+
+# (ano, mês)
+MonthKey = Tuple[int, int]
+
+
+@dataclass(frozen=True)
+class CreditMonth:
+    """
+    Resumo diário do crediário de um mês, em arrays por dia (índice 0 = dia 1)
+
+    receivable e received têm sempre 31 posições; dias sem resumo (ou que
+    o mês não tem) ficam zerados. has_data indica se a API devolveu algum
+    dia do mês.
+    """
+
+    year: int
+    month: int
+    receivable: np.ndarray
+    received: np.ndarray
+    has_data: bool = False
+
+    @property
+    def key(self) -> MonthKey:
+        return (self.year, self.month)
+
+    @property
+    def label(self) -> str:
+        return f"{self.month:02d}/{self.year}"
+
+    @property
+    def total_receivable(self) -> float:
+        return float(self.receivable.sum())
+
+    @property
+    def total_received(self) -> float:
+        return float(self.received.sum())
+
+    def clipped(self, start: date, end: date) -> "CreditMonth":
+        """Cópia só com os dias entre start e end (inclusive); os demais zerados"""
+        days = np.arange(1, 32)
+        first = start.day if (start.year, start.month) == self.key else 1
+        last = end.day if (end.year, end.month) == self.key else 31
+        if first == 1 and last == 31:
+            return self
+        mask = (days >= first) & (days <= last)
+        return CreditMonth(
+            self.year,
+            self.month,
+            np.where(mask, self.receivable, 0.0),
+            np.where(mask, self.received, 0.0),
+            self.has_data,
+        )
+
+    @classmethod
+    def empty(cls, key: MonthKey) -> "CreditMonth":
+        return cls(key[0], key[1], np.zeros(31), np.zeros(31))
+
+    @classmethod
+    def from_daily_summary(
+        cls, days: Iterable[Dict[str, Any]], months: Iterable[MonthKey]
+    ) -> Dict[MonthKey, "CreditMonth"]:
+        """
+        Blocos por mês a partir do retorno de get_daily_summary
+
+        Todo mês de months ganha um bloco (vazio se a API não devolveu
+        dias dele), para que meses sem movimento também fiquem em cache.
+        """
+        receivable: Dict[MonthKey, np.ndarray] = {key: np.zeros(31) for key in months}
+        received: Dict[MonthKey, np.ndarray] = {key: np.zeros(31) for key in months}
+        seen = set()
+        for day in days:
+            # "AAAA-MM-DD..." -> sem datetime.fromisoformat por dia
+            text = str(day["date"])
+            key = (int(text[0:4]), int(text[5:7]))
+            if key not in receivable:
+                continue
+            index = int(text[8:10]) - 1
+            receivable[key][index] = day.get("total_receivable") or 0.0
+            received[key][index] = day.get("total_received") or 0.0
+            seen.add(key)
+        # Blocos ficam em cache compartilhado entre sessões: somente leitura
+        for array in (*receivable.values(), *received.values()):
+            array.flags.writeable = False
+        return {
+            key: cls(key[0], key[1], receivable[key], received[key], key in seen)
+            for key in receivable
+        }
+
+
+def month_range(start: datetime, end: datetime) -> List[MonthKey]:
+    """Meses de start a end (inclusive), em ordem crescente"""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
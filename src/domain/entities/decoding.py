@@ -0,0 +1,106 @@
+"""
+Decodificação em lote das respostas da API
+
+Equivalente a chamar from_dict item a item, mas em uma única passada:
+cada timestamp é convertido uma vez, strings de data repetidas reaproveitam
+o mesmo datetime (lru_cache de parse_date) e created_at/updated_at podem
+ser ignorados com timestamps=False quando quem chama não precisa deles.
+"""
+import sys
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from domain.entities.account import Account
+from domain.entities.financial_entry import FinancialEntry
+from domain.entities.installment import Installment
+from domain.entities.timestamps import parse_date, parse_date_required, parse_datetime
+
+
+def _timestamps(data: dict) -> Tuple[Optional[datetime], Optional[datetime]]:
+    created_raw = data.get("created_at")
+    updated_raw = data.get("updated_at")
+    created_at = parse_datetime(created_raw)
+    # Registros nunca editados costumam ter updated_at == created_at
+    if updated_raw == created_raw:
+        return created_at, created_at
+    return created_at, parse_datetime(updated_raw)
+
+
+def _no_timestamps(data: dict) -> Tuple[None, None]:
+    return None, None
+
+
+def decode_financial_entries(
+    records: Iterable[dict], timestamps: bool = True
+) -> List[FinancialEntry]:
+    stamps = _timestamps if timestamps else _no_timestamps
+    intern = sys.intern
+    entries = []
+    append = entries.append
+    for data in records:
+        get = data.get
+        created_at, updated_at = stamps(data)
+        append(
+            FinancialEntry(
+                id=get("id"),
+                value=float(data["value"]),
+                date=parse_date_required(data["date"]),
+                modality_id=intern(data["modality_id"]),
+                modality_name=intern(data["modality_name"]),
+                modality_color=intern(get("modality_color", "#9333EA")),
+                type=intern(get("type", "received")),
+                entry_type=intern(get("entry_type", "normal")),
+                is_credit_plan=get("is_credit_plan", False),
+                credit_payment=get("credit_payment", False),
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+        )
+    return entries
+
+
+def decode_installments(
+    records: Iterable[dict], timestamps: bool = True
+) -> List[Installment]:
+    stamps = _timestamps if timestamps else _no_timestamps
+    installments = []
+    append = installments.append
+    for data in records:
+        get = data.get
+        created_at, updated_at = stamps(data)
+        append(
+            Installment(
+                id=get("id"),
+                financial_entry_id=data["financial_entry_id"],
+                installment_number=data["installment_number"],
+                total_installments=data["total_installments"],
+                amount=float(data["amount"]),
+                due_date=parse_date(data["due_date"]),
+                is_paid=get("is_paid", False),
+                payment_date=parse_datetime(get("payment_date")),
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+        )
+    return installments
+
+
+def decode_accounts(records: Iterable[dict], timestamps: bool = True) -> List[Account]:
+    stamps = _timestamps if timestamps else _no_timestamps
+    accounts = []
+    append = accounts.append
+    for data in records:
+        get = data.get
+        created_at, updated_at = stamps(data)
+        append(
+            Account(
+                id=get("id"),
+                value=get("value"),
+                date=parse_date(get("date")),
+                description=get("description"),
+                type=get("type"),
+                paid=get("paid", False),
+                created_at=created_at,
+                updated_at=updated_at,
+            )
+        )
+    return accounts
@@ -0,0 +1,383 @@
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+import numpy as np
+from domain.entities.financial_entry import FinancialEntry
+from domain.entities.decoding import decode_financial_entries
+
+
+# Chaves aceitas por EntryFrame.group_by
+GROUP_KEYS = ("modality", "day", "month", "is_credit_plan", "credit_payment", "entry_type")
+
+
+def _encode(labels: List[Any]) -> Tuple[np.ndarray, List[Any]]:
+    """Codifica uma coluna categórica em (códigos int32, categorias)"""
+    categories: Dict[Any, int] = {}
+    codes = np.fromiter(
+        (categories.setdefault(label, len(categories)) for label in labels),
+        dtype=np.int32,
+        count=len(labels),
+    )
+    return codes, list(categories)
+
+
+def _day_string(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str) and len(value) >= 10:
+        return value[:10]
+    raise ValueError(f"Data inválida: {value}")
+
+
+class EntryFrame(Sequence[FinancialEntry]):
+    """
+    Coleção colunar (NumPy) de lançamentos financeiros
+
+    Guarda value, date, modality_id, is_credit_plan, credit_payment e
+    entry_type como arrays tipados para filtros, somas e agrupamentos
+    vetorizados. Também é uma Sequence[FinancialEntry]: os objetos
+    FinancialEntry só são criados quando uma linha é de fato acessada.
+    """
+
+    def __init__(
+        self,
+        source: Sequence[Union[dict, FinancialEntry]],
+        values: np.ndarray,
+        dates: np.ndarray,
+        modality_codes: np.ndarray,
+        modalities: List[str],
+        entry_type_codes: np.ndarray,
+        entry_types: List[str],
+        is_credit_plan: np.ndarray,
+        credit_payment: np.ndarray,
+        modality_info: Dict[str, Tuple[str, str]],
+        positions: Optional[np.ndarray] = None,
+        rows_cache: Optional[Dict[int, FinancialEntry]] = None,
+    ):
+        self._source = source
+        self._values = values
+        self._dates = dates
+        self._modality_codes = modality_codes
+        self._modalities = modalities
+        self._entry_type_codes = entry_type_codes
+        self._entry_types = entry_types
+        self._is_credit_plan = is_credit_plan
+        self._credit_payment = credit_payment
+        self._modality_info = modality_info
+        # Posição de cada linha em source (filtros compartilham source e cache)
+        self._positions = (
+            positions if positions is not None else np.arange(len(values), dtype=np.int64)
+        )
+        self._rows_cache = rows_cache if rows_cache is not None else {}
+
+        for array in (
+            self._values,
+            self._dates,
+            self._modality_codes,
+            self._entry_type_codes,
+            self._is_credit_plan,
+            self._credit_payment,
+            self._positions,
+        ):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict]) -> "EntryFrame":
+        """Monta o frame a partir da resposta da API em uma única passada"""
+        values: List[float] = []
+        days: List[str] = []
+        modality_ids: List[str] = []
+        entry_types: List[str] = []
+        credit_plan: List[bool] = []
+        credit_payment: List[bool] = []
+        modality_info: Dict[str, Tuple[str, str]] = {}
+
+        for item in records:
+            if item.get("date") is None:
+                raise ValueError("Data é obrigatória")
+            modality_id = item["modality_id"]
+            values.append(float(item["value"]))
+            days.append(_day_string(item["date"]))
+            modality_ids.append(modality_id)
+            entry_types.append(item.get("entry_type", "normal"))
+            credit_plan.append(bool(item.get("is_credit_plan", False)))
+            credit_payment.append(bool(item.get("credit_payment", False)))
+            if modality_id not in modality_info:
+                modality_info[modality_id] = (
+                    item["modality_name"],
+                    item.get("modality_color", "#9333EA"),
+                )
+
+        return cls._build(
+            records, values, days, modality_ids, entry_types,
+            credit_plan, credit_payment, modality_info,
+        )
+
+    @classmethod
+    def from_entries(cls, entries: Sequence[FinancialEntry]) -> "EntryFrame":
+        """Monta o frame a partir de entidades já existentes"""
+        modality_info: Dict[str, Tuple[str, str]] = {}
+        for entry in entries:
+            modality_info.setdefault(
+                entry.modality_id, (entry.modality_name, entry.modality_color)
+            )
+
+        return cls._build(
+            list(entries),
+            [float(e.value) for e in entries],
+            [_day_string(e.date) for e in entries],
+            [e.modality_id for e in entries],
+            [e.entry_type for e in entries],
+            [bool(e.is_credit_plan) for e in entries],
+            [bool(e.credit_payment) for e in entries],
+            modality_info,
+        )
+
+    @classmethod
+    def empty(cls) -> "EntryFrame":
+        return cls.from_records([])
+
+    @classmethod
+    def _build(
+        cls,
+        source: Sequence[Union[dict, FinancialEntry]],
+        values: List[float],
+        days: List[str],
+        modality_ids: List[str],
+        entry_types: List[str],
+        credit_plan: List[bool],
+        credit_payment: List[bool],
+        modality_info: Dict[str, Tuple[str, str]],
+    ) -> "EntryFrame":
+        modality_codes, modalities = _encode(modality_ids)
+        entry_type_codes, entry_type_categories = _encode(entry_types)
+        return cls(
+            source=source,
+            values=np.asarray(values, dtype=np.float64),
+            dates=np.asarray(days, dtype="datetime64[D]"),
+            modality_codes=modality_codes,
+            modalities=modalities,
+            entry_type_codes=entry_type_codes,
+            entry_types=entry_type_categories,
+            is_credit_plan=np.asarray(credit_plan, dtype=bool),
+            credit_payment=np.asarray(credit_payment, dtype=bool),
+            modality_info=modality_info,
+        )
+
+    # Colunas
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self._dates
+
+    @property
+    def modality_ids(self) -> np.ndarray:
+        return np.asarray(self._modalities, dtype=object)[self._modality_codes]
+
+    @property
+    def is_credit_plan(self) -> np.ndarray:
+        return self._is_credit_plan
+
+    @property
+    def credit_payment(self) -> np.ndarray:
+        return self._credit_payment
+
+    @property
+    def entry_types(self) -> np.ndarray:
+        return np.asarray(self._entry_types, dtype=object)[self._entry_type_codes]
+
+    def modality_name(self, modality_id: str) -> Optional[str]:
+        """Nome salvo nos lançamentos para a modalidade (fallback de exibição)"""
+        info = self._modality_info.get(modality_id)
+        return info[0] if info else None
+
+    def modality_color(self, modality_id: str) -> Optional[str]:
+        """Cor salva nos lançamentos para a modalidade (fallback de exibição)"""
+        info = self._modality_info.get(modality_id)
+        return info[1] if info else None
+
+    # Filtros
+
+    def filter(self, mask: np.ndarray) -> "EntryFrame":
+        """Novo frame com as linhas selecionadas (máscara booleana ou índices)"""
+        return EntryFrame(
+            source=self._source,
+            values=self._values[mask],
+            dates=self._dates[mask],
+            modality_codes=self._modality_codes[mask],
+            modalities=self._modalities,
+            entry_type_codes=self._entry_type_codes[mask],
+            entry_types=self._entry_types,
+            is_credit_plan=self._is_credit_plan[mask],
+            credit_payment=self._credit_payment[mask],
+            modality_info=self._modality_info,
+            positions=self._positions[mask],
+            rows_cache=self._rows_cache,
+        )
+
+    def between(self, start: Optional[date] = None, end: Optional[date] = None) -> "EntryFrame":
+        """Linhas com data entre start e end (inclusive, por dia)"""
+        mask = np.ones(len(self), dtype=bool)
+        if start is not None:
+            mask &= self._dates >= np.datetime64(_day_string(start), "D")
+        if end is not None:
+            mask &= self._dates <= np.datetime64(_day_string(end), "D")
+        return self if mask.all() else self.filter(mask)
+
+    def where(
+        self,
+        is_credit_plan: Optional[bool] = None,
+        credit_payment: Optional[bool] = None,
+        modality_id: Optional[str] = None,
+        entry_type: Optional[str] = None,
+    ) -> "EntryFrame":
+        """Filtra pelas flags/modalidade/tipo informados (None = qualquer)"""
+        mask = np.ones(len(self), dtype=bool)
+        if is_credit_plan is not None:
+            mask &= self._is_credit_plan == is_credit_plan
+        if credit_payment is not None:
+            mask &= self._credit_payment == credit_payment
+        if modality_id is not None:
+            code = self._code_of(self._modalities, modality_id)
+            mask &= self._modality_codes == code
+        if entry_type is not None:
+            code = self._code_of(self._entry_types, entry_type)
+            mask &= self._entry_type_codes == code
+        return self.filter(mask)
+
+    @staticmethod
+    def _code_of(categories: List[str], label: str) -> int:
+        try:
+            return categories.index(label)
+        except ValueError:
+            return -1
+
+    # Agregações
+
+    def total(self) -> float:
+        return float(self._values.sum())
+
+    def group_by(self, *keys: str) -> List[Dict[str, Any]]:
+        """
+        Soma e contagem agrupadas pelas chaves informadas
+
+        Chaves: modality, day, month, is_credit_plan, credit_payment, entry_type.
+        Retorna uma lista de dicionários com as chaves do grupo, total e count.
+        """
+        invalid = [key for key in keys if key not in GROUP_KEYS]
+        if invalid:
+            raise ValueError(f"Agrupamento inválido: {', '.join(invalid)}")
+
+        if not keys:
+            return [{"total": self.total(), "count": len(self)}] if len(self) else []
+        if not len(self):
+            return []
+
+        columns = [self._group_column(key) for key in keys]
+        groups, inverse = np.unique(np.stack(columns, axis=1), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        totals = np.bincount(inverse, weights=self._values, minlength=len(groups))
+        counts = np.bincount(inverse, minlength=len(groups))
+
+        rows = []
+        for group, group_total, group_count in zip(groups, totals, counts):
+            row = {key: self._group_label(key, code) for key, code in zip(keys, group)}
+            row["total"] = float(group_total)
+            row["count"] = int(group_count)
+            rows.append(row)
+        return rows
+
+    def _group_column(self, key: str) -> np.ndarray:
+        if key == "modality":
+            return self._modality_codes.astype(np.int64)
+        if key == "day":
+            return self._dates.astype(np.int64)
+        if key == "month":
+            return self._dates.astype("datetime64[M]").astype(np.int64)
+        if key == "is_credit_plan":
+            return self._is_credit_plan.astype(np.int64)
+        if key == "credit_payment":
+            return self._credit_payment.astype(np.int64)
+        return self._entry_type_codes.astype(np.int64)
+
+    def _group_label(self, key: str, code: int) -> Any:
+        if key == "modality":
+            return self._modalities[code]
+        if key == "day":
+            return np.datetime64(int(code), "D").astype(date)
+        if key == "month":
+            return np.datetime64(int(code), "M").astype(date)
+        if key in ("is_credit_plan", "credit_payment"):
+            return bool(code)
+        return self._entry_types[code]
+
+    def group_by_modality(self) -> Dict[str, Dict[str, Any]]:
+        """{modality_id: {"total": float, "count": int}}"""
+        return {
+            row["modality"]: {"total": row["total"], "count": row["count"]}
+            for row in self.group_by("modality")
+        }
+
+    def group_by_day(self) -> Dict[date, Dict[str, Any]]:
+        """{dia: {"total": float, "count": int}}"""
+        return {
+            row["day"]: {"total": row["total"], "count": row["count"]}
+            for row in self.group_by("day")
+        }
+
+    def records(self) -> List[dict]:
+        """Linhas no formato da API (dicts), sem materializar FinancialEntry"""
+        records = []
+        for position in self._positions:
+            item = self._source[int(position)]
+            records.append(item.to_dict() if isinstance(item, FinancialEntry) else item)
+        return records
+
+    # Sequence[FinancialEntry]
+
+    def _row(self, index: int) -> FinancialEntry:
+        position = int(self._positions[index])
+        entry = self._rows_cache.get(position)
+        if entry is None:
+            item = self._source[position]
+            entry = item if isinstance(item, FinancialEntry) else FinancialEntry.from_dict(item)
+            self._rows_cache[position] = entry
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.filter(np.arange(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("EntryFrame index out of range")
+        return self._row(index)
+
+    def _materialize(self) -> None:
+        # Decodifica de uma vez todas as linhas ainda não acessadas
+        missing = [
+            int(position)
+            for position in self._positions
+            if int(position) not in self._rows_cache
+        ]
+        records = [self._source[position] for position in missing]
+        if not records or isinstance(records[0], FinancialEntry):
+            return
+        for position, entry in zip(missing, decode_financial_entries(records)):
+            self._rows_cache[position] = entry
+
+    def __iter__(self) -> Iterator[FinancialEntry]:
+        self._materialize()
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def __repr__(self) -> str:
+        return f"EntryFrame({len(self)} lançamentos, total={self.total():.2f})"
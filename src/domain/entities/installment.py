@@ -1,9 +1,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
+from domain.entities.timestamps import parse_date, parse_datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Installment:
     financial_entry_id: str
     installment_number: int
@@ -38,7 +39,7 @@ class Installment:
             installment_number=data["installment_number"],
             total_installments=data["total_installments"],
             amount=float(data["amount"]),
-            due_date=Installment._parse_datetime(data["due_date"]),
+            due_date=parse_date(data["due_date"]),
             is_paid=data.get("is_paid", False),
             payment_date=Installment._parse_datetime(data.get("payment_date")),
             created_at=Installment._parse_datetime(data.get("created_at")),
@@ -47,11 +48,7 @@ class Installment:
 
     @staticmethod
     def _parse_datetime(value) -> Optional[datetime]:
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return parse_datetime(value)
 
     def mark_as_paid(self, payment_date: Optional[datetime] = None) -> None:
         self.is_paid = True
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentModality:
     name: str
     color: str = "#9333EA"
@@ -18,6 +18,11 @@ class PaymentModality:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
+    @property
+    def display_name(self) -> str:
+        """Nome com o banco, quando houver (ex.: Pix (Nubank))"""
+        return f"{self.name} ({self.bank_name})" if self.bank_name else self.name
+
     def to_dict(self) -> dict:
         return {
             "id": self.id,
@@ -0,0 +1,51 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+# A partir do Python 3.11 fromisoformat já aceita o sufixo "Z"
+_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
+def _parse_iso(value: str) -> datetime:
+    if _ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# Datas de lançamento/vencimento se repetem muito (poucas dezenas de dias
+# distintos por período); datetime é imutável, então a instância é compartilhada
+_parse_iso_cached = lru_cache(maxsize=4096)(_parse_iso)
+
+
+def parse_datetime(value) -> Optional[datetime]:
+    """Converte string ISO (com ou sem 'Z') para datetime"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_iso(value)
+    return None
+
+
+def parse_date(value) -> Optional[datetime]:
+    """Como parse_datetime, memoizando strings repetidas (campos de data do negócio)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_iso_cached(value)
+    return None
+
+
+def parse_date_required(value) -> datetime:
+    if value is None:
+        raise ValueError("Data é obrigatória")
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, str):
+        return _parse_iso_cached(value)
+    raise ValueError(f"Data inválida: {value}")
@@ -0,0 +1,131 @@
+"""
+Valores em reais: formatação ("R$ 1.234,56") e leitura de planilhas
+
+- format_brl / parse_brl: um valor por vez (cards, rótulos, linhas do CLI)
+- format_brl_array: arrays NumPy / Series do pandas inteiros (tabelas, exportações)
+"""
+import re
+from typing import Any, Optional
+import numpy as np
+import pandas as pd
+
+
+# Valores que as planilhas usam para célula sem valor
+EMPTY_VALUES = frozenset({"", "-", "r$", "r$-"})
+
+# Sem vírgula, o ponto só é decimal com 1 ou 2 casas (1234.5, 1234.56);
+# em grupos de 3 dígitos é separador de milhar (1.234, 1.234.567)
+_DOT_THOUSANDS = re.compile(r"\d{1,3}(?:\.\d{3})+")
+_DOT_DECIMAL = re.compile(r"\d+\.\d{1,2}")
+
+# Maior parte inteira formatável (centavos em int64)
+_MAX_DIGITS = 16
+_POWERS = 10 ** np.arange(1, _MAX_DIGITS + 1, dtype=np.int64)
+
+_SPACE, _ZERO, _DOT, _COMMA, _MINUS = (ord(c) for c in " 0.,-")
+
+
+def format_brl(value: float) -> str:
+    """1234.5 -> "R$ 1.234,50" (negativos: "R$ -1.234,50")"""
+    # "_" como separador de milhar: duas trocas em vez de três
+    return f"R$ {value:_.2f}".replace(".", ",").replace("_", ".")
+
+
+def format_brl_array(values: Any) -> Any:
+    """
+    format_brl para um array inteiro, sem um f-string por valor
+
+    Os centavos (int64) são escritos dígito a dígito, com pontos, vírgula,
+    sinal e "R$ ", em uma matriz de caracteres alinhada à direita (uma linha
+    da matriz por posição do texto); cada coluna vira uma string no final.
+    Series do pandas voltam como Series com o mesmo índice; o resto vira
+    np.ndarray de str com o formato da entrada.
+    """
+    if isinstance(values, pd.Series):
+        return pd.Series(
+            format_brl_array(values.to_numpy(dtype=float)), index=values.index, dtype=object
+        )
+
+    values = np.asarray(values, dtype=float)
+    shape = values.shape
+    values = values.ravel()
+    if not len(values):
+        return np.array([], dtype=str).reshape(shape)
+    if not np.isfinite(values).all():
+        raise ValueError("Valores em reais não podem ser NaN ou infinitos")
+
+    scaled = np.abs(values) * 100
+    cents = np.rint(scaled).astype(np.int64)
+    # Meio centavo: o f-string arredonda pelo valor binário exato, então
+    # esses (raros) valores usam o arredondamento do Python
+    for index in np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6).tolist():
+        cents[index] = int(f"{abs(values[index]):.2f}".replace(".", ""))
+    reais, fraction = np.divmod(cents, 100)
+    digits = np.searchsorted(_POWERS, reais, side="right") + 1
+    widest = int(digits.max())
+    if widest > _MAX_DIGITS:
+        raise ValueError("Valor grande demais para formatar em reais")
+
+    # "R$ " + sinal + dígitos + pontos de milhar + ",00"
+    width = 4 + widest + (widest - 1) // 3 + 3
+    text = np.full((width, len(values)), _SPACE, dtype=np.uint8)
+    text[-1] = _ZERO + fraction % 10
+    text[-2] = _ZERO + fraction // 10
+    text[-3] = _COMMA
+
+    row = width - 4
+    rest = reais
+    for position in range(widest):
+        present = digits > position
+        if position and position % 3 == 0:
+            text[row] = np.where(present, _DOT, _SPACE)
+            row -= 1
+        rest, digit = np.divmod(rest, 10)
+        text[row] = np.where(present, _ZERO + digit, _SPACE)
+        row -= 1
+
+    # Sinal e "R$ " logo antes do primeiro dígito (onde o f-string os põe)
+    columns = np.arange(len(values))
+    start = width - 4 - digits - (digits - 1) // 3
+    negative = np.signbit(values)
+    text[start[negative], columns[negative]] = _MINUS
+    start -= negative
+    for offset, char in enumerate(b"R$ "):
+        text[start - 2 + offset, columns] = char
+
+    # Uma string UTF-32 por coluna da matriz, sem decodificar byte a byte
+    strings = np.ascontiguousarray(text.T, dtype=np.uint32).view(f"U{width}").ravel()
+    return np.char.lstrip(strings).reshape(shape)
+
+
+def parse_brl(text: Optional[str]) -> Optional[float]:
+    """
+    Valor em reais: R$ 1.234,56, -R$ 4.037,61, 1234,56, R$ 1.234 ou 1234.56
+
+    Com vírgula, ela é o separador decimal e os pontos são de milhar. Sem
+    vírgula, "1.234" e "1.234.567" são milhares e o ponto só é decimal em
+    "1234.5" / "1234.56"; outros usos do ponto ("1.2345") são ambíguos.
+    Célula vazia (ou -, \\) é None; texto que não é valor levanta ValueError.
+    """
+    text = (text or "").replace(" ", "").replace("\xa0", "")
+    if text.strip("\\").casefold() in EMPTY_VALUES:
+        return None
+    # Sinal antes ou depois do "R$" (-R$ 4,00 / R$ -4,00)
+    text = text.replace("R$", "")
+    negative = text.startswith("-")
+    text = text.lstrip("-")
+    if "," in text:
+        integer, _, fraction = text.partition(",")
+        integer = integer.replace(".", "")
+    elif "." not in text or _DOT_DECIMAL.fullmatch(text):
+        integer, _, fraction = text.partition(".")
+    elif _DOT_THOUSANDS.fullmatch(text):
+        integer, fraction = text.replace(".", ""), ""
+    else:
+        raise ValueError(f"Valor inválido: {text!r}")
+    # Só dígitos dos dois lados (float aceitaria "1e5", "inf", "1_000"...)
+    digits = integer + fraction
+    if not (digits.isascii() and digits.isdecimal()):
+        raise ValueError(f"Valor inválido: {text!r}")
+    value = float(f"{integer}.{fraction}")
+    return -value if negative else value
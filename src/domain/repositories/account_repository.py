@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from domain.entities.account import Account
+from domain.entities.bulk_result import BulkResult
 
 
 class AccountRepository(ABC):
@@ -9,12 +10,58 @@ class AccountRepository(ABC):
     def create(self, value: float, date: datetime, description: str, account_type: str) -> Account:
         pass
 
+    def create_many(
+        self, accounts: Sequence[Account], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        """
+        Cria várias contas; o erro de uma linha não interrompe as demais
+
+        idempotency_keys identifica cada linha para que um reenvio não crie
+        a mesma conta duas vezes (quando a origem suporta). Implementação
+        padrão: uma chamada a create por linha, em sequência.
+        """
+        result = BulkResult(total=len(accounts))
+        for index, account in enumerate(accounts):
+            try:
+                result.succeeded[index] = self.create(
+                    account.value, account.date, account.description, account.type
+                )
+            except Exception as e:
+                result.errors[index] = str(e)
+        return result
+
     @abstractmethod
     def list_all(
-        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_type: Optional[str] = None,
     ) -> List[Account]:
         pass
 
+    @property
+    def supports_type_filter(self) -> bool:
+        """Se o filtro por tipo é aplicado na origem (sem baixar os outros tipos)"""
+        return False
+
+    def update_many(self, updates: Sequence[Tuple[str, Dict[str, Any]]]) -> BulkResult:
+        """
+        Atualiza várias contas: (account_id, campos de update) por linha
+
+        Implementação padrão: uma chamada a update por linha, em sequência.
+        """
+        result = BulkResult(total=len(updates))
+        for index, (account_id, fields) in enumerate(updates):
+            try:
+                result.succeeded[index] = self.update(account_id, **fields)
+            except Exception as e:
+                result.errors[index] = str(e)
+        return result
+
+    @abstractmethod
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        pass
+
     @abstractmethod
     def delete(self, account_id: str) -> bool:
         pass
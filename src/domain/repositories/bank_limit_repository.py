@@ -2,8 +2,9 @@
 Bank Limit Repository interface
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Sequence
 from domain.entities.bank_limit import BankLimit
+from domain.entities.bulk_result import BulkResult
 
 
 class BankLimitRepository(ABC):
@@ -39,6 +40,24 @@ class BankLimitRepository(ABC):
         """Update a bank limit"""
         pass
 
+    def update_many(self, limits: Sequence[BankLimit]) -> BulkResult:
+        """
+        Update several bank limits (each one with its id)
+
+        Implementação padrão: uma chamada a update por limite, em sequência.
+        """
+        result = BulkResult(total=len(limits))
+        for index, limit in enumerate(limits):
+            try:
+                result.succeeded[index] = self.update(
+                    limit.id, limit.bank_name, limit.rotativo_available, limit.rotativo_used,
+                    limit.cheque_available, limit.cheque_used, limit.rotativo_rate,
+                    limit.cheque_rate, limit.interest_rate,
+                )
+            except Exception as e:
+                result.errors[index] = str(e)
+        return result
+
     @abstractmethod
     def delete(self, limit_id: str) -> bool:
         """Delete a bank limit"""
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from datetime import datetime
-from domain.entities import FinancialEntry
+from domain.entities import FinancialEntry, EntryFrame
+from domain.entities.bulk_result import BulkResult
 
 
 class FinancialEntryRepository(ABC):
@@ -15,14 +16,65 @@ class FinancialEntryRepository(ABC):
     ) -> Dict[str, Any]:
         pass
 
+    def create_many(
+        self, entries: Sequence[FinancialEntry], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        """
+        Cria vários lançamentos à vista; o erro de uma linha não interrompe as demais
+
+        entry.credit_payment marca recebimentos de crediário. succeeded guarda
+        o FinancialEntry criado de cada linha. Implementação padrão: uma
+        chamada a create por linha, em sequência.
+        """
+        result = BulkResult(total=len(entries))
+        for index, entry in enumerate(entries):
+            try:
+                result.succeeded[index] = self.create(
+                    entry, is_credit_payment=entry.credit_payment
+                )["entry"]
+            except Exception as e:
+                result.errors[index] = str(e)
+        return result
+
     @abstractmethod
     def get_all(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List[FinancialEntry]:
+    ) -> EntryFrame:
         pass
 
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Soma e contagem dos lançamentos do período, agrupadas por group_by
+
+        Mesmo formato de EntryFrame.group_by (chaves do grupo + total e count).
+        A implementação padrão agrega localmente sobre get_all.
+        """
+        return self.get_all(start_date, end_date).group_by(*group_by)
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        """True quando aggregate não precisa baixar os lançamentos do período"""
+        return False
+
+    @property
+    def supports_incremental_sync(self) -> bool:
+        """
+        True quando o repositório tem get_changes(since)
+
+        get_changes retorna os lançamentos criados/alterados/excluídos desde
+        o watermark since (sem since, o histórico completo) como
+        {"entries": [dict], "deleted": [id], "watermark": str | None},
+        ou None quando o backend não oferece a rota.
+        """
+        return False
+
     @abstractmethod
     def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
         pass
@@ -1,4 +1,11 @@
 from .payment_modality_api_repository import PaymentModalityAPIRepository
 from .financial_entry_api_repository import FinancialEntryAPIRepository
+from .async_payment_modality_api_repository import AsyncPaymentModalityAPIRepository
+from .async_financial_entry_api_repository import AsyncFinancialEntryAPIRepository
 
-__all__ = ["PaymentModalityAPIRepository", "FinancialEntryAPIRepository"]
+__all__ = [
+    "PaymentModalityAPIRepository",
+    "FinancialEntryAPIRepository",
+    "AsyncPaymentModalityAPIRepository",
+    "AsyncFinancialEntryAPIRepository",
+]
@@ -1,8 +1,17 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
 from domain.entities.account import Account
+from domain.entities.bulk_result import BulkResult
+from domain.entities.decoding import decode_accounts
 from domain.repositories.account_repository import AccountRepository
-from infrastructure.http import HTTPClient
+from infrastructure.http import HTTPClient, APIError
+from infrastructure.api.bulk import send_bulk
+
+
+# base_url dos backends sem GET /api/accounts/{id} (compartilhado entre sessões)
+_get_by_id_unsupported = set()
+# base_url dos backends que ignoram o parâmetro type da listagem
+_type_filter_unsupported = set()
 
 
 class AccountAPIRepository(AccountRepository):
@@ -11,28 +20,75 @@ class AccountAPIRepository(AccountRepository):
         self.base_endpoint = "/api/accounts"
 
     def create(self, value: float, date: datetime, description: str, account_type: str) -> Account:
-        data = {
-            "value": value,
-            "date": date.isoformat(),
-            "description": description,
-            "type": account_type,
-        }
+        data = self._payload(Account(value, date, description, account_type))
         response = self.http_client.post(self.base_endpoint, data=data)
         return Account.from_dict(response)
 
-    def list_all(
-        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
-    ) -> List[Account]:
-        params = {}
-        if start_date:
-            params["start_date"] = start_date.isoformat()
-        if end_date:
-            params["end_date"] = end_date.isoformat()
+    @staticmethod
+    def _payload(account: Account) -> Dict[str, Any]:
+        data = {
+            "value": account.value,
+            "date": account.date.isoformat(),
+            "description": account.description,
+            "type": account.type,
+        }
+        # Contas importadas já quitadas (ex.: despesas antigas)
+        if account.paid:
+            data["paid"] = True
+        return data
 
-        response = self.http_client.get(self.base_endpoint, params=params)
-        return [Account.from_dict(account) for account in response]
+    def create_many(
+        self, accounts: Sequence[Account], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        """
+        POST /api/accounts/bulk com todas as linhas em uma requisição
 
-    def update(self, account_id: str, paid: bool = None, value: float = None, date: datetime = None, description: str = None) -> Account:
+        Sem o endpoint, um POST por linha (em paralelo limitado). Cada linha
+        leva a sua chave de idempotência: campo idempotency_key no lote,
+        header Idempotency-Key no POST individual.
+        """
+        return send_bulk(
+            self.http_client,
+            "post",
+            f"{self.base_endpoint}/bulk",
+            "accounts",
+            [
+                {**self._payload(account), "idempotency_key": key}
+                for account, key in zip(accounts, idempotency_keys)
+            ],
+            lambda item: Account.from_dict(item.get("account", item)),
+            lambda index: Account.from_dict(
+                self.http_client.post(
+                    self.base_endpoint,
+                    self._payload(accounts[index]),
+                    headers={"Idempotency-Key": idempotency_keys[index]},
+                )
+            ),
+            "accounts-bulk",
+        )
+
+    def update_many(self, updates: Sequence[Tuple[str, Dict[str, Any]]]) -> BulkResult:
+        """
+        PATCH /api/accounts/bulk com {"accounts": [{"id": ..., <campos>}]}
+
+        Sem o endpoint, um PATCH por conta (em paralelo limitado).
+        """
+        rows = [{"id": account_id, **self._update_payload(**fields)} for account_id, fields in updates]
+        return send_bulk(
+            self.http_client,
+            "patch",
+            f"{self.base_endpoint}/bulk",
+            "accounts",
+            rows,
+            lambda item: Account.from_dict(item.get("account", item)),
+            lambda index: self.update(updates[index][0], **updates[index][1]),
+            "accounts-bulk",
+        )
+
+    @staticmethod
+    def _update_payload(
+        paid: bool = None, value: float = None, date: datetime = None, description: str = None
+    ) -> Dict[str, Any]:
         data = {}
         if paid is not None:
             data["paid"] = paid
@@ -42,7 +98,58 @@ class AccountAPIRepository(AccountRepository):
             data["date"] = date.isoformat()
         if description is not None:
             data["description"] = description
+        return data
+
+    def list_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_type: Optional[str] = None,
+    ) -> List[Account]:
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+        if account_type and self.supports_type_filter:
+            params["type"] = account_type
+
+        response = self.http_client.get(self.base_endpoint, params=params)
+        if account_type:
+            # Backend sem o filtro devolve todos os tipos: filtra aqui e lembra
+            filtered = [item for item in response if item.get("type") == account_type]
+            if "type" in params and len(filtered) < len(response):
+                _type_filter_unsupported.add(self.http_client.base_url)
+            response = filtered
+        return decode_accounts(response)
+
+    @property
+    def supports_type_filter(self) -> bool:
+        return self.http_client.base_url not in _type_filter_unsupported
 
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        """
+        GET /api/accounts/{id}; None se a conta não existe (404)
+
+        405/501 indicam backend sem a rota (as contas só têm PATCH/DELETE
+        por id): procura na listagem e lembra disso para as próximas
+        chamadas. Outros erros sobem.
+        """
+        if self.http_client.base_url not in _get_by_id_unsupported:
+            try:
+                response = self.http_client.get(f"{self.base_endpoint}/{account_id}")
+                return Account.from_dict(response)
+            except APIError as e:
+                if e.status_code == 404:
+                    return None
+                if e.status_code not in (405, 501):
+                    raise
+                _get_by_id_unsupported.add(self.http_client.base_url)
+
+        return next((a for a in self.list_all() if a.id == account_id), None)
+
+    def update(self, account_id: str, paid: bool = None, value: float = None, date: datetime = None, description: str = None) -> Account:
+        data = self._update_payload(paid, value, date, description)
         response = self.http_client.patch(f"{self.base_endpoint}/{account_id}", data=data)
         return Account.from_dict(response)
 
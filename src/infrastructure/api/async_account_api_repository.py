@@ -0,0 +1,53 @@
+from typing import List, Optional
+from datetime import datetime
+from domain.entities.account import Account
+from domain.entities.decoding import decode_accounts
+from infrastructure.http import AsyncHTTPClient
+from infrastructure.api.account_api_repository import AccountAPIRepository
+
+
+class AsyncAccountAPIRepository:
+    """Mesmos métodos do AccountAPIRepository, como corrotinas"""
+
+    def __init__(self, http_client: AsyncHTTPClient):
+        self.http_client = http_client
+        self.base_endpoint = "/api/accounts"
+
+    _payload = staticmethod(AccountAPIRepository._payload)
+    _update_payload = staticmethod(AccountAPIRepository._update_payload)
+
+    async def create(self, value: float, date: datetime, description: str, account_type: str) -> Account:
+        data = self._payload(Account(value, date, description, account_type))
+        response = await self.http_client.post(self.base_endpoint, data=data)
+        return Account.from_dict(response)
+
+    async def list_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_type: Optional[str] = None,
+    ) -> List[Account]:
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.isoformat()
+        if end_date:
+            params["end_date"] = end_date.isoformat()
+        if account_type:
+            params["type"] = account_type
+
+        response = await self.http_client.get(self.base_endpoint, params=params)
+        if account_type:
+            response = [item for item in response if item.get("type") == account_type]
+        return decode_accounts(response)
+
+    async def update(self, account_id: str, paid: bool = None, value: float = None, date: datetime = None, description: str = None) -> Account:
+        data = self._update_payload(paid, value, date, description)
+        response = await self.http_client.patch(f"{self.base_endpoint}/{account_id}", data=data)
+        return Account.from_dict(response)
+
+    async def delete(self, account_id: str) -> bool:
+        try:
+            await self.http_client.delete(f"{self.base_endpoint}/{account_id}")
+            return True
+        except Exception:
+            return False
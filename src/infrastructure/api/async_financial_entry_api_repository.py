@@ -0,0 +1,112 @@
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import datetime
+from domain.entities import FinancialEntry, EntryFrame
+from domain.entities.entry_frame import GROUP_KEYS
+from infrastructure.http import AsyncHTTPClient, APIError
+from infrastructure.api.financial_entry_api_repository import (
+    FinancialEntryAPIRepository,
+    _aggregate_route,
+)
+
+
+class AsyncFinancialEntryAPIRepository:
+    """
+    Mesmos métodos do FinancialEntryAPIRepository, como corrotinas
+
+    Compartilha com a versão síncrona o registro de backends sem o endpoint
+    de agregação (e o payload/parsing), então as duas tomam a mesma decisão
+    de fallback.
+    """
+
+    _payload = staticmethod(FinancialEntryAPIRepository._payload)
+    _parse_groups = staticmethod(FinancialEntryAPIRepository._parse_groups)
+
+    def __init__(self, http_client: AsyncHTTPClient):
+        self.http_client = http_client
+        self.base_endpoint = "/api/financial-entries"
+
+    async def create(
+        self,
+        entry: FinancialEntry,
+        installments_count: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        is_credit_payment: bool = False,
+    ) -> Dict[str, Any]:
+        data = self._payload(entry)
+        if installments_count is not None:
+            data["installments_count"] = installments_count
+        if start_date is not None:
+            data["start_date"] = start_date.isoformat()
+        if is_credit_payment:
+            data["is_credit_payment"] = is_credit_payment
+
+        response = await self.http_client.post(self.base_endpoint, data)
+        return {
+            "entry": FinancialEntry.from_dict(response["entry"]),
+            "installments": response.get("installments", []),
+        }
+
+    async def get_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> EntryFrame:
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.strftime("%Y-%m-%d")
+        if end_date:
+            params["end_date"] = end_date.strftime("%Y-%m-%d")
+
+        response = await self.http_client.get(self.base_endpoint, params=params)
+        return EntryFrame.from_records(response)
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        return _aggregate_route.available(self.http_client.base_url)
+
+    async def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        invalid = [key for key in group_by if key not in GROUP_KEYS]
+        if invalid:
+            raise ValueError(f"Agrupamento inválido: {', '.join(invalid)}")
+
+        if not self.supports_remote_aggregation:
+            return (await self.get_all(start_date, end_date)).group_by(*group_by)
+
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.strftime("%Y-%m-%d")
+        if end_date:
+            params["end_date"] = end_date.strftime("%Y-%m-%d")
+        if group_by:
+            params["group_by"] = ",".join(group_by)
+
+        try:
+            response = await self.http_client.get(
+                f"{self.base_endpoint}/aggregate", params=params
+            )
+        except APIError as e:
+            if not _aggregate_route.reject(self.http_client.base_url, e):
+                raise
+            return (await self.get_all(start_date, end_date)).group_by(*group_by)
+        _aggregate_route.confirm(self.http_client.base_url)
+        return self._parse_groups(response, group_by)
+
+    async def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
+        try:
+            response = await self.http_client.get(f"{self.base_endpoint}/{entry_id}")
+            return FinancialEntry.from_dict(response)
+        except Exception:
+            return None
+
+    async def update(self, entry_id: str, entry: FinancialEntry) -> FinancialEntry:
+        data = self._payload(entry)
+        response = await self.http_client.put(f"{self.base_endpoint}/{entry_id}", data)
+        return FinancialEntry.from_dict(response)
+
+    async def delete(self, entry_id: str) -> bool:
+        return await self.http_client.delete(f"{self.base_endpoint}/{entry_id}")
@@ -0,0 +1,59 @@
+from typing import List, Optional, Dict, Any
+from datetime import datetime
+from domain.entities.installment import Installment
+from domain.entities.decoding import decode_installments
+from infrastructure.http import AsyncHTTPClient
+
+
+class AsyncInstallmentAPIRepository:
+    """Mesmos métodos do InstallmentAPIRepository, como corrotinas"""
+
+    def __init__(self, http_client: AsyncHTTPClient):
+        self.http_client = http_client
+        self.base_endpoint = "/api/installments"
+
+    async def get_by_financial_entry(self, financial_entry_id: str) -> List[Installment]:
+        response = await self.http_client.get(
+            self.base_endpoint, params={"financial_entry_id": financial_entry_id}
+        )
+        return decode_installments(response)
+
+    async def get_by_id(self, installment_id: str) -> Optional[Installment]:
+        try:
+            response = await self.http_client.get(f"{self.base_endpoint}/{installment_id}")
+            return Installment.from_dict(response)
+        except Exception:
+            return None
+
+    async def pay_installment(
+        self, installment_id: str, payment_date: Optional[datetime] = None
+    ) -> Installment:
+        data = {}
+        if payment_date:
+            data["payment_date"] = payment_date.isoformat()
+
+        response = await self.http_client.patch(
+            f"{self.base_endpoint}/{installment_id}/pay", data=data
+        )
+        return Installment.from_dict(response)
+
+    async def unpay_installment(self, installment_id: str) -> Installment:
+        response = await self.http_client.patch(
+            f"{self.base_endpoint}/{installment_id}/unpay", data={}
+        )
+        return Installment.from_dict(response)
+
+    async def get_daily_summary(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.strftime("%Y-%m-%d")
+        if end_date:
+            params["end_date"] = end_date.strftime("%Y-%m-%d")
+
+        return await self.http_client.get(
+            f"{self.base_endpoint}/daily-summary", params=params
+        )
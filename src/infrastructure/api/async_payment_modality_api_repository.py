@@ -0,0 +1,46 @@
+from typing import List, Optional
+from domain.entities import PaymentModality
+from infrastructure.http import AsyncHTTPClient
+from infrastructure.api.payment_modality_api_repository import PaymentModalityAPIRepository
+
+
+class AsyncPaymentModalityAPIRepository:
+    """Mesmos métodos do PaymentModalityAPIRepository, como corrotinas"""
+
+    def __init__(self, http_client: AsyncHTTPClient):
+        self.http_client = http_client
+        self.base_endpoint = "/api/payment-modalities"
+
+    _payload = staticmethod(PaymentModalityAPIRepository._payload)
+
+    async def create(self, modality: PaymentModality) -> PaymentModality:
+        response = await self.http_client.post(self.base_endpoint, self._payload(modality))
+        return PaymentModality.from_dict(response)
+
+    async def get_all(self, only_active: bool = False) -> List[PaymentModality]:
+        endpoint = f"{self.base_endpoint}?only_active={'true' if only_active else 'false'}"
+        response = await self.http_client.get(endpoint)
+        return [PaymentModality.from_dict(item) for item in response]
+
+    async def get_by_id(self, modality_id: str) -> Optional[PaymentModality]:
+        try:
+            response = await self.http_client.get(f"{self.base_endpoint}/{modality_id}")
+            return PaymentModality.from_dict(response)
+        except Exception:
+            return None
+
+    async def update(self, modality_id: str, modality: PaymentModality) -> PaymentModality:
+        response = await self.http_client.put(
+            f"{self.base_endpoint}/{modality_id}", self._payload(modality)
+        )
+        return PaymentModality.from_dict(response)
+
+    async def delete(self, modality_id: str) -> bool:
+        return await self.http_client.delete(f"{self.base_endpoint}/{modality_id}")
+
+    async def toggle(self, modality_id: str) -> PaymentModality:
+        response = await self.http_client.patch(
+            f"{self.base_endpoint}/{modality_id}/toggle",
+            data={}
+        )
+        return PaymentModality.from_dict(response)
@@ -28,38 +28,26 @@ class AuthAPIRepository(AuthRepository):
 
     def get_current_user(self, token: str) -> User:
         """Get current user via API"""
-        # Temporarily set token for this request
-        original_token = self._http_client._auth_token
-        self._http_client.set_auth_token(token)
-
-        try:
-            response = self._http_client.get("/api/auth/me")
-            return User(
-                id=response["user_id"],
-                email=response["email"],
-                name=response["name"],
-                company_id=response["company_id"],
-                role_ids=response.get("roles", []),
-                features=response.get("features", []),
-                is_super_admin=response.get("is_super_admin", False),
-                is_active=True,
-            )
-        finally:
-            # Restore original token
-            self._http_client.set_auth_token(original_token)
+        # Cliente temporário com o token informado (não altera o token da sessão)
+        response = self._http_client.with_token(token).get("/api/auth/me")
+        return User(
+            id=response["user_id"],
+            email=response["email"],
+            name=response["name"],
+            company_id=response["company_id"],
+            role_ids=response.get("roles", []),
+            features=response.get("features", []),
+            is_super_admin=response.get("is_super_admin", False),
+            is_active=True,
+        )
 
     def impersonate_company(self, company_id: str, token: str) -> ImpersonateToken:
         """Impersonate company via API"""
-        # Temporarily set token for this request
-        original_token = self._http_client._auth_token
-        self._http_client.set_auth_token(token)
-
-        try:
-            response = self._http_client.post(f"/api/admin/impersonate/{company_id}", {})
-            return ImpersonateToken.from_dict(response)
-        finally:
-            # Restore original token
-            self._http_client.set_auth_token(original_token)
+        # Cliente temporário com o token informado (não altera o token da sessão)
+        response = self._http_client.with_token(token).post(
+            f"/api/admin/impersonate/{company_id}", {}
+        )
+        return ImpersonateToken.from_dict(response)
 
     def change_password(self, current_password: str, new_password: str) -> bool:
         """Change password via API"""
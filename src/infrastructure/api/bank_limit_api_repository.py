@@ -1,7 +1,9 @@
-from typing import List
+from typing import Any, Dict, List, Sequence
 from domain.entities.bank_limit import BankLimit
+from domain.entities.bulk_result import BulkResult
 from domain.repositories.bank_limit_repository import BankLimitRepository
 from infrastructure.http import HTTPClient
+from infrastructure.api.bulk import send_bulk
 
 
 class BankLimitAPIRepository(BankLimitRepository):
@@ -62,6 +64,40 @@ class BankLimitAPIRepository(BankLimitRepository):
         response = self.http_client.put(f"{self.base_endpoint}/{limit_id}", data=data)
         return BankLimit.from_dict(response)
 
+    def update_many(self, limits: Sequence[BankLimit]) -> BulkResult:
+        """
+        PUT /api/bank-limits/bulk com {"bank_limits": [{"id": ..., <campos>}]}
+
+        Sem o endpoint, um PUT por limite (em paralelo limitado).
+        """
+        return send_bulk(
+            self.http_client,
+            "put",
+            f"{self.base_endpoint}/bulk",
+            "bank_limits",
+            [{"id": limit.id, **self._payload(limit)} for limit in limits],
+            lambda item: BankLimit.from_dict(item.get("bank_limit", item)),
+            lambda index: BankLimit.from_dict(
+                self.http_client.put(
+                    f"{self.base_endpoint}/{limits[index].id}", data=self._payload(limits[index])
+                )
+            ),
+            "bank-limits-bulk",
+        )
+
+    @staticmethod
+    def _payload(limit: BankLimit) -> Dict[str, Any]:
+        return {
+            "bank_name": limit.bank_name,
+            "rotativo_available": limit.rotativo_available,
+            "rotativo_used": limit.rotativo_used,
+            "cheque_available": limit.cheque_available,
+            "cheque_used": limit.cheque_used,
+            "rotativo_rate": limit.rotativo_rate,
+            "cheque_rate": limit.cheque_rate,
+            "interest_rate": limit.interest_rate,
+        }
+
     def delete(self, limit_id: str) -> bool:
         try:
             self.http_client.delete(f"{self.base_endpoint}/{limit_id}")
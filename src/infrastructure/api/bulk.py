@@ -0,0 +1,74 @@
+from typing import Any, Callable, Dict, List
+from domain.entities.bulk_result import BulkResult
+from infrastructure.concurrency import map_bounded
+from infrastructure.http import HTTPClient, APIError
+from infrastructure.api.optional_route import OptionalRoute
+
+
+# Requisições individuais simultâneas quando não há endpoint de lote
+BULK_MAX_WORKERS = 4
+
+# (base_url, endpoint) dos lotes que o backend oferece ou não (compartilhado entre sessões).
+# Sem 400: um lote recusado por validação não pode virar um POST por linha
+_bulk_route = OptionalRoute(missing_status=frozenset({404, 405, 422}))
+
+
+def parse_bulk_response(
+    response: Any, total: int, parse_item: Callable[[dict], Any], items_key: str
+) -> BulkResult:
+    """
+    Aceita a lista de itens processados (na ordem enviada) ou
+    {items_key: [...], "errors": [{"index": i, "error": "..."}]}; itens com
+    "index" são associados a essa linha.
+    """
+    result = BulkResult(total=total)
+    if isinstance(response, list):
+        response = {items_key: response}
+
+    for error in response.get("errors") or []:
+        result.errors[int(error["index"])] = str(error.get("error") or error.get("detail") or error)
+
+    pending = (index for index in range(total) if index not in result.errors)
+    for item in response.get(items_key) or []:
+        index = int(item["index"]) if "index" in item else next(pending)
+        result.succeeded[index] = parse_item(item)
+    return result
+
+
+def send_bulk(
+    http_client: HTTPClient,
+    method: str,
+    endpoint: str,
+    items_key: str,
+    rows: List[Dict[str, Any]],
+    parse_item: Callable[[dict], Any],
+    fallback: Callable[[int], Any],
+    name: str = "bulk",
+) -> BulkResult:
+    """
+    Envia todas as linhas em uma requisição ({items_key: rows})
+
+    Se a primeira chamada ao endpoint voltar 404/405/422 (sem a rota,
+    /bulk cai em /{id}), lembra disso e chama fallback(índice) para cada
+    linha, com até BULK_MAX_WORKERS em paralelo. Qualquer outro erro (5xx,
+    autenticação, sem resposta) é reportado em todas as linhas sem
+    reenviar nada: o servidor pode já ter gravado o lote, e reenviar linha
+    a linha duplicaria os registros.
+    """
+    if not rows:
+        return BulkResult()
+
+    key = (http_client.base_url, endpoint)
+    if _bulk_route.available(key):
+        try:
+            response = getattr(http_client, method)(endpoint, {items_key: rows})
+        except APIError as e:
+            if not _bulk_route.reject(key, e):
+                return BulkResult(total=len(rows), errors={i: str(e) for i in range(len(rows))})
+        except Exception as e:
+            return BulkResult(total=len(rows), errors={i: str(e) for i in range(len(rows))})
+        else:
+            _bulk_route.confirm(key)
+            return parse_bulk_response(response, len(rows), parse_item, items_key)
+
+    return map_bounded(fallback, range(len(rows)), BULK_MAX_WORKERS, name)
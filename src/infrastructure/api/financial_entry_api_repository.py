@@ -1,8 +1,17 @@
-from typing import List, Optional, Dict, Any
-from datetime import datetime
-from domain.entities import FinancialEntry
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import date, datetime
+from domain.entities import FinancialEntry, EntryFrame
+from domain.entities.bulk_result import BulkResult
+from domain.entities.entry_frame import GROUP_KEYS
 from domain.repositories import FinancialEntryRepository
-from infrastructure.http import HTTPClient
+from infrastructure.http import HTTPClient, APIError
+from infrastructure.api.bulk import send_bulk
+from infrastructure.api.optional_route import OptionalRoute
+
+
+# Backends (base_url) com/sem endpoints de agregação e changes (compartilhado entre sessões)
+_aggregate_route = OptionalRoute()
+_changes_route = OptionalRoute()
 
 
 class FinancialEntryAPIRepository(FinancialEntryRepository):
@@ -24,11 +33,7 @@ class FinancialEntryAPIRepository(FinancialEntryRepository):
         - entry: FinancialEntry
         - installments: List[dict] (raw installment data from API)
         """
-        data = {
-            "value": entry.value,
-            "date": entry.date.strftime("%Y-%m-%d"),
-            "modality_id": entry.modality_id,
-        }
+        data = self._payload(entry)
 
         # Add installments data if provided
         if installments_count is not None:
@@ -46,11 +51,53 @@ class FinancialEntryAPIRepository(FinancialEntryRepository):
             "installments": response.get("installments", []),
         }
 
+    @staticmethod
+    def _payload(entry: FinancialEntry) -> Dict[str, Any]:
+        return {
+            "value": entry.value,
+            "date": entry.date.strftime("%Y-%m-%d"),
+            "modality_id": entry.modality_id,
+        }
+
+    def create_many(
+        self, entries: Sequence[FinancialEntry], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        """
+        POST /api/financial-entries/bulk com todas as linhas em uma requisição
+
+        Sem o endpoint, um POST por linha (em paralelo limitado), com a chave
+        de idempotência no header Idempotency-Key.
+        """
+        rows = []
+        for entry, key in zip(entries, idempotency_keys):
+            data = {**self._payload(entry), "idempotency_key": key}
+            if entry.credit_payment:
+                data["is_credit_payment"] = True
+            rows.append(data)
+
+        def create_one(index: int) -> FinancialEntry:
+            data = {k: v for k, v in rows[index].items() if k != "idempotency_key"}
+            response = self.http_client.post(
+                self.base_endpoint, data, headers={"Idempotency-Key": idempotency_keys[index]}
+            )
+            return FinancialEntry.from_dict(response["entry"])
+
+        return send_bulk(
+            self.http_client,
+            "post",
+            f"{self.base_endpoint}/bulk",
+            "entries",
+            rows,
+            lambda item: FinancialEntry.from_dict(item.get("entry", item)),
+            create_one,
+            "entries-bulk",
+        )
+
     def get_all(
         self,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List[FinancialEntry]:
+    ) -> EntryFrame:
         params = {}
         if start_date:
             # Formato: YYYY-MM-DD (sem hora, apenas data)
@@ -60,7 +107,115 @@ class FinancialEntryAPIRepository(FinancialEntryRepository):
             params["end_date"] = end_date.strftime("%Y-%m-%d")
 
         response = self.http_client.get(self.base_endpoint, params=params)
-        return [FinancialEntry.from_dict(item) for item in response]
+        return EntryFrame.from_records(response)
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        return _aggregate_route.available(self.http_client.base_url)
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Usa GET /api/financial-entries/aggregate quando o backend oferece
+
+        Se a primeira chamada falhar com 400/404/405/422 (sem a rota, o
+        backend pode tratar "aggregate" como um entry_id), lembra disso e
+        passa a agregar localmente sobre get_all; outros erros sobem.
+        """
+        invalid = [key for key in group_by if key not in GROUP_KEYS]
+        if invalid:
+            raise ValueError(f"Agrupamento inválido: {', '.join(invalid)}")
+
+        if not self.supports_remote_aggregation:
+            return super().aggregate(start_date, end_date, group_by)
+
+        params = {}
+        if start_date:
+            params["start_date"] = start_date.strftime("%Y-%m-%d")
+        if end_date:
+            params["end_date"] = end_date.strftime("%Y-%m-%d")
+        if group_by:
+            params["group_by"] = ",".join(group_by)
+
+        try:
+            response = self.http_client.get(
+                f"{self.base_endpoint}/aggregate", params=params
+            )
+        except APIError as e:
+            if not _aggregate_route.reject(self.http_client.base_url, e):
+                raise
+            return super().aggregate(start_date, end_date, group_by)
+        _aggregate_route.confirm(self.http_client.base_url)
+        return self._parse_groups(response, group_by)
+
+    @classmethod
+    def _parse_groups(cls, response: Any, group_by: Sequence[str]) -> List[Dict[str, Any]]:
+        # Aceita lista de grupos, {"groups": [...]} ou um único {"total", "count"}
+        if isinstance(response, dict):
+            response = response.get("groups", [response])
+        groups = [cls._parse_group(item, group_by) for item in response]
+        return [group for group in groups if group["count"]]
+
+    @staticmethod
+    def _parse_group(item: Dict[str, Any], group_by: Sequence[str]) -> Dict[str, Any]:
+        group: Dict[str, Any] = {}
+        for key in group_by:
+            value = item.get(key)
+            if key == "day" and isinstance(value, str):
+                value = date.fromisoformat(value[:10])
+            elif key == "month" and isinstance(value, str):
+                value = date(int(value[:4]), int(value[5:7]), 1)
+            elif key in ("is_credit_plan", "credit_payment"):
+                value = bool(value)
+            group[key] = value
+        group["total"] = float(item.get("total", 0))
+        group["count"] = int(item.get("count", 0))
+        return group
+
+    @property
+    def supports_incremental_sync(self) -> bool:
+        return _changes_route.available(self.http_client.base_url)
+
+    def get_changes(self, since: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        GET /api/financial-entries/changes?since=<watermark>
+
+        Aceita uma lista de lançamentos (exclusões marcadas com deleted ou
+        deleted_at) ou {"entries": [...], "deleted": [...], "watermark": ...}.
+        Sem o endpoint no backend (400/404/405/422 antes da primeira resposta
+        boa, ver OptionalRoute), retorna None.
+        """
+        if not self.supports_incremental_sync:
+            return None
+        params = {"since": since} if since else {}
+        try:
+            response = self.http_client.get(f"{self.base_endpoint}/changes", params=params)
+        except APIError as e:
+            if _changes_route.reject(self.http_client.base_url, e):
+                return None
+            raise
+        _changes_route.confirm(self.http_client.base_url)
+
+        if isinstance(response, list):
+            response = {"entries": response}
+
+        entries = []
+        deleted = list(response.get("deleted") or [])
+        for item in response.get("entries") or response.get("changes") or []:
+            if item.get("deleted") or item.get("deleted_at"):
+                deleted.append(item["id"])
+            else:
+                entries.append(item)
+
+        return {
+            "entries": entries,
+            "deleted": deleted,
+            "watermark": response.get("watermark") or response.get("server_time"),
+        }
 
     def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
         try:
@@ -70,11 +225,7 @@ class FinancialEntryAPIRepository(FinancialEntryRepository):
             return None
 
     def update(self, entry_id: str, entry: FinancialEntry) -> FinancialEntry:
-        data = {
-            "value": entry.value,
-            "date": entry.date.strftime("%Y-%m-%d"),
-            "modality_id": entry.modality_id,
-        }
+        data = self._payload(entry)
         response = self.http_client.put(f"{self.base_endpoint}/{entry_id}", data)
         return FinancialEntry.from_dict(response)
 
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from domain.entities.installment import Installment
+from domain.entities.decoding import decode_installments
 from domain.repositories.installment_repository import InstallmentRepository
 from infrastructure.http import HTTPClient
 
@@ -14,7 +15,7 @@ class InstallmentAPIRepository(InstallmentRepository):
         response = self.http_client.get(
             self.base_endpoint, params={"financial_entry_id": financial_entry_id}
         )
-        return [Installment.from_dict(item) for item in response]
+        return decode_installments(response)
 
     def get_by_id(self, installment_id: str) -> Optional[Installment]:
         try:
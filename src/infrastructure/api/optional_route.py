@@ -0,0 +1,46 @@
+"""
+Rotas opcionais do backend (agregação, changes, lotes)
+
+Nos backends sem a rota, GET /api/financial-entries/aggregate cai em
+/{entry_id} e volta 404/405, ou 400/422 por "aggregate" não ser um id.
+Por isso, enquanto a rota nunca respondeu com sucesso, esses status contam
+como "rota ausente"; depois da primeira resposta boa, os erros sobem
+normalmente. Autenticação (401/403), 429 e 5xx nunca marcam a rota: são
+falhas passageiras de uma sessão, não a falta do endpoint.
+"""
+from typing import AbstractSet, Hashable, Set
+from infrastructure.http import APIError
+
+
+# Status que, antes da primeira resposta boa, indicam rota inexistente
+MISSING_ROUTE_STATUS = frozenset({400, 404, 405, 422})
+
+
+class OptionalRoute:
+    """O que já se sabe de uma rota opcional, por backend (compartilhado entre sessões)"""
+
+    def __init__(self, missing_status: AbstractSet[int] = MISSING_ROUTE_STATUS):
+        self.missing_status = missing_status
+        self._confirmed: Set[Hashable] = set()
+        self._missing: Set[Hashable] = set()
+
+    def available(self, key: Hashable) -> bool:
+        """False depois que a rota foi dada como ausente nesse backend"""
+        return key not in self._missing
+
+    def confirm(self, key: Hashable) -> None:
+        """A rota respondeu com sucesso: erros seguintes são erros de verdade"""
+        self._confirmed.add(key)
+
+    def reject(self, key: Hashable, error: APIError) -> bool:
+        """
+        True se o erro indica que a rota não existe (e lembra disso);
+        False quando o chamador deve propagar o erro
+
+        Só os status de missing_status contam; falhas sem resposta
+        (status_code None) nunca marcam a rota.
+        """
+        if error.status_code not in self.missing_status or key in self._confirmed:
+            return False
+        self._missing.add(key)
+        return True
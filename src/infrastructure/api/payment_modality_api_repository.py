@@ -9,8 +9,9 @@ class PaymentModalityAPIRepository(PaymentModalityRepository):
         self.http_client = http_client
         self.base_endpoint = "/api/payment-modalities"
 
-    def create(self, modality: PaymentModality) -> PaymentModality:
-        data = {
+    @staticmethod
+    def _payload(modality: PaymentModality) -> dict:
+        return {
             "name": modality.name,
             "color": modality.color,
             "bank_name": modality.bank_name,
@@ -21,7 +22,9 @@ class PaymentModalityAPIRepository(PaymentModalityRepository):
             "allows_anticipation": modality.allows_anticipation,
             "allows_credit_payment": modality.allows_credit_payment,
         }
-        response = self.http_client.post(self.base_endpoint, data)
+
+    def create(self, modality: PaymentModality) -> PaymentModality:
+        response = self.http_client.post(self.base_endpoint, self._payload(modality))
         return PaymentModality.from_dict(response)
 
     def get_all(self, only_active: bool = False) -> List[PaymentModality]:
@@ -37,18 +40,9 @@ class PaymentModalityAPIRepository(PaymentModalityRepository):
             return None
 
     def update(self, modality_id: str, modality: PaymentModality) -> PaymentModality:
-        data = {
-            "name": modality.name,
-            "color": modality.color,
-            "bank_name": modality.bank_name,
-            "fee_percentage": modality.fee_percentage,
-            "rental_fee": modality.rental_fee,
-            "is_active": modality.is_active,
-            "is_credit_plan": modality.is_credit_plan,
-            "allows_anticipation": modality.allows_anticipation,
-            "allows_credit_payment": modality.allows_credit_payment,
-        }
-        response = self.http_client.put(f"{self.base_endpoint}/{modality_id}", data)
+        response = self.http_client.put(
+            f"{self.base_endpoint}/{modality_id}", self._payload(modality)
+        )
         return PaymentModality.from_dict(response)
 
     def delete(self, modality_id: str) -> bool:
@@ -0,0 +1,12 @@
+from .ttl_cache import TTLCache, TenantCache
+from .cached_financial_entry_repository import CachedFinancialEntryRepository
+from .entry_sync_store import EntrySyncStore
+from .synced_financial_entry_repository import SyncedFinancialEntryRepository
+
+__all__ = [
+    "TTLCache",
+    "TenantCache",
+    "CachedFinancialEntryRepository",
+    "EntrySyncStore",
+    "SyncedFinancialEntryRepository",
+]
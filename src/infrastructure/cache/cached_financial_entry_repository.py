@@ -0,0 +1,98 @@
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import datetime
+from domain.entities import FinancialEntry, EntryFrame
+from domain.entities.bulk_result import BulkResult
+from domain.repositories import FinancialEntryRepository
+from infrastructure.cache.ttl_cache import TenantCache
+
+
+class CachedFinancialEntryRepository(FinancialEntryRepository):
+    """
+    Cache read-through na frente de um FinancialEntryRepository
+
+    get_all e aggregate são cacheados por (tenant, período); qualquer
+    create/update/delete bem-sucedido invalida todos os períodos do tenant.
+    """
+
+    def __init__(self, repository: FinancialEntryRepository, cache: TenantCache):
+        self.repository = repository
+        self.cache = cache
+
+    @staticmethod
+    def _period_key(
+        start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> tuple:
+        # A API filtra apenas por dia, então a hora não faz parte da chave
+        return (
+            "entries",
+            start_date.strftime("%Y-%m-%d") if start_date else None,
+            end_date.strftime("%Y-%m-%d") if end_date else None,
+        )
+
+    def create(
+        self,
+        entry: FinancialEntry,
+        installments_count: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        is_credit_payment: bool = False,
+    ) -> Dict[str, Any]:
+        result = self.repository.create(
+            entry, installments_count, start_date, is_credit_payment
+        )
+        self.cache.invalidate()
+        return result
+
+    def create_many(
+        self, entries: Sequence[FinancialEntry], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        result = self.repository.create_many(entries, idempotency_keys)
+        self.cache.invalidate()
+        return result
+
+    def get_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> EntryFrame:
+        # EntryFrame é somente leitura, então pode ser devolvido sem cópia
+        return self.cache.get_or_load(
+            self._period_key(start_date, end_date),
+            lambda: self.repository.get_all(start_date, end_date),
+        )
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        return self.repository.supports_remote_aggregation
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        # Lançamentos do período já em cache: agrega localmente, sem requisição
+        entries = self.cache.get(self._period_key(start_date, end_date))
+        if entries is not None:
+            return entries.group_by(*group_by)
+        # Sem agregação no servidor: baixa pelo cache para reaproveitar depois
+        if not self.repository.supports_remote_aggregation:
+            return self.get_all(start_date, end_date).group_by(*group_by)
+
+        groups = self.cache.get_or_load(
+            ("aggregate",) + self._period_key(start_date, end_date)[1:] + (tuple(group_by),),
+            lambda: self.repository.aggregate(start_date, end_date, group_by),
+        )
+        return [dict(group) for group in groups]
+
+    def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
+        return self.repository.get_by_id(entry_id)
+
+    def update(self, entry_id: str, entry: FinancialEntry) -> FinancialEntry:
+        result = self.repository.update(entry_id, entry)
+        self.cache.invalidate()
+        return result
+
+    def delete(self, entry_id: str) -> bool:
+        result = self.repository.delete(entry_id)
+        self.cache.invalidate()
+        return result
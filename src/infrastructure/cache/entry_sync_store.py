@@ -0,0 +1,99 @@
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+
+
+def _record_day(record: dict) -> date:
+    value = record.get("date")
+    if value is None:
+        raise ValueError("Data é obrigatória")
+    if isinstance(value, date):
+        return value if type(value) is date else value.date()
+    return date.fromisoformat(str(value)[:10])
+
+
+class EntrySyncStore:
+    """
+    Cópia local dos lançamentos de um tenant, mantida por sincronização incremental
+
+    Os registros (dicts da API) ficam em buckets por dia, com a lista de
+    dias ordenada: consultar um período custa O(dias + lançamentos do
+    período), independente do tamanho do histórico. Alterações são
+    aplicadas por id (upsert) e exclusões chegam como tombstones.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.watermark: Optional[str] = None
+        self.synced_at: Optional[float] = None
+        self.version = 0
+        self._days: Dict[date, Dict[str, dict]] = {}
+        self._sorted_days: List[date] = []
+        self._day_of: Dict[str, date] = {}
+
+    @property
+    def initialized(self) -> bool:
+        return self.synced_at is not None
+
+    def apply(
+        self,
+        entries: Iterable[dict],
+        deleted: Iterable[str] = (),
+        watermark: Optional[str] = None,
+    ) -> int:
+        """Aplica upserts e tombstones; retorna quantos registros mudaram"""
+        changed = 0
+        with self.lock:
+            for entry_id in deleted:
+                if self._remove(entry_id):
+                    changed += 1
+
+            for record in entries:
+                entry_id = record.get("id")
+                if entry_id is None:
+                    continue
+                self._remove(entry_id)
+                day = _record_day(record)
+                bucket = self._days.get(day)
+                if bucket is None:
+                    bucket = self._days[day] = {}
+                    insort(self._sorted_days, day)
+                bucket[entry_id] = record
+                self._day_of[entry_id] = day
+                changed += 1
+
+                # Sem watermark do servidor, usa o maior updated_at recebido
+                stamp = record.get("updated_at") or record.get("created_at")
+                if watermark is None and stamp and (self.watermark is None or stamp > self.watermark):
+                    self.watermark = stamp
+
+            if watermark is not None:
+                self.watermark = watermark
+            if changed:
+                self.version += 1
+        return changed
+
+    def _remove(self, entry_id: str) -> bool:
+        day = self._day_of.pop(entry_id, None)
+        if day is None:
+            return False
+        bucket = self._days[day]
+        bucket.pop(entry_id, None)
+        if not bucket:
+            del self._days[day]
+            del self._sorted_days[bisect_left(self._sorted_days, day)]
+        return True
+
+    def query(self, start: Optional[date] = None, end: Optional[date] = None) -> List[dict]:
+        """Registros com data entre start e end (inclusive), em ordem de dia"""
+        with self.lock:
+            low = bisect_left(self._sorted_days, start) if start else 0
+            high = bisect_right(self._sorted_days, end) if end else len(self._sorted_days)
+            records: List[dict] = []
+            for day in self._sorted_days[low:high]:
+                records.extend(self._days[day].values())
+            return records
+
+    def __len__(self) -> int:
+        return len(self._day_of)
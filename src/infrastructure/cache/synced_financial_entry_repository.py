@@ -0,0 +1,133 @@
+import time
+from typing import List, Optional, Dict, Any, Sequence
+from datetime import datetime
+from domain.entities import FinancialEntry, EntryFrame
+from domain.entities.bulk_result import BulkResult
+from domain.repositories import FinancialEntryRepository
+from infrastructure.cache.entry_sync_store import EntrySyncStore
+from infrastructure.cache.ttl_cache import TenantCache
+
+
+class SyncedFinancialEntryRepository(FinancialEntryRepository):
+    """
+    Lê lançamentos de uma cópia local sincronizada incrementalmente
+
+    Na primeira leitura do tenant baixa o histórico completo; depois, no
+    máximo a cada interval segundos, pede ao backend só o que mudou desde
+    o último watermark e aplica no EntrySyncStore (upserts + tombstones).
+    Se o backend não tiver o endpoint de changes, delega tudo ao
+    repositório interno.
+    """
+
+    STORE_KEY = "entries_sync"
+
+    def __init__(
+        self,
+        repository: FinancialEntryRepository,
+        stores: TenantCache,
+        interval: float = 15.0,
+    ):
+        self.repository = repository
+        self.stores = stores
+        self.interval = interval
+
+    def _synced_store(self) -> Optional[EntrySyncStore]:
+        if not self.repository.supports_incremental_sync:
+            return None
+
+        store: EntrySyncStore = self.stores.get_or_load(self.STORE_KEY, EntrySyncStore)
+        with store.lock:
+            now = time.monotonic()
+            if store.initialized and now - store.synced_at < self.interval:
+                return store
+            changes = self.repository.get_changes(store.watermark)
+            if changes is None:
+                self.stores.pop(self.STORE_KEY)
+                return None
+            store.apply(changes["entries"], changes["deleted"], changes.get("watermark"))
+            store.synced_at = now
+        return store
+
+    def _expire(self) -> None:
+        # Força uma sincronização incremental na próxima leitura
+        store = self.stores.get(self.STORE_KEY)
+        if store is not None and store.initialized:
+            store.synced_at = float("-inf")
+
+    def create(
+        self,
+        entry: FinancialEntry,
+        installments_count: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        is_credit_payment: bool = False,
+    ) -> Dict[str, Any]:
+        result = self.repository.create(
+            entry, installments_count, start_date, is_credit_payment
+        )
+        self._expire()
+        return result
+
+    def create_many(
+        self, entries: Sequence[FinancialEntry], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        result = self.repository.create_many(entries, idempotency_keys)
+        self._expire()
+        return result
+
+    def get_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> EntryFrame:
+        store = self._synced_store()
+        if store is None:
+            return self.repository.get_all(start_date, end_date)
+
+        return EntryFrame.from_records(
+            store.query(
+                start_date.date() if start_date else None,
+                end_date.date() if end_date else None,
+            )
+        )
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        # Com a cópia local, agregar não exige baixar o período
+        return (
+            self.repository.supports_incremental_sync
+            or self.repository.supports_remote_aggregation
+        )
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        if self._synced_store() is None:
+            return self.repository.aggregate(start_date, end_date, group_by)
+        return self.get_all(start_date, end_date).group_by(*group_by)
+
+    @property
+    def supports_incremental_sync(self) -> bool:
+        return self.repository.supports_incremental_sync
+
+    def get_changes(self, since: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        return self.repository.get_changes(since)
+
+    def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
+        return self.repository.get_by_id(entry_id)
+
+    def update(self, entry_id: str, entry: FinancialEntry) -> FinancialEntry:
+        result = self.repository.update(entry_id, entry)
+        self._expire()
+        return result
+
+    def delete(self, entry_id: str) -> bool:
+        result = self.repository.delete(entry_id)
+        store = self.stores.get(self.STORE_KEY)
+        if result and store is not None:
+            # Tombstone local imediato, mesmo que o backend não devolva exclusões
+            store.apply((), (entry_id,))
+        self._expire()
+        return result
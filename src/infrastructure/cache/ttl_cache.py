@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+_DEFAULT_TTL = object()
+
+
+class TTLCache:
+    """
+    Cache LRU em memória com expiração por tempo (TTL)
+
+    Thread-safe: o lock protege apenas o dicionário; o carregamento de um
+    valor ausente (get_or_load) acontece fora do lock.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Any = _DEFAULT_TTL) -> None:
+        ttl = self.ttl if ttl is _DEFAULT_TTL else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], ttl: Any = _DEFAULT_TTL
+    ) -> Any:
+        """Retorna o valor em cache ou carrega, armazena e retorna"""
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = loader()
+            self.set(key, value, ttl)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove todas as chaves que satisfazem o predicado"""
+        with self._lock:
+            keys = [key for key in self._data if predicate(key)]
+            for key in keys:
+                del self._data[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TenantCache:
+    """
+    Visão de um TTLCache particionada pelo tenant atual
+
+    O tenant é obtido a cada chamada (ex.: token do HTTPClient da sessão),
+    então trocar de empresa no impersonate troca também a partição.
+    """
+
+    def __init__(self, cache: TTLCache, tenant: Callable[[], Optional[str]]):
+        self._cache = cache
+        self._tenant = tenant
+
+    def _key(self, key: Hashable) -> Tuple[Optional[str], Hashable]:
+        return (self._tenant(), key)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        return self._cache.get(self._key(key), default)
+
+    def set(self, key: Hashable, value: Any, ttl: Any = _DEFAULT_TTL) -> None:
+        self._cache.set(self._key(key), value, ttl)
+
+    def get_or_load(
+        self, key: Hashable, loader: Callable[[], Any], ttl: Any = _DEFAULT_TTL
+    ) -> Any:
+        return self._cache.get_or_load(self._key(key), loader, ttl)
+
+    def pop(self, key: Hashable) -> None:
+        self._cache.pop(self._key(key))
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Remove as chaves do tenant atual (todas, ou as que satisfazem o predicado)"""
+        tenant = self._tenant()
+        return self._cache.invalidate(
+            lambda key: key[0] == tenant and (predicate is None or predicate(key[1]))
+        )
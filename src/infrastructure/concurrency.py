@@ -0,0 +1,70 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Sequence
+from domain.entities.bulk_result import BulkResult
+
+
+class FetchBatch:
+    """
+    Chamadas independentes (ex.: consultas à API) disparadas juntas
+
+    submit agenda a chamada no pool e retorna na hora; result espera só a
+    chamada pedida e relança a exceção dela, se houver. A latência do lote
+    fica limitada pela chamada mais lenta, não pela soma de todas.
+
+    As funções rodam fora da thread do Streamlit: não devem usar st.*.
+    """
+
+    def __init__(self, executor: ThreadPoolExecutor):
+        self._executor = executor
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        if name in self._futures:
+            raise ValueError(f"Chamada já registrada no lote: {name}")
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures[name] = future
+        return future
+
+    def result(self, name: str, timeout: float = None) -> Any:
+        return self._futures[name].result(timeout)
+
+    def gather(self, timeout: float = None) -> Dict[str, Any]:
+        """Espera todas as chamadas; a primeira exceção (na ordem de submit) é relançada"""
+        return {name: future.result(timeout) for name, future in self._futures.items()}
+
+    def cancel(self) -> None:
+        for future in self._futures.values():
+            future.cancel()
+
+    def __enter__(self) -> "FetchBatch":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        # Não deixa chamadas ainda na fila rodando depois de um erro na view
+        if exc_info[0] is not None:
+            self.cancel()
+
+
+def map_bounded(
+    fn: Callable[[Any], Any], items: Sequence[Any], max_workers: int = 4, name: str = "bulk"
+) -> BulkResult:
+    """
+    Aplica fn a cada item com no máximo max_workers chamadas simultâneas
+
+    O erro de um item não interrompe os demais: vai para errors[índice].
+    """
+    result = BulkResult(total=len(items))
+    if not items:
+        return result
+
+    def run(index: int) -> None:
+        try:
+            result.succeeded[index] = fn(items[index])
+        except Exception as e:
+            result.errors[index] = str(e)
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(items)), thread_name_prefix=name
+    ) as executor:
+        list(executor.map(run, range(len(items))))
+    return result
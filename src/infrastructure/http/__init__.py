@@ -1,3 +1,5 @@
-from .http_client import HTTPClient
+from .http_client import HTTPClient, APIError
+from .async_http_client import AsyncHTTPClient
+from .request_log import RequestLog, RequestRecord
 
-__all__ = ["HTTPClient"]
+__all__ = ["HTTPClient", "APIError", "AsyncHTTPClient", "RequestLog", "RequestRecord"]
@@ -0,0 +1,205 @@
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Dict, List, Optional
+from config import Environment
+from infrastructure.http.http_client import APIError, RETRY_STATUS_CODES
+from infrastructure.http.request_log import RequestLog, RequestRecord
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+# httpx.AsyncClient de cada event loop (sai junto com o loop)
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Event loop único do processo, rodando em uma thread daemon
+
+    Código síncrono (views do Streamlit, scripts) agenda corrotinas nele com
+    run()/submit(); o httpx.AsyncClient compartilhado vive nesse loop.
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="async-http-loop", daemon=True
+                )
+                thread.start()
+                _loop = loop
+    return _loop
+
+
+def submit(coro: Awaitable) -> Future:
+    """Agenda a corrotina no loop compartilhado e devolve um Future síncrono"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def run(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    """Executa a corrotina no loop compartilhado e espera o resultado"""
+    return submit(coro).result(timeout)
+
+
+async def gather(*coros: Awaitable) -> List[Any]:
+    """asyncio.gather que relança a primeira exceção"""
+    return list(await asyncio.gather(*coros))
+
+
+def _get_shared_client():
+    # Chamado sempre de dentro do loop compartilhado
+    loop = asyncio.get_running_loop()
+    client = _shared_clients.get(loop)
+    if client is None:
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncHTTPClient requer o pacote httpx (pip install httpx)"
+            ) from e
+
+        env = Environment()
+        limits = httpx.Limits(
+            max_connections=env.http_pool_size,
+            max_keepalive_connections=env.http_pool_size,
+        )
+        # retries do transporte cobrem só falhas de conexão; status 5xx é tratado em _request
+        client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(retries=env.http_max_retries, limits=limits),
+            headers={"Connection": "keep-alive"},
+        )
+        _shared_clients[loop] = client
+    return client
+
+
+class AsyncHTTPClient:
+    """
+    Versão assíncrona do HTTPClient (httpx, HTTP/1.1 keep-alive)
+
+    Mesma API de token/tenant e mesmos erros (APIError com status_code).
+    Todas as instâncias compartilham um httpx.AsyncClient por event loop;
+    use run()/submit() deste módulo para chamar a partir de código síncrono.
+    """
+
+    def __init__(
+        self, base_url: Optional[str] = None, request_log: Optional[RequestLog] = None
+    ):
+        self.env = Environment()
+        self.base_url = (base_url or self.env.base_url).rstrip("/")
+        self.timeout = 30
+        self._auth_token: Optional[str] = None
+        self._tenant_id: Optional[str] = None
+        self.request_log = request_log or RequestLog(self.env.http_request_log_size)
+
+    @property
+    def auth_token(self) -> Optional[str]:
+        return self._auth_token
+
+    @property
+    def tenant_id(self) -> Optional[str]:
+        return self._tenant_id
+
+    def with_token(self, token: Optional[str]) -> "AsyncHTTPClient":
+        client = AsyncHTTPClient(base_url=self.base_url, request_log=self.request_log)
+        client.timeout = self.timeout
+        client.set_auth_token(token)
+        return client
+
+    def set_auth_token(self, token: Optional[str], tenant_id: Optional[str] = None):
+        self._auth_token = token
+        self._tenant_id = tenant_id if token else None
+
+    def _get_headers(self) -> Dict[str, str]:
+        headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        if self._auth_token:
+            headers["Authorization"] = f"Bearer {self._auth_token}"
+        return headers
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ):
+        url = f"{self.base_url}{endpoint}"
+        client = _get_shared_client()
+        # Mesma política do HTTPClient: só métodos idempotentes são repetidos
+        attempts = 1 + (self.env.http_max_retries if method in ("GET", "PUT", "DELETE") else 0)
+
+        started = time.perf_counter()
+        for attempt in range(attempts):
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    params=params,
+                    json=data,
+                    headers=self._get_headers(),
+                    timeout=self.timeout,
+                )
+            except Exception as e:
+                self.request_log.record(
+                    method, endpoint, None, (time.perf_counter() - started) * 1000, 0
+                )
+                raise APIError(f"Erro ao fazer requisição {method} para {url}: {str(e)}") from e
+
+            if response.status_code in RETRY_STATUS_CODES and attempt < attempts - 1:
+                await asyncio.sleep(self.env.http_backoff_factor * (2 ** attempt))
+                continue
+            break
+
+        # Como no HTTPClient, a latência inclui as tentativas repetidas
+        record = self.request_log.record(
+            method,
+            endpoint,
+            response.status_code,
+            (time.perf_counter() - started) * 1000,
+            len(response.content),
+        )
+        if response.is_error:
+            try:
+                detail = f"Detalhes: {response.json()}"
+            except ValueError:
+                detail = f"Response: {response.text[:500]}"
+            raise APIError(
+                f"{response.status_code} Error for url: {url} - {detail}",
+                response.status_code,
+            )
+        return response, record
+
+    @staticmethod
+    def _decode(response, record: RequestRecord) -> Any:
+        started = time.perf_counter()
+        data = response.json()
+        record.decode_ms = (time.perf_counter() - started) * 1000
+        return data
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
+        response, record = await self._request("GET", endpoint, params=params)
+        return self._decode(response, record)
+
+    async def post(self, endpoint: str, data: Dict[str, Any]) -> Dict:
+        response, record = await self._request("POST", endpoint, data=data)
+        return self._decode(response, record)
+
+    async def put(self, endpoint: str, data: Dict[str, Any]) -> Dict:
+        response, record = await self._request("PUT", endpoint, data=data)
+        return self._decode(response, record)
+
+    async def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict:
+        response, record = await self._request("PATCH", endpoint, data=data)
+        return self._decode(response, record)
+
+    async def delete(self, endpoint: str) -> bool:
+        response, _ = await self._request("DELETE", endpoint)
+        return response.status_code == 204 or response.status_code == 200
@@ -1,18 +1,153 @@
+import threading
+import time
 import requests
-from typing import Optional, Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Any, Tuple
 from config import Environment
+from infrastructure.http.request_log import RequestLog, RequestRecord
+
+
+# Status devolvidos pelo Render enquanto a API acorda/reinicia
+RETRY_STATUS_CODES = (502, 503, 504)
+
+
+class APIError(Exception):
+    """Erro de requisição à API; status_code é None quando não houve resposta"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def _build_session(env: Environment) -> requests.Session:
+    """
+    Sessão com pool de conexões keep-alive e retry com backoff
+
+    Métodos não idempotentes (POST/PATCH) não são repetidos pelo
+    Retry padrão do urllib3, evitando lançamentos duplicados.
+    """
+    pool_size = env.http_pool_size
+    retry = Retry(
+        total=env.http_max_retries,
+        backoff_factor=env.http_backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Pool de conexões compartilhado por todas as sessões do Streamlit
+
+    O token nunca é gravado na sessão compartilhada: cada HTTPClient envia
+    o seu próprio header Authorization por requisição.
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _build_session(Environment())
+    return _shared_session
 
 
 class HTTPClient:
-    def __init__(self):
+    """
+    Contexto de autenticação (token) sobre um pool de conexões
+
+    Instâncias são baratas: cada sessão do usuário tem o seu HTTPClient,
+    todas reaproveitando as conexões do pool compartilhado. Cada chamada
+    (método, endpoint, status, latência, bytes e tempo do json()) fica
+    no request_log, compartilhado pelas cópias de with_token().
+    """
+
+    def __init__(
+        self,
+        session: Optional[requests.Session] = None,
+        base_url: Optional[str] = None,
+        request_log: Optional[RequestLog] = None,
+    ):
         self.env = Environment()
-        self.base_url = self.env.base_url.rstrip("/")
+        self.base_url = (base_url or self.env.base_url).rstrip("/")
         self.timeout = 30
         self._auth_token: Optional[str] = None
+        self._tenant_id: Optional[str] = None
+        self._session = session or get_shared_session()
+        self.request_log = request_log or RequestLog(self.env.http_request_log_size)
+
+    @property
+    def auth_token(self) -> Optional[str]:
+        return self._auth_token
 
-    def set_auth_token(self, token: Optional[str]):
+    @property
+    def tenant_id(self) -> Optional[str]:
+        """Empresa do token atual, já validada pela API (login/impersonate)"""
+        return self._tenant_id
+
+    def with_token(self, token: Optional[str]) -> "HTTPClient":
+        """Novo cliente com outro token, reaproveitando o mesmo pool"""
+        client = HTTPClient(
+            session=self._session, base_url=self.base_url, request_log=self.request_log
+        )
+        client.timeout = self.timeout
+        client.set_auth_token(token)
+        return client
+
+    def set_auth_token(self, token: Optional[str], tenant_id: Optional[str] = None):
         """Set the authentication token for all requests"""
         self._auth_token = token
+        self._tenant_id = tenant_id if token else None
+
+    def pool_stats(self) -> Dict[str, int]:
+        """
+        Estatísticas do pool de conexões
+
+        Returns:
+            Dicionário com:
+            - requests: Requisições enviadas (inclui retries)
+            - connections_opened: Conexões TCP/TLS abertas
+            - connections_reused: Requisições que reaproveitaram uma conexão
+            - hosts: Quantidade de hosts com pool ativo
+        """
+        requests_sent = 0
+        connections_opened = 0
+        hosts = 0
+
+        for adapter in set(self._session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                hosts += 1
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(requests_sent - connections_opened, 0),
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Fecha as conexões abertas do pool (afeta todos os clientes que o compartilham)"""
+        self._session.close()
 
     def _get_headers(self) -> Dict[str, str]:
         headers = {
@@ -23,71 +158,107 @@ class HTTPClient:
             headers["Authorization"] = f"Bearer {self._auth_token}"
         return headers
 
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs: Any,
+    ) -> Tuple[requests.Response, RequestRecord]:
+        """Envia a requisição e registra status, latência e tamanho da resposta"""
+        started = time.perf_counter()
+        try:
+            response = self._session.request(
+                method,
+                f"{self.base_url}{endpoint}",
+                headers={**self._get_headers(), **(headers or {})},
+                timeout=self.timeout,
+                **kwargs,
+            )
+        except Exception:
+            self.request_log.record(
+                method, endpoint, None, (time.perf_counter() - started) * 1000, 0
+            )
+            raise
+        record = self.request_log.record(
+            method,
+            endpoint,
+            response.status_code,
+            (time.perf_counter() - started) * 1000,
+            len(response.content),
+        )
+        return response, record
+
+    @staticmethod
+    def _decode(response: requests.Response, record: RequestRecord) -> Any:
+        started = time.perf_counter()
+        data = response.json()
+        record.decode_ms = (time.perf_counter() - started) * 1000
+        return data
+
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict:
         url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.get(
-                url, params=params, headers=self._get_headers(), timeout=self.timeout
-            )
+            response, record = self._send("GET", endpoint, params=params)
             response.raise_for_status()
-            return response.json()
+            return self._decode(response, record)
         except requests.exceptions.HTTPError as e:
             # Tenta pegar o corpo da resposta para debug
             try:
                 error_detail = response.json()
-                raise Exception(f"{e} - Detalhes: {error_detail}")
-            except:
-                raise Exception(f"{e} - Response: {response.text[:200]}")
+                raise APIError(f"{e} - Detalhes: {error_detail}", response.status_code)
+            except APIError:
+                raise
+            except Exception:
+                raise APIError(f"{e} - Response: {response.text[:200]}", response.status_code)
         except Exception as e:
-            raise Exception(f"Erro ao fazer requisição GET para {url}: {str(e)}")
+            raise APIError(
+                f"Erro ao fazer requisição GET para {url}: {str(e)}",
+                getattr(e, "status_code", None),
+            )
 
-    def post(self, endpoint: str, data: Dict[str, Any]) -> Dict:
-        url = f"{self.base_url}{endpoint}"
+    def post(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict:
         try:
-            response = requests.post(
-                url, json=data, headers=self._get_headers(), timeout=self.timeout
-            )
+            response, record = self._send("POST", endpoint, headers, json=data)
             response.raise_for_status()
-            return response.json()
+            return self._decode(response, record)
         except requests.exceptions.HTTPError as e:
             try:
                 error_detail = response.json()
-                raise Exception(f"{e} - Detalhes: {error_detail}") from e
-            except Exception:
-                raise Exception(f"{e} - Response: {response.text[:500]}") from e
+            except ValueError:
+                raise APIError(f"{e} - Response: {response.text[:500]}", response.status_code) from e
+            raise APIError(f"{e} - Detalhes: {error_detail}", response.status_code) from e
 
     def put(self, endpoint: str, data: Dict[str, Any]) -> Dict:
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.put(
-                url, json=data, headers=self._get_headers(), timeout=self.timeout
-            )
+            response, record = self._send("PUT", endpoint, json=data)
             response.raise_for_status()
-            return response.json()
+            return self._decode(response, record)
         except requests.exceptions.HTTPError as e:
             try:
                 error_detail = response.json()
-                raise Exception(f"{e} - Detalhes: {error_detail}") from e
-            except Exception:
-                raise Exception(f"{e} - Response: {response.text[:500]}") from e
+            except ValueError:
+                raise APIError(f"{e} - Response: {response.text[:500]}", response.status_code) from e
+            raise APIError(f"{e} - Detalhes: {error_detail}", response.status_code) from e
 
     def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None) -> Dict:
-        url = f"{self.base_url}{endpoint}"
         try:
-            response = requests.patch(
-                url, json=data, headers=self._get_headers(), timeout=self.timeout
-            )
+            response, record = self._send("PATCH", endpoint, json=data)
             response.raise_for_status()
-            return response.json()
+            return self._decode(response, record)
         except requests.exceptions.HTTPError as e:
             try:
                 error_detail = response.json()
-                raise Exception(f"{e} - Detalhes: {error_detail}") from e
-            except Exception:
-                raise Exception(f"{e} - Response: {response.text[:500]}") from e
+            except ValueError:
+                raise APIError(f"{e} - Response: {response.text[:500]}", response.status_code) from e
+            raise APIError(f"{e} - Detalhes: {error_detail}", response.status_code) from e
 
     def delete(self, endpoint: str) -> bool:
-        url = f"{self.base_url}{endpoint}"
-        response = requests.delete(url, headers=self._get_headers(), timeout=self.timeout)
+        response, _ = self._send("DELETE", endpoint)
         response.raise_for_status()
         return response.status_code == 204 or response.status_code == 200
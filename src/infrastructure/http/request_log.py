@@ -0,0 +1,165 @@
+import csv
+import io
+import json
+import re
+import threading
+from collections import deque
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+
+# Segmentos de caminho que são ids: ObjectId (24 hex), UUID ou número
+_ID_SEGMENT = re.compile(
+    r"/(?:[0-9a-fA-F]{24}|[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}|\d+)(?=/|$)"
+)
+
+
+def endpoint_template(endpoint: str) -> str:
+    """/api/accounts/65f0...e1/pay -> /api/accounts/{id}/pay (sem query string)"""
+    return _ID_SEGMENT.sub("/{id}", endpoint.split("?", 1)[0])
+
+
+@dataclass(slots=True)
+class RequestRecord:
+    """Uma chamada à API; status é None quando não houve resposta"""
+
+    rerun: int
+    page: Optional[str]
+    started_at: datetime
+    method: str
+    endpoint: str
+    status: Optional[int]
+    latency_ms: float
+    response_bytes: int
+    decode_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["started_at"] = self.started_at.isoformat(timespec="milliseconds")
+        data["latency_ms"] = round(self.latency_ms, 3)
+        data["decode_ms"] = round(self.decode_ms, 3)
+        return data
+
+
+class RequestLog:
+    """
+    Últimas chamadas de um HTTPClient (buffer circular)
+
+    Cada rerun do Streamlit chama begin_rerun() antes de montar a página;
+    as chamadas seguintes, inclusive as das threads do FetchBatch, ficam
+    marcadas com o número do rerun e a página.
+    """
+
+    def __init__(self, maxlen: int = 500):
+        self._records: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._rerun = 0
+        self._page: Optional[str] = None
+
+    @property
+    def current_rerun(self) -> int:
+        return self._rerun
+
+    def begin_rerun(self, page: Optional[str] = None) -> int:
+        with self._lock:
+            self._rerun += 1
+            self._page = page
+            return self._rerun
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status: Optional[int],
+        latency_ms: float,
+        response_bytes: int,
+    ) -> RequestRecord:
+        with self._lock:
+            entry = RequestRecord(
+                rerun=self._rerun,
+                page=self._page,
+                started_at=datetime.now() - timedelta(milliseconds=latency_ms),
+                method=method,
+                endpoint=endpoint_template(endpoint),
+                status=status,
+                latency_ms=latency_ms,
+                response_bytes=response_bytes,
+            )
+            self._records.append(entry)
+        return entry
+
+    def records(self, rerun: Optional[int] = None) -> List[RequestRecord]:
+        """Cópia das chamadas guardadas (de um rerun só, se informado)"""
+        with self._lock:
+            records = list(self._records)
+        if rerun is not None:
+            records = [r for r in records if r.rerun == rerun]
+        return records
+
+    def clear(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    def reruns(self) -> List[Dict[str, Any]]:
+        """Totais por rerun (mais recente primeiro): chamadas, latência, bytes e decode"""
+        totals: Dict[int, Dict[str, Any]] = {}
+        for r in self.records():
+            row = totals.get(r.rerun)
+            if row is None:
+                row = totals[r.rerun] = {
+                    "rerun": r.rerun,
+                    "page": r.page,
+                    "calls": 0,
+                    "errors": 0,
+                    "latency_ms": 0.0,
+                    "slowest_ms": 0.0,
+                    "slowest_endpoint": None,
+                    "response_bytes": 0,
+                    "decode_ms": 0.0,
+                }
+            _accumulate(row, r)
+            if r.latency_ms > row["slowest_ms"]:
+                row["slowest_ms"] = r.latency_ms
+                row["slowest_endpoint"] = f"{r.method} {r.endpoint}"
+        return sorted(totals.values(), key=lambda row: row["rerun"], reverse=True)
+
+    def endpoints(self, rerun: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Totais por método + endpoint, do maior tempo total para o menor"""
+        totals: Dict[tuple, Dict[str, Any]] = {}
+        for r in self.records(rerun):
+            row = totals.get((r.method, r.endpoint))
+            if row is None:
+                row = totals[(r.method, r.endpoint)] = {
+                    "method": r.method,
+                    "endpoint": r.endpoint,
+                    "calls": 0,
+                    "errors": 0,
+                    "latency_ms": 0.0,
+                    "max_ms": 0.0,
+                    "response_bytes": 0,
+                    "decode_ms": 0.0,
+                }
+            _accumulate(row, r)
+            row["max_ms"] = max(row["max_ms"], r.latency_ms)
+        return sorted(totals.values(), key=lambda row: row["latency_ms"], reverse=True)
+
+    def to_json(self, rerun: Optional[int] = None) -> str:
+        return json.dumps(
+            [r.to_dict() for r in self.records(rerun)], ensure_ascii=False, indent=2
+        )
+
+    def to_csv(self, rerun: Optional[int] = None) -> str:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=[f.name for f in fields(RequestRecord)])
+        writer.writeheader()
+        writer.writerows(r.to_dict() for r in self.records(rerun))
+        return buffer.getvalue()
+
+
+def _accumulate(row: Dict[str, Any], record: RequestRecord) -> None:
+    row["calls"] += 1
+    row["errors"] += record.status is None or record.status >= 400
+    row["latency_ms"] += record.latency_ms
+    row["response_bytes"] += record.response_bytes
+    row["decode_ms"] += record.decode_ms
@@ -0,0 +1,17 @@
+from .sqlite_snapshot_store import SQLiteSnapshotStore
+from .snapshot_repositories import (
+    SnapshotRefresher,
+    SnapshotFinancialEntryRepository,
+    SnapshotAccountRepository,
+    SnapshotPaymentModalityRepository,
+    SnapshotInstallmentRepository,
+)
+
+__all__ = [
+    "SQLiteSnapshotStore",
+    "SnapshotRefresher",
+    "SnapshotFinancialEntryRepository",
+    "SnapshotAccountRepository",
+    "SnapshotPaymentModalityRepository",
+    "SnapshotInstallmentRepository",
+]
@@ -0,0 +1,400 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+from domain.entities import FinancialEntry, EntryFrame, PaymentModality
+from domain.entities.account import Account
+from domain.entities.bulk_result import BulkResult
+from domain.entities.installment import Installment
+from domain.entities.decoding import decode_accounts, decode_installments
+from domain.repositories import FinancialEntryRepository, PaymentModalityRepository
+from domain.repositories.account_repository import AccountRepository
+from domain.repositories.installment_repository import InstallmentRepository
+from infrastructure.snapshot.sqlite_snapshot_store import SQLiteSnapshotStore
+
+
+logger = logging.getLogger(__name__)
+
+ENTRIES = "entries"
+ENTRIES_HISTORY = "entries_history"
+ACCOUNTS = "accounts"
+MODALITIES = "modalities"
+INSTALLMENTS = "installments"
+
+
+class SnapshotRefresher:
+    """
+    Reconciliação do snapshot com a API em segundo plano
+
+    Uma única thread; pedidos repetidos para a mesma chave enquanto um
+    ainda está pendente são ignorados.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="snapshot-refresh")
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, task: Callable[[], Any]) -> bool:
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+
+        def run():
+            try:
+                task()
+            except Exception:
+                logger.warning("Falha ao atualizar snapshot %s", key, exc_info=True)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+
+        self._executor.submit(run)
+        return True
+
+
+def _day(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return str(value)[:10]
+
+
+class _SnapshotBacked:
+    """
+    Leitura stale-while-revalidate sobre o SQLiteSnapshotStore
+
+    repository_factory devolve o repositório da API com o token atual; ele é
+    resolvido no momento da chamada, então a atualização em segundo plano
+    continua usando o token (e a empresa) de quem a disparou.
+    """
+
+    def __init__(
+        self,
+        repository_factory: Callable[[], Any],
+        store: SQLiteSnapshotStore,
+        tenant: Callable[[], Optional[str]],
+        refresher: SnapshotRefresher,
+        refresh_seconds: float = 30.0,
+    ):
+        self._repository_factory = repository_factory
+        self.store = store
+        self.tenant = tenant
+        self.refresher = refresher
+        self.refresh_seconds = refresh_seconds
+
+    @property
+    def repository(self):
+        return self._repository_factory()
+
+    def _read(
+        self,
+        kind: str,
+        fetch: Callable[[Any], List[Dict[str, Any]]],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        scope: str = "",
+    ) -> List[dict]:
+        """
+        Payloads do período/escopo, do disco quando houver cobertura
+
+        fetch recebe o repositório e devolve linhas {id, date, modality_id, payload}.
+        """
+        company = self.tenant()
+        repository = self.repository
+        if company is None:
+            return [row["payload"] for row in fetch(repository)]
+
+        coverage = self.store.covered(company, kind, start, end, scope)
+        if coverage is None:
+            rows = fetch(repository)
+            self.store.write(company, kind, rows, start, end, scope)
+            return [row["payload"] for row in rows]
+
+        refreshed_at, _ = coverage
+        if time.time() - refreshed_at >= self.refresh_seconds:
+            self.refresher.submit(
+                (company, kind, start, end, scope),
+                lambda: self.store.write(company, kind, fetch(repository), start, end, scope),
+            )
+        return self.store.read(company, kind, start, end, scope)
+
+    def _invalidate(self, kind: str, scope: Optional[str] = None) -> None:
+        company = self.tenant()
+        if company is not None:
+            self.store.invalidate(company, kind, scope)
+
+
+def _entry_rows(records: List[dict]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": record["id"],
+            "date": _day(record.get("date")),
+            "modality_id": record.get("modality_id"),
+            "payload": record,
+        }
+        for record in records
+        if record.get("id") is not None
+    ]
+
+
+class SnapshotFinancialEntryRepository(_SnapshotBacked, FinancialEntryRepository):
+    def create(
+        self,
+        entry: FinancialEntry,
+        installments_count: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        is_credit_payment: bool = False,
+    ) -> Dict[str, Any]:
+        result = self.repository.create(
+            entry, installments_count, start_date, is_credit_payment
+        )
+        self._invalidate(ENTRIES)
+        return result
+
+    def create_many(
+        self, entries: Sequence[FinancialEntry], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        result = self.repository.create_many(entries, idempotency_keys)
+        self._invalidate(ENTRIES)
+        return result
+
+    def get_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> EntryFrame:
+        records = self._read(
+            ENTRIES,
+            lambda repository: _entry_rows(repository.get_all(start_date, end_date).records()),
+            _day(start_date),
+            _day(end_date),
+        )
+        return EntryFrame.from_records(records)
+
+    @property
+    def supports_remote_aggregation(self) -> bool:
+        return self.repository.supports_remote_aggregation
+
+    def aggregate(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        group_by: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        company = self.tenant()
+        if company is not None and self.store.covered(
+            company, ENTRIES, _day(start_date), _day(end_date)
+        ):
+            return super().aggregate(start_date, end_date, group_by)
+        return self.repository.aggregate(start_date, end_date, group_by)
+
+    @property
+    def supports_incremental_sync(self) -> bool:
+        return self.repository.supports_incremental_sync
+
+    def get_changes(self, since: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        company = self.tenant()
+        repository = self.repository
+        if company is None:
+            return repository.get_changes(since)
+
+        if since is None:
+            coverage = self.store.covered(company, ENTRIES_HISTORY)
+            if coverage is not None and coverage[1] is not None:
+                # Histórico do disco; o que mudou desde o watermark vem em segundo plano
+                watermark = coverage[1]
+                self.refresher.submit(
+                    (company, ENTRIES_HISTORY),
+                    lambda: self._apply_changes(company, repository, watermark),
+                )
+                return {
+                    "entries": self.store.read(company, ENTRIES_HISTORY),
+                    "deleted": [],
+                    "watermark": watermark,
+                }
+
+            changes = repository.get_changes(None)
+            if changes is None:
+                return None
+            self.store.write(
+                company,
+                ENTRIES_HISTORY,
+                _entry_rows(changes["entries"]),
+                watermark=changes.get("watermark") or self._max_stamp(changes["entries"]),
+            )
+            return changes
+
+        return self._apply_changes(company, repository, since)
+
+    def _apply_changes(self, company: str, repository, since: str) -> Optional[Dict[str, Any]]:
+        changes = repository.get_changes(since)
+        if changes is None:
+            return None
+        self.store.apply_changes(
+            company,
+            ENTRIES_HISTORY,
+            _entry_rows(changes["entries"]),
+            changes["deleted"],
+            changes.get("watermark") or self._max_stamp(changes["entries"]) or since,
+        )
+        return changes
+
+    @staticmethod
+    def _max_stamp(records: List[dict]) -> Optional[str]:
+        stamps = [r.get("updated_at") or r.get("created_at") for r in records]
+        stamps = [stamp for stamp in stamps if stamp]
+        return max(stamps) if stamps else None
+
+    def get_by_id(self, entry_id: str) -> Optional[FinancialEntry]:
+        return self.repository.get_by_id(entry_id)
+
+    def update(self, entry_id: str, entry: FinancialEntry) -> FinancialEntry:
+        result = self.repository.update(entry_id, entry)
+        self._invalidate(ENTRIES)
+        return result
+
+    def delete(self, entry_id: str) -> bool:
+        result = self.repository.delete(entry_id)
+        company = self.tenant()
+        if company is not None:
+            self.store.delete_record(company, ENTRIES, entry_id)
+            self.store.delete_record(company, ENTRIES_HISTORY, entry_id)
+        self._invalidate(ENTRIES)
+        return result
+
+
+class SnapshotAccountRepository(_SnapshotBacked, AccountRepository):
+    def create(self, value: float, date: datetime, description: str, account_type: str) -> Account:
+        result = self.repository.create(value, date, description, account_type)
+        self._invalidate(ACCOUNTS)
+        return result
+
+    def create_many(
+        self, accounts: Sequence[Account], idempotency_keys: Sequence[str]
+    ) -> BulkResult:
+        result = self.repository.create_many(accounts, idempotency_keys)
+        self._invalidate(ACCOUNTS)
+        return result
+
+    def list_all(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        account_type: Optional[str] = None,
+    ) -> List[Account]:
+        # O disco guarda o período com todos os tipos; o filtro é local
+        records = self._read(
+            ACCOUNTS,
+            lambda repository: [
+                {"id": account.id, "date": _day(account.date), "payload": account.to_dict()}
+                for account in repository.list_all(start_date, end_date)
+                if account.id is not None
+            ],
+            _day(start_date),
+            _day(end_date),
+        )
+        if account_type:
+            records = [record for record in records if record.get("type") == account_type]
+        return decode_accounts(records)
+
+    def get_by_id(self, account_id: str) -> Optional[Account]:
+        return self.repository.get_by_id(account_id)
+
+    def update(self, account_id: str, paid: bool = None, value: float = None, date: datetime = None, description: str = None) -> Account:
+        result = self.repository.update(account_id, paid=paid, value=value, date=date, description=description)
+        self._invalidate(ACCOUNTS)
+        return result
+
+    def update_many(self, updates: Sequence[Tuple[str, Dict[str, Any]]]) -> BulkResult:
+        result = self.repository.update_many(updates)
+        self._invalidate(ACCOUNTS)
+        return result
+
+    def delete(self, account_id: str) -> bool:
+        result = self.repository.delete(account_id)
+        company = self.tenant()
+        if company is not None:
+            self.store.delete_record(company, ACCOUNTS, account_id)
+        self._invalidate(ACCOUNTS)
+        return result
+
+
+class SnapshotPaymentModalityRepository(_SnapshotBacked, PaymentModalityRepository):
+    def create(self, modality: PaymentModality) -> PaymentModality:
+        result = self.repository.create(modality)
+        self._invalidate(MODALITIES)
+        return result
+
+    def get_all(self, only_active: bool = False) -> List[PaymentModality]:
+        # Guarda todas; o filtro de ativas é feito localmente
+        records = self._read(
+            MODALITIES,
+            lambda repository: [
+                {"id": modality.id, "payload": modality.to_dict()}
+                for modality in repository.get_all(only_active=False)
+                if modality.id is not None
+            ],
+        )
+        modalities = [PaymentModality.from_dict(record) for record in records]
+        if only_active:
+            modalities = [modality for modality in modalities if modality.is_active]
+        return modalities
+
+    def get_by_id(self, modality_id: str) -> Optional[PaymentModality]:
+        return self.repository.get_by_id(modality_id)
+
+    def update(self, modality_id: str, modality: PaymentModality) -> PaymentModality:
+        result = self.repository.update(modality_id, modality)
+        self._invalidate(MODALITIES)
+        return result
+
+    def delete(self, modality_id: str) -> bool:
+        result = self.repository.delete(modality_id)
+        self._invalidate(MODALITIES)
+        return result
+
+    def toggle(self, modality_id: str) -> PaymentModality:
+        result = self.repository.toggle(modality_id)
+        self._invalidate(MODALITIES)
+        return result
+
+
+class SnapshotInstallmentRepository(_SnapshotBacked, InstallmentRepository):
+    def get_by_financial_entry(self, financial_entry_id: str) -> List[Installment]:
+        records = self._read(
+            INSTALLMENTS,
+            lambda repository: [
+                {"id": item.id, "date": _day(item.due_date), "payload": item.to_dict()}
+                for item in repository.get_by_financial_entry(financial_entry_id)
+                if item.id is not None
+            ],
+            scope=financial_entry_id,
+        )
+        return decode_installments(records)
+
+    def get_by_id(self, installment_id: str) -> Optional[Installment]:
+        return self.repository.get_by_id(installment_id)
+
+    def pay_installment(
+        self, installment_id: str, payment_date: Optional[datetime] = None
+    ) -> Installment:
+        result = self.repository.pay_installment(installment_id, payment_date)
+        self._invalidate(INSTALLMENTS, result.financial_entry_id)
+        return result
+
+    def unpay_installment(self, installment_id: str) -> Installment:
+        result = self.repository.unpay_installment(installment_id)
+        self._invalidate(INSTALLMENTS, result.financial_entry_id)
+        return result
+
+    def get_daily_summary(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        return self.repository.get_daily_summary(start_date, end_date)
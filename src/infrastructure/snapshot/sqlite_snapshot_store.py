@@ -0,0 +1,235 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# Limites usados para períodos abertos (datas ISO comparam como texto)
+MIN_DAY = "0000-01-01"
+MAX_DAY = "9999-12-31"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    company_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT '',
+    date TEXT,
+    modality_id TEXT,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (company_id, kind, id)
+);
+CREATE INDEX IF NOT EXISTS idx_records_company_date_modality
+    ON records (company_id, kind, date, modality_id);
+CREATE INDEX IF NOT EXISTS idx_records_company_scope
+    ON records (company_id, kind, scope);
+CREATE TABLE IF NOT EXISTS coverage (
+    company_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    scope TEXT NOT NULL DEFAULT '',
+    start_day TEXT NOT NULL,
+    end_day TEXT NOT NULL,
+    refreshed_at REAL NOT NULL,
+    watermark TEXT,
+    PRIMARY KEY (company_id, kind, scope, start_day, end_day)
+);
+"""
+
+
+class SQLiteSnapshotStore:
+    """
+    Snapshot em disco (SQLite) das respostas da API, por empresa
+
+    records guarda cada registro (payload JSON) com as colunas usadas em
+    filtros: data e modalidade (ou o id do pai em scope, ex.: parcelas de um
+    lançamento). coverage registra quais períodos/escopos foram gravados por
+    completo e quando, para saber se uma leitura pode ser atendida do disco.
+    """
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _bounds(start: Optional[str], end: Optional[str]) -> Tuple[str, str]:
+        return (start or MIN_DAY, end or MAX_DAY)
+
+    def covered(
+        self,
+        company_id: str,
+        kind: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        scope: str = "",
+    ) -> Optional[Tuple[float, Optional[str]]]:
+        """(refreshed_at, watermark) da cobertura mais recente que contém o período"""
+        start, end = self._bounds(start, end)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT refreshed_at, watermark FROM coverage "
+                "WHERE company_id = ? AND kind = ? AND scope = ? "
+                "AND start_day <= ? AND end_day >= ? "
+                "ORDER BY refreshed_at DESC LIMIT 1",
+                (company_id, kind, scope, start, end),
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def read(
+        self,
+        company_id: str,
+        kind: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        scope: str = "",
+    ) -> List[dict]:
+        """Registros do período/escopo, ordenados por data"""
+        start, end = self._bounds(start, end)
+        sql = "SELECT payload FROM records WHERE company_id = ? AND kind = ?"
+        params: List[Any] = [company_id, kind]
+        if scope:
+            sql += " AND scope = ?"
+            params.append(scope)
+        if (start, end) != (MIN_DAY, MAX_DAY):
+            sql += " AND date BETWEEN ? AND ?"
+            params += [start, end]
+        sql += " ORDER BY date"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(payload) for (payload,) in rows]
+
+    def write(
+        self,
+        company_id: str,
+        kind: str,
+        records: Iterable[Dict[str, Any]],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        scope: str = "",
+        watermark: Optional[str] = None,
+    ) -> None:
+        """
+        Substitui os registros do período/escopo pelos informados
+
+        records: dicts com id, date (YYYY-MM-DD ou None), modality_id e payload.
+        """
+        start, end = self._bounds(start, end)
+        rows = [
+            (
+                company_id,
+                kind,
+                str(record["id"]),
+                scope,
+                record.get("date"),
+                record.get("modality_id"),
+                json.dumps(record["payload"], default=str),
+            )
+            for record in records
+        ]
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                delete_sql = "DELETE FROM records WHERE company_id = ? AND kind = ? AND scope = ?"
+                params: List[Any] = [company_id, kind, scope]
+                if (start, end) != (MIN_DAY, MAX_DAY):
+                    delete_sql += " AND date BETWEEN ? AND ?"
+                    params += [start, end]
+                self._conn.execute(delete_sql, params)
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records "
+                    "(company_id, kind, id, scope, date, modality_id, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO coverage "
+                    "(company_id, kind, scope, start_day, end_day, refreshed_at, watermark) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (company_id, kind, scope, start, end, time.time(), watermark),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def apply_changes(
+        self,
+        company_id: str,
+        kind: str,
+        records: Iterable[Dict[str, Any]],
+        deleted: Iterable[str],
+        watermark: Optional[str],
+    ) -> None:
+        """Upserts/tombstones incrementais sobre a cobertura completa (sem período)"""
+        rows = [
+            (
+                company_id,
+                kind,
+                str(record["id"]),
+                "",
+                record.get("date"),
+                record.get("modality_id"),
+                json.dumps(record["payload"], default=str),
+            )
+            for record in records
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "DELETE FROM records WHERE company_id = ? AND kind = ? AND id = ?",
+                    [(company_id, kind, str(entry_id)) for entry_id in deleted],
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO records "
+                    "(company_id, kind, id, scope, date, modality_id, payload) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._conn.execute(
+                    "UPDATE coverage SET refreshed_at = ?, watermark = ? "
+                    "WHERE company_id = ? AND kind = ? AND scope = '' "
+                    "AND start_day = ? AND end_day = ?",
+                    (time.time(), watermark, company_id, kind, MIN_DAY, MAX_DAY),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def invalidate(self, company_id: str, kind: str, scope: Optional[str] = None) -> None:
+        """Descarta a cobertura (os registros continuam até a próxima gravação)"""
+        sql = "DELETE FROM coverage WHERE company_id = ? AND kind = ?"
+        params: List[Any] = [company_id, kind]
+        if scope is not None:
+            sql += " AND scope = ?"
+            params.append(scope)
+        with self._lock:
+            self._conn.execute(sql, params)
+
+    def delete_record(self, company_id: str, kind: str, record_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM records WHERE company_id = ? AND kind = ? AND id = ?",
+                (company_id, kind, str(record_id)),
+            )
+
+    def warm(self) -> Dict[str, int]:
+        """Lê os índices e conta os registros por tipo (aquece o cache de páginas)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, COUNT(*) FROM records GROUP BY kind"
+            ).fetchall()
+        return {kind: count for kind, count in rows}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,8 +5,11 @@ from views.Admin import Admin
 from config import Environment, EnvironmentError
 from presentation.components.custom_styles import apply_custom_styles
 from presentation.components.theme_toggle import render_theme_toggle
+from presentation.components.api_debug import render_api_health_check
+from presentation.components.profile_flame import render_profile_sidebar
+from presentation.profiler import profile_page, profiling_enabled
 from presentation.auth_persistence import restore_auth_if_exists, clear_auth_session
-from dependencies import get_container
+from dependencies import get_container, warm_snapshot_store
 
 try:
     env = Environment()
@@ -14,6 +17,9 @@ except EnvironmentError as e:
     st.error(f"Erro de Configuração\n\n{str(e)}")
     st.stop()
 
+# Snapshot local (opcional) aberto já no primeiro acesso após o deploy
+warm_snapshot_store()
+
 st.set_page_config(
     page_title="Dashboard Financeiro",
     layout="wide",
@@ -81,9 +87,18 @@ else:
     http_client = container.http_client
 
     if "impersonate_token" in st.session_state:
-        http_client.set_auth_token(st.session_state.impersonate_token)
+        http_client.set_auth_token(
+            st.session_state.impersonate_token,
+            st.session_state.get("impersonating_company_id"),
+        )
     elif "access_token" in st.session_state:
-        http_client.set_auth_token(st.session_state.access_token)
+        http_client.set_auth_token(
+            st.session_state.access_token,
+            current_user.company_id if current_user else None,
+        )
+
+    # Chamadas à API deste rerun ficam marcadas com a página (painel de debug)
+    http_client.request_log.begin_rerun(st.session_state.current_page)
 
     with st.sidebar:
         if current_user:
@@ -106,8 +121,11 @@ else:
                 ):
                     del st.session_state.impersonate_token
                     del st.session_state.impersonating_company
+                    st.session_state.pop("impersonating_company_id", None)
 
-                    http_client.set_auth_token(st.session_state.access_token)
+                    http_client.set_auth_token(
+                        st.session_state.access_token, current_user.company_id
+                    )
 
                     st.session_state.current_page = "Admin"
 
@@ -194,9 +212,13 @@ else:
                 st.session_state.current_page = "Admin"
                 st.rerun()
         else:
-            all_pages[st.session_state.current_page].render()
+            with profile_page(st.session_state.current_page):
+                all_pages[st.session_state.current_page].render()
+            if current_user and current_user.is_super_admin:
+                render_api_health_check(http_client.request_log)
     elif st.session_state.current_page in ADMIN_PAGES:
-        ADMIN_PAGES[st.session_state.current_page]()
+        with profile_page(st.session_state.current_page):
+            ADMIN_PAGES[st.session_state.current_page]()
     else:
         if (
             current_user
@@ -208,3 +230,6 @@ else:
             # Usuários comuns começam na página de Lançamentos
             st.session_state.current_page = "Lançamentos"
         st.rerun()
+
+    if profiling_enabled():
+        render_profile_sidebar(st.session_state.current_page)
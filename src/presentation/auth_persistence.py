@@ -62,7 +62,7 @@ def restore_auth_if_exists():
             )
 
             # Set token in HTTP client
-            http_client.set_auth_token(auth_token.token)
+            http_client.set_auth_token(auth_token.token, auth_token.user.company_id)
 
             return True
 
@@ -86,6 +86,7 @@ def clear_auth_session():
         "auth_timestamp",
         "impersonate_token",
         "impersonating_company",
+        "impersonating_company_id",
         "company_name"
     ]
 
@@ -0,0 +1,73 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Union
+import numpy as np
+import pandas as pd
+
+
+Rows = Union[pd.DataFrame, Sequence[Dict[str, Any]]]
+
+
+@dataclass(slots=True)
+class RowChange:
+    """Linha editada: id, campos alterados (coluna -> novo valor) e a linha editada completa"""
+
+    key: Any
+    changes: Dict[str, Any]
+    row: Dict[str, Any]
+
+
+def _frame(rows: Rows) -> pd.DataFrame:
+    frame = rows if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+    return frame.reset_index(drop=True)
+
+
+def _python(value: Any) -> Any:
+    # numpy -> tipos nativos (serializáveis em JSON)
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def diff_rows(
+    original: Rows, edited: Rows, keys: Sequence[Any], columns: Sequence[str]
+) -> List[RowChange]:
+    """
+    Diferença por campo entre a tabela original e a editada (st.data_editor)
+
+    A comparação é feita por coluna, vetorizada: números com tolerância
+    (np.isclose) e NaN igual a NaN; só as linhas com alguma mudança são
+    convertidas em RowChange. keys[i] identifica a linha i (ex.: o id).
+    """
+    before = _frame(original)
+    after = _frame(edited)
+    if len(before) != len(after) or len(before) != len(keys):
+        raise ValueError("Tabela editada com número de linhas diferente da original")
+    if not len(before):
+        return []
+
+    changed = np.zeros((len(before), len(columns)), dtype=bool)
+    for position, column in enumerate(columns):
+        a = before[column]
+        b = after[column]
+        if pd.api.types.is_numeric_dtype(a) and pd.api.types.is_numeric_dtype(b) and not (
+            pd.api.types.is_bool_dtype(a) or pd.api.types.is_bool_dtype(b)
+        ):
+            changed[:, position] = ~np.isclose(
+                a.to_numpy(dtype=float), b.to_numpy(dtype=float), equal_nan=True
+            )
+        else:
+            changed[:, position] = (a != b).to_numpy() & ~(a.isna() & b.isna()).to_numpy()
+
+    changes = []
+    for row in np.flatnonzero(changed.any(axis=1)):
+        edited_row = {column: _python(value) for column, value in after.iloc[row].items()}
+        changes.append(
+            RowChange(
+                key=keys[row],
+                changes={
+                    column: edited_row[column]
+                    for position, column in enumerate(columns)
+                    if changed[row, position]
+                },
+                row=edited_row,
+            )
+        )
+    return changes
@@ -0,0 +1,12 @@
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def hex_to_rgba(hex_color: str, opacity: float = 0.6) -> str:
+    """Converte cor hex (#RRGGBB) para rgba com a opacidade informada"""
+    hex_color = hex_color.lstrip("#")
+    try:
+        r, g, b = (int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+    except ValueError:
+        r, g, b = (147, 51, 234)
+    return f"rgba({r}, {g}, {b}, {opacity})"
@@ -0,0 +1,189 @@
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+import streamlit as st
+from domain.entities.account import Account
+from domain.money import format_brl
+from presentation.changeset import diff_rows
+from presentation.profiler import section
+
+
+# Meses (expanders) por página da lista
+MONTHS_PER_PAGE = 3
+
+# Linhas por data_editor; meses maiores ganham um seletor de página próprio
+ROWS_PER_PAGE = 50
+
+# Coluna de exclusão, presente só quando a view passa on_delete
+DELETE_COLUMN = "Excluir"
+
+
+def group_by_month(
+    accounts: Sequence[Account], newest_first: bool = False
+) -> List[Tuple[str, str, List[Account]]]:
+    """(chave AAAA-MM, rótulo, contas do mês ordenadas por data) na ordem pedida"""
+    by_month = {}
+    for account in accounts:
+        by_month.setdefault(account.date.strftime("%Y-%m"), []).append(account)
+
+    months = []
+    for month_key in sorted(by_month, reverse=newest_first):
+        items = sorted(by_month[month_key], key=lambda a: a.date, reverse=newest_first)
+        months.append((month_key, items[0].date.strftime("%b/%Y"), items))
+    return months
+
+
+def page_slice(items: Sequence, page: int, page_size: int) -> Tuple[Sequence, int]:
+    """Itens da página (1-based, ajustada ao intervalo) e o total de páginas"""
+    pages = max(1, math.ceil(len(items) / page_size))
+    page = min(max(page, 1), pages)
+    start = (page - 1) * page_size
+    return items[start : start + page_size], pages
+
+
+def _page_input(label: str, pages: int, key: str, caption: str) -> int:
+    """Seletor de página; o valor salvo é ajustado se o número de páginas diminuiu"""
+    if pages <= 1:
+        return 1
+    if st.session_state.get(key, 1) > pages:
+        st.session_state[key] = pages
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        page = st.number_input(label, min_value=1, max_value=pages, value=1, step=1, key=key)
+    with col2:
+        st.write("")
+        st.caption(caption)
+    return page
+
+
+def render_account_month_list(
+    accounts: Sequence[Account],
+    account_use_cases,
+    key: str,
+    paid_label: str = "Pago",
+    newest_first: bool = False,
+    on_delete: Optional[Callable[[Account], None]] = None,
+    months_per_page: int = MONTHS_PER_PAGE,
+    rows_per_page: int = ROWS_PER_PAGE,
+) -> None:
+    """
+    Contas agrupadas por mês, paginadas, com um st.data_editor por mês
+
+    Valor e paid_label são editados na própria tabela e salvos juntos
+    (update_accounts). Só as páginas visíveis viram widgets: no máximo
+    months_per_page editores e seletores de página por rerun, qualquer que
+    seja o número de contas.
+
+    A paginação é sobre a lista já carregada, não no servidor: as views
+    precisam do período inteiro para os cards de total (não há agregação
+    de contas na API) e list_accounts guarda essa busca no cache, então
+    pedir cada página ao backend só somaria requisições.
+
+    on_delete recebe a conta marcada na coluna Excluir (ex.: para abrir o
+    modal de confirmação da view).
+    """
+    with section("aggregate"):
+        months = group_by_month(accounts, newest_first)
+    visible, pages = page_slice(months, st.session_state.get(f"{key}_page", 1), months_per_page)
+    _page_input(
+        "Página",
+        pages,
+        f"{key}_page",
+        f"{len(months)} meses · {months_per_page} meses por página · {pages} páginas",
+    )
+    # Troca a chave dos editores após salvar/excluir para descartar as edições já aplicadas
+    version = st.session_state.get(f"{key}_version", 0)
+
+    for month_key, label, items in visible:
+        month_total = sum(account.value for account in items)
+        with st.expander(f"📅 {label} - {format_brl(month_total)}", expanded=True):
+            row_page_key = f"{key}_{month_key}_rows"
+            rows, row_pages = page_slice(items, st.session_state.get(row_page_key, 1), rows_per_page)
+            _page_input(
+                "Linhas",
+                row_pages,
+                row_page_key,
+                f"{len(items)} lançamentos · {rows_per_page} por página",
+            )
+            with section("emit"):
+                _render_month_editor(
+                    rows,
+                    account_use_cases,
+                    f"{key}_{month_key}_{version}",
+                    paid_label,
+                    on_delete,
+                    key,
+                )
+
+
+def _render_month_editor(
+    accounts: Sequence[Account],
+    account_use_cases,
+    editor_key: str,
+    paid_label: str,
+    on_delete: Optional[Callable[[Account], None]],
+    list_key: str,
+) -> None:
+    table_data = []
+    for account in accounts:
+        row = {
+            "Data": account.date.strftime("%d/%m/%Y"),
+            "Descrição": account.description,
+            "Valor": float(account.value),
+            paid_label: account.paid,
+        }
+        if on_delete is not None:
+            row[DELETE_COLUMN] = False
+        table_data.append(row)
+
+    column_config = {
+        "Data": st.column_config.TextColumn("Data", width="small"),
+        "Descrição": st.column_config.TextColumn("Descrição", width="medium"),
+        "Valor": st.column_config.NumberColumn(
+            "Valor", min_value=0.01, step=0.01, format="R$ %.2f", required=True, width="small"
+        ),
+        paid_label: st.column_config.CheckboxColumn(paid_label, width="small"),
+    }
+    if on_delete is not None:
+        column_config[DELETE_COLUMN] = st.column_config.CheckboxColumn("🗑️", width="small")
+
+    edited = st.data_editor(
+        table_data,
+        use_container_width=True,
+        hide_index=True,
+        disabled=["Data", "Descrição"],
+        column_config=column_config,
+        key=editor_key,
+    )
+
+    keys = [account.id for account in accounts]
+    if on_delete is not None:
+        marked = diff_rows(table_data, edited, keys, [DELETE_COLUMN])
+        if marked:
+            st.session_state[f"{list_key}_version"] = st.session_state.get(f"{list_key}_version", 0) + 1
+            on_delete(next(a for a in accounts if a.id == marked[0].key))
+            st.rerun()
+
+    changes = diff_rows(table_data, edited, keys, ["Valor", paid_label])
+    if not changes:
+        return
+
+    updates = []
+    for change in changes:
+        fields = {}
+        if "Valor" in change.changes:
+            fields["value"] = float(change.changes["Valor"])
+        if paid_label in change.changes:
+            fields["paid"] = bool(change.changes[paid_label])
+        updates.append((change.key, fields))
+
+    try:
+        result = account_use_cases.update_accounts(updates)
+    except Exception as e:
+        st.error(f"Erro ao atualizar: {str(e)}")
+        return
+
+    for index in result.failed_rows:
+        st.error(f"Erro ao atualizar {changes[index].row['Descrição']}: {result.errors[index]}")
+    if result.ok:
+        st.session_state[f"{list_key}_version"] = st.session_state.get(f"{list_key}_version", 0) + 1
+        st.rerun()
@@ -1,15 +1,29 @@
+from datetime import datetime
+from typing import Optional
+import pandas as pd
 import streamlit as st
 import requests
 from config import Environment
+from infrastructure.http import RequestLog
 
 
-def render_api_health_check():
-    """Renderiza um componente de verificação de saúde da API"""
+def render_api_health_check(request_log: Optional[RequestLog] = None):
+    """
+    Renderiza um componente de verificação de saúde da API
+
+    Com request_log (o do HTTPClient da sessão), mostra também as chamadas
+    feitas em cada rerun; chame depois de montar a página, para que o
+    rerun atual já esteja completo.
+    """
 
     env = Environment()
     base_url = env.base_url.rstrip("/")
 
     with st.expander("🔍 Debug da API", expanded=False):
+        if request_log is not None:
+            _render_request_log(request_log)
+            st.markdown("---")
+
         st.markdown("### Informações de Conexão")
         st.code(f"Base URL: {base_url}")
 
@@ -75,3 +89,71 @@ def render_api_health_check():
 
             except Exception as e:
                 st.error(f"❌ Erro: {str(e)}")
+
+
+def _kb(size: float) -> str:
+    return f"{size / 1024:.1f} KB"
+
+
+def _render_request_log(request_log: RequestLog):
+    st.markdown("### Chamadas à API")
+
+    reruns = request_log.reruns()
+    if not reruns:
+        st.info("Nenhuma chamada registrada ainda.")
+        return
+
+    by_rerun = {row["rerun"]: row for row in reruns}
+    rerun = st.selectbox(
+        "Rerun",
+        list(by_rerun),
+        format_func=lambda n: f"#{n} - {by_rerun[n]['page'] or '-'} ({by_rerun[n]['calls']} chamadas)",
+        key="api_debug_rerun",
+    )
+    summary = by_rerun[rerun]
+
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric(
+        "Chamadas",
+        summary["calls"],
+        f"{summary['errors']} com erro" if summary["errors"] else None,
+        delta_color="inverse",
+    )
+    col2.metric("Tempo somado", f"{summary['latency_ms']:.0f} ms")
+    col3.metric("Resposta", _kb(summary["response_bytes"]))
+    col4.metric("json()", f"{summary['decode_ms']:.0f} ms")
+    st.caption(
+        "O tempo somado pode passar do tempo da página: chamadas do mesmo lote rodam em paralelo."
+    )
+
+    st.markdown("**Por endpoint**")
+    st.dataframe(pd.DataFrame(request_log.endpoints(rerun)), hide_index=True, use_container_width=True)
+
+    st.markdown("**Chamadas**")
+    calls = pd.DataFrame([record.to_dict() for record in request_log.records(rerun)])
+    st.dataframe(
+        calls.drop(columns=["rerun", "page"]), hide_index=True, use_container_width=True
+    )
+
+    st.markdown("**Reruns recentes**")
+    st.dataframe(pd.DataFrame(reruns), hide_index=True, use_container_width=True)
+
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    col1, col2, col3 = st.columns(3)
+    col1.download_button(
+        "⬇️ JSON",
+        request_log.to_json(),
+        file_name=f"api_calls_{stamp}.json",
+        mime="application/json",
+        use_container_width=True,
+    )
+    col2.download_button(
+        "⬇️ CSV",
+        request_log.to_csv(),
+        file_name=f"api_calls_{stamp}.csv",
+        mime="text/csv",
+        use_container_width=True,
+    )
+    if col3.button("🗑️ Limpar", use_container_width=True, key="api_debug_clear"):
+        request_log.clear()
+        st.rerun()
@@ -0,0 +1,115 @@
+from typing import Sequence
+import numpy as np
+import streamlit as st
+from domain.entities.credit_month import CreditMonth
+from domain.money import format_brl_array
+from presentation.profiler import section
+
+
+CALENDAR_STYLE = """<style>
+.credit-scroll-container {
+    overflow-x: auto;
+    margin: 20px 0;
+}
+.credit-scroll-container::-webkit-scrollbar {
+    height: 12px;
+    width: 12px;
+}
+.credit-scroll-container::-webkit-scrollbar-track {
+    background: #f1f1f1;
+    border-radius: 10px;
+}
+.credit-scroll-container::-webkit-scrollbar-thumb {
+    background: #9333EA;
+    border-radius: 10px;
+}
+.credit-scroll-container::-webkit-scrollbar-thumb:hover {
+    background: #7c2cc9;
+}
+.credit-table { border-collapse: collapse; }
+.credit-table th {
+    background-color: #9333EA; color: white; padding: 6px 8px; text-align: center;
+    border: 1px solid #ddd; font-weight: bold; font-size: 12px;
+    position: sticky; top: 0; z-index: 10;
+}
+.credit-table td {
+    padding: 4px 6px; border: 1px solid #ddd; text-align: center;
+    min-width: 90px; font-size: 11px; white-space: nowrap;
+}
+.credit-table .day-label {
+    background-color: #f0f0f0; font-weight: bold; min-width: 45px; font-size: 11px;
+    position: sticky; left: 0; z-index: 5;
+}
+.credit-table th.receivable { background-color: rgba(255, 193, 7, 0.6); color: #856404; }
+.credit-table th.received { background-color: rgba(40, 167, 69, 0.6); color: #155724; }
+.receivable-cell-filled {
+    background-color: rgba(255, 193, 7, 0.6); color: #856404; font-weight: bold;
+}
+.received-cell-filled {
+    background-color: rgba(40, 167, 69, 0.6); color: #155724; font-weight: bold;
+}
+</style>"""
+
+# Modelos da tabela, definidos uma vez; só os valores mudam a cada render
+_TABLE = (
+    "<div class='credit-scroll-container'><table class='credit-table'>"
+    "<thead><tr><th>Dia</th>{headers}</tr><tr><th></th>{subheaders}</tr></thead>"
+    "<tbody>{rows}</tbody></table></div>"
+)
+_HEADER = "<th colspan='2'>{label}<br/>A Rec: {receivable} | Receb: {received}</th>"
+_SUBHEADER = "<th class='receivable'>A Receber</th><th class='received'>Recebido</th>"
+_ROW_START = [f"<tr><td class='day-label'>Dia {day:02d}</td>" for day in range(1, 32)]
+# Abertura das células preenchidas de cada coluna do par (A Receber, Recebido)
+_FILLED = np.array(["<td class='receivable-cell-filled'>", "<td class='received-cell-filled'>"])
+_EMPTY_CELL = "<td>-</td>"
+
+def build_credit_calendar_html(months: Sequence[CreditMonth]) -> str:
+    """
+    HTML da agenda: uma linha por dia (1 a 31) e um par de colunas
+    (A Receber, Recebido) por mês
+
+    As células são montadas como uma matriz 31 x (2 x meses) com operações
+    vetorizadas do NumPy; só os dias com valor recebem a classe colorida.
+    """
+    if not months:
+        return ""
+
+    # Colunas intercaladas: receivable do mês 1, received do mês 1, ...
+    values = np.empty((31, 2 * len(months)))
+    values[:, 0::2] = np.column_stack([month.receivable for month in months])
+    values[:, 1::2] = np.column_stack([month.received for month in months])
+
+    labels = format_brl_array(values)
+    filled = np.char.add(np.char.add(np.tile(_FILLED, len(months)), labels), "</td>")
+    cells = np.where(values > 0, filled, _EMPTY_CELL)
+
+    totals = format_brl_array(
+        np.array([(month.total_receivable, month.total_received) for month in months])
+    )
+    headers = "".join(
+        _HEADER.format(label=month.label, receivable=receivable, received=received)
+        for month, (receivable, received) in zip(months, totals)
+    )
+    rows = "".join(
+        start + "".join(row) + "</tr>" for start, row in zip(_ROW_START, cells.tolist())
+    )
+    return CALENDAR_STYLE + _TABLE.format(
+        headers=headers, subheaders=_SUBHEADER * len(months), rows=rows
+    )
+
+
+def render_credit_calendar(months: Sequence[CreditMonth]) -> None:
+    """
+    CreditCalendar: agenda diária do crediário por mês
+
+    Recebe os blocos de InstallmentUseCases.get_monthly_summary; meses sem
+    nenhum dia no resumo da API não viram colunas.
+    """
+    months = [month for month in months if month.has_data]
+    if not months:
+        st.info("Nenhum dado de crediário encontrado no período selecionado.")
+        return
+    with section("build-HTML"):
+        calendar_html = build_credit_calendar_html(months)
+    with section("emit"):
+        st.markdown(calendar_html, unsafe_allow_html=True)
@@ -0,0 +1,188 @@
+import html
+import math
+from datetime import date
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import streamlit as st
+from domain.entities import FinancialEntry
+from domain.money import format_brl
+from presentation.colors import hex_to_rgba
+from presentation.profiler import section
+
+
+# Dias (colunas) renderizados por página da grade
+DEFAULT_PAGE_DAYS = 14
+
+CREDIT_PAYMENT_COLOR = "rgba(34, 197, 94, 0.7)"
+
+GRID_STYLE = """<style>
+.scroll-container {
+    overflow-x: auto;
+    max-height: 700px;
+    overflow-y: auto;
+    margin: 20px 0;
+}
+.scroll-container::-webkit-scrollbar {
+    height: 12px;
+    width: 12px;
+}
+.scroll-container::-webkit-scrollbar-track {
+    background: #f1f1f1;
+    border-radius: 10px;
+}
+.scroll-container::-webkit-scrollbar-thumb {
+    background: #9333EA;
+    border-radius: 10px;
+}
+.scroll-container::-webkit-scrollbar-thumb:hover {
+    background: #7c2cc9;
+}
+.entry-grid { border-collapse: collapse; }
+.entry-grid th {
+    background-color: #f0f0f0; padding: 12px; text-align: center;
+    border: 1px solid #ddd; font-weight: bold;
+}
+.entry-grid td { padding: 10px; border: 1px solid #ddd; min-width: 180px; white-space: nowrap; }
+.entry-grid td.value { text-align: right; }
+.entry-grid td.modality { text-align: center; color: #333; font-weight: bold; }
+.entry-grid td.modality span { font-size: 11px; font-weight: normal; }
+</style>"""
+
+_EMPTY_CELLS = "<td></td><td></td>"
+
+
+def group_entries_by_day(
+    entries: Iterable[FinancialEntry],
+) -> Tuple[Dict[date, List[FinancialEntry]], List[date]]:
+    """
+    Lançamentos agrupados por dia, do mais antigo para o mais recente
+    (created_at), e os dias em ordem decrescente
+    """
+    by_day: Dict[date, List[FinancialEntry]] = {}
+    for entry in sorted(entries, key=lambda e: e.created_at or e.date):
+        by_day.setdefault(entry.date.date(), []).append(entry)
+    return by_day, sorted(by_day, reverse=True)
+
+
+def paginate_days(days: Sequence[date], page: int, page_days: int = DEFAULT_PAGE_DAYS) -> List[date]:
+    """Janela de dias da página (1-based); páginas fora do intervalo são ajustadas"""
+    pages = max(1, math.ceil(len(days) / page_days))
+    page = min(max(page, 1), pages)
+    start = (page - 1) * page_days
+    return list(days[start : start + page_days])
+
+
+def build_cell_table(
+    entries: Iterable[FinancialEntry],
+    modality_rgba_map: Mapping[str, str],
+    modality_name_map: Mapping[str, str],
+) -> Dict[Tuple[str, bool, bool], str]:
+    """
+    Célula de modalidade pré-montada por (modality_id, is_credit_plan, credit_payment)
+
+    Usa a cor (rgba do ModalityCatalog) e o nome atuais da modalidade, não
+    os salvos no lançamento; cada combinação é montada uma única vez por
+    render. Modalidades fora do catálogo usam a cor salva no lançamento.
+    """
+    cells: Dict[Tuple[str, bool, bool], str] = {}
+    for entry in entries:
+        key = (entry.modality_id, entry.is_credit_plan, entry.credit_payment)
+        if key in cells:
+            continue
+
+        name = html.escape(modality_name_map.get(entry.modality_id, entry.modality_name))
+        if entry.credit_payment:
+            background = CREDIT_PAYMENT_COLOR
+            text = f"Recebimento Crediário<br><span>{name}</span>"
+        else:
+            background = modality_rgba_map.get(entry.modality_id) or hex_to_rgba(
+                entry.modality_color
+            )
+            text = f"{name}<br><span>Pgto Crediário</span>" if entry.is_credit_plan else name
+        cells[key] = f"<td class='modality' style='background-color: {background};'>{text}</td>"
+    return cells
+
+
+def render_entry_grid_html(
+    entries_by_day: Dict[date, List[FinancialEntry]],
+    days: Sequence[date],
+    cells: Dict[Tuple[str, bool, bool], str],
+) -> str:
+    """
+    HTML da grade (uma coluna dupla por dia) só para os dias informados
+
+    As partes são acumuladas em lista e unidas no final; o CSS fica em
+    classes em vez de repetido em cada célula.
+    """
+    columns = [entries_by_day[day] for day in days]
+    rows = max((len(column) for column in columns), default=0)
+
+    parts = [GRID_STYLE, "<div class='scroll-container'><table class='entry-grid'><thead><tr>"]
+    for day, column in zip(days, columns):
+        daily_total = sum(entry.value for entry in column)
+        parts.append(
+            f"<th colspan='2'>{day.strftime('%d/%m/%Y')} - Total: {format_brl(daily_total)}</th>"
+        )
+    parts.append("</tr></thead><tbody>")
+
+    for i in range(rows):
+        parts.append("<tr>")
+        for column in columns:
+            if i < len(column):
+                entry = column[i]
+                parts.append(f"<td class='value'>{format_brl(entry.value)}</td>")
+                parts.append(cells[(entry.modality_id, entry.is_credit_plan, entry.credit_payment)])
+            else:
+                parts.append(_EMPTY_CELLS)
+        parts.append("</tr>")
+
+    parts.append("</tbody></table></div>")
+    return "".join(parts)
+
+
+def render_entry_grid(
+    entries: Sequence[FinancialEntry],
+    modality_rgba_map: Mapping[str, str],
+    modality_name_map: Mapping[str, str],
+    page_days: int = DEFAULT_PAGE_DAYS,
+    key: str = "entry_grid",
+) -> None:
+    """
+    Grade de lançamentos por dia, paginada por janelas de page_days dias
+
+    Só a página visível vira HTML; em períodos longos o payload enviado ao
+    navegador fica limitado a page_days colunas.
+    """
+    with section("aggregate"):
+        entries_by_day, days = group_entries_by_day(entries)
+    pages = max(1, math.ceil(len(days) / page_days))
+
+    page: Optional[int] = 1
+    if pages > 1:
+        # O filtro de datas pode ter reduzido o número de páginas
+        if st.session_state.get(f"{key}_page", 1) > pages:
+            st.session_state[f"{key}_page"] = pages
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input(
+                "Página",
+                min_value=1,
+                max_value=pages,
+                value=1,
+                step=1,
+                key=f"{key}_page",
+            )
+        with col2:
+            st.write("")
+            st.caption(f"{len(days)} dias com lançamentos · {page_days} dias por página · {pages} páginas")
+
+    visible = paginate_days(days, page, page_days)
+    with section("aggregate"):
+        cells = build_cell_table(
+            (entry for day in visible for entry in entries_by_day[day]),
+            modality_rgba_map,
+            modality_name_map,
+        )
+    with section("build-HTML"):
+        grid_html = render_entry_grid_html(entries_by_day, visible, cells)
+    with section("emit"):
+        st.markdown(grid_html, unsafe_allow_html=True)
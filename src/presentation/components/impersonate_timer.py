@@ -28,8 +28,13 @@ def render_impersonate_timer():
                 del st.session_state.impersonating_company
             if "impersonate_start_time" in st.session_state:
                 del st.session_state.impersonate_start_time
+            st.session_state.pop("impersonating_company_id", None)
 
-            http_client.set_auth_token(st.session_state.access_token)
+            current_user = st.session_state.get("current_user")
+            http_client.set_auth_token(
+                st.session_state.access_token,
+                current_user.company_id if current_user else None,
+            )
 
             st.session_state.current_page = "Admin"
             st.rerun()
@@ -0,0 +1,108 @@
+import html
+from typing import Optional
+import pandas as pd
+import streamlit as st
+from presentation.profiler import ProfileNode, page_profiles
+
+
+FLAME_STYLE = """<style>
+.pf-flame { font-size: 11px; line-height: 18px; margin: 8px 0; }
+.pf-node { display: inline-block; vertical-align: top; box-sizing: border-box; }
+.pf-bar {
+    color: white; padding: 0 4px; margin: 0 1px 1px 0; border-radius: 3px;
+    overflow: hidden; white-space: nowrap; text-overflow: ellipsis;
+}
+.pf-children { display: flex; }
+</style>"""
+
+# Cores das seções usadas nas páginas; outros nomes ficam em cinza
+SECTION_COLORS = {
+    "fetch": "#3B82F6",
+    "aggregate": "#10B981",
+    "build-HTML": "#F59E0B",
+    "build-chart": "#EF4444",
+    "emit": "#9333EA",
+}
+PAGE_COLOR = "#4B5563"
+OTHER_COLOR = "#9CA3AF"
+
+
+def _flame_node(node: ProfileNode, total_ms: float, color: str) -> str:
+    tooltip = (
+        f"{node.name}: {node.wall_ms:.1f} ms ({node.calls}x), CPU {node.cpu_ms:.1f} ms, "
+        f"próprio {node.self_ms:.1f} ms, alocado {node.alloc_bytes / 1024:.0f} KB, "
+        f"pico {node.peak_bytes / 1024:.0f} KB"
+    )
+    children = sorted(node.children.values(), key=lambda c: c.wall_ms, reverse=True)
+    inner = "".join(
+        _flame_node(child, node.wall_ms, SECTION_COLORS.get(child.name, OTHER_COLOR))
+        for child in children
+    )
+    width = 100 * node.wall_ms / total_ms if total_ms > 0 else 100
+    return (
+        f"<div class='pf-node' style='width: {width:.2f}%'>"
+        f"<div class='pf-bar' style='background: {color}' title='{html.escape(tooltip, quote=True)}'>"
+        f"{html.escape(node.name)} {node.wall_ms:.0f} ms</div>"
+        f"<div class='pf-children'>{inner}</div></div>"
+    )
+
+
+def build_flame_html(root: ProfileNode) -> str:
+    """
+    Gráfico de chamas (de cima para baixo) do perfil de uma página
+
+    Cada barra ocupa a fração do tempo do nível de cima; o espaço vazio
+    embaixo de uma barra é tempo fora das seções filhas.
+    """
+    return (
+        FLAME_STYLE
+        + "<div class='pf-flame'>"
+        + _flame_node(root, root.wall_ms, PAGE_COLOR)
+        + "</div>"
+    )
+
+
+def render_profile_sidebar(current_page: Optional[str] = None) -> None:
+    """ProfileFlame: perfil da página atual e comparação entre as páginas abertas"""
+    profiles = page_profiles()
+    with st.sidebar.expander("⏱️ Perfil das páginas", expanded=True):
+        if not profiles:
+            st.caption("Abra uma página para medir.")
+            return
+
+        pages = sorted(profiles, key=lambda name: profiles[name].wall_ms, reverse=True)
+        page = st.selectbox(
+            "Página",
+            pages,
+            index=pages.index(current_page) if current_page in profiles else 0,
+        )
+        root = profiles[page]
+
+        col1, col2 = st.columns(2)
+        col1.metric("Tempo", f"{root.wall_ms:.0f} ms")
+        col2.metric("CPU", f"{root.cpu_ms:.0f} ms")
+        st.caption(f"Pico de memória (processo inteiro): {root.peak_bytes / 1024:.0f} KB")
+        st.markdown(build_flame_html(root), unsafe_allow_html=True)
+
+        rows = pd.DataFrame(root.flatten())
+        rows["section"] = ["· " * depth + name for depth, name in zip(rows["depth"], rows["section"])]
+        st.dataframe(
+            rows.drop(columns=["depth"]).round(1),
+            hide_index=True,
+            use_container_width=True,
+        )
+
+        if len(profiles) > 1:
+            st.markdown("**Páginas (último render)**")
+            st.dataframe(
+                pd.DataFrame(
+                    {
+                        "Página": pages,
+                        "wall_ms": [profiles[name].wall_ms for name in pages],
+                        "cpu_ms": [profiles[name].cpu_ms for name in pages],
+                        "peak_kb": [profiles[name].peak_bytes / 1024 for name in pages],
+                    }
+                ).round(1),
+                hide_index=True,
+                use_container_width=True,
+            )
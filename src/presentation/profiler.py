@@ -0,0 +1,170 @@
+"""
+Perfil de renderização das páginas (opcional, PROFILE_VIEWS=1)
+
+main.py envolve o render() de cada página com profile_page(); dentro
+dela, section("fetch") / section("aggregate") / section("build-HTML") /
+section("emit") medem trechos com nome. Seções com o mesmo nome no mesmo
+nível são somadas (calls conta as entradas), então um trecho espalhado
+pela página pode ser marcado em vários pontos.
+
+Desativado, section() devolve um contexto vazio e não mede nada.
+
+O tracemalloc é um só para o processo (e reset_peak zera o pico de
+todos), então, ativado, um render perfilado por vez: as sessões esperam
+a vez em profile_page.
+"""
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional
+import streamlit as st
+from config import Environment
+
+
+# Último perfil de cada página na sessão (nome da página -> ProfileNode)
+PROFILES_SESSION_KEY = "_page_profiles"
+
+_NO_SECTION = nullcontext()
+_state = threading.local()
+
+# Serializa os renders perfilados: o pico do tracemalloc é global
+_render_lock = threading.Lock()
+
+
+@dataclass(slots=True)
+class ProfileNode:
+    """
+    Tempo de um trecho: relógio (wall), CPU da thread do script e memória
+
+    cpu_ms não inclui o trabalho das threads do FetchBatch: um "fetch" com
+    wall alto e CPU baixa é espera pela API. alloc_bytes é a memória
+    alocada e ainda viva na saída; peak_bytes é o pico acima da entrada.
+    A memória é do processo inteiro: inclui as threads do FetchBatch e as
+    do próprio Streamlit, mas não outros renders perfilados.
+    """
+
+    name: str
+    calls: int = 0
+    wall_ms: float = 0.0
+    cpu_ms: float = 0.0
+    alloc_bytes: int = 0
+    peak_bytes: int = 0
+    children: Dict[str, "ProfileNode"] = field(default_factory=dict)
+
+    @property
+    def self_ms(self) -> float:
+        """Tempo fora das seções filhas"""
+        return max(self.wall_ms - sum(c.wall_ms for c in self.children.values()), 0.0)
+
+    def child(self, name: str) -> "ProfileNode":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = ProfileNode(name)
+        return node
+
+    def flatten(self, depth: int = 0) -> List[dict]:
+        """Linhas (com profundidade) da árvore, filhos do mais lento ao mais rápido"""
+        rows = [
+            {
+                "depth": depth,
+                "section": self.name,
+                "calls": self.calls,
+                "wall_ms": self.wall_ms,
+                "self_ms": self.self_ms,
+                "cpu_ms": self.cpu_ms,
+                "alloc_kb": self.alloc_bytes / 1024,
+                "peak_kb": self.peak_bytes / 1024,
+            }
+        ]
+        for child in sorted(self.children.values(), key=lambda c: c.wall_ms, reverse=True):
+            rows.extend(child.flatten(depth + 1))
+        return rows
+
+
+class _Frame:
+    __slots__ = ("node", "floor")
+
+    def __init__(self, node: ProfileNode):
+        self.node = node
+        # Pico do tracemalloc antes da última seção filha zerá-lo
+        self.floor = 0
+
+
+class _Section:
+    __slots__ = ("_stack", "_name", "_frame", "_wall", "_cpu", "_memory")
+
+    def __init__(self, stack: List[_Frame], name: str):
+        self._stack = stack
+        self._name = name
+
+    def __enter__(self) -> ProfileNode:
+        parent = self._stack[-1]
+        self._frame = frame = _Frame(parent.node.child(self._name))
+        self._stack.append(frame)
+        # O pico do tracemalloc é um só: zera para medir este trecho e guarda
+        # o pico anterior no nível de cima, que o considera ao sair
+        self._memory, peak = tracemalloc.get_traced_memory()
+        parent.floor = max(parent.floor, peak)
+        tracemalloc.reset_peak()
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return frame.node
+
+    def __exit__(self, *exc) -> None:
+        wall = time.perf_counter() - self._wall
+        cpu = time.thread_time() - self._cpu
+        memory, peak = tracemalloc.get_traced_memory()
+        self._stack.pop()
+        node = self._frame.node
+        node.calls += 1
+        node.wall_ms += wall * 1000
+        node.cpu_ms += cpu * 1000
+        node.alloc_bytes += memory - self._memory
+        node.peak_bytes = max(node.peak_bytes, max(peak, self._frame.floor) - self._memory)
+
+
+def profiling_enabled() -> bool:
+    return Environment().profile_views
+
+
+def section(name: str):
+    """Mede um trecho da página atual (contexto vazio fora de profile_page)"""
+    stack = getattr(_state, "stack", None)
+    if not stack:
+        return _NO_SECTION
+    return _Section(stack, name)
+
+
+@contextmanager
+def profile_page(page: str) -> Iterator[Optional[ProfileNode]]:
+    """
+    Perfil do render() de uma página, guardado em
+    st.session_state[PROFILES_SESSION_KEY][page] ao terminar
+
+    Renders interrompidos (st.rerun, st.stop, erro) não substituem o
+    perfil anterior da página. Com várias sessões abertas, os renders
+    perfilados rodam um de cada vez (ver _render_lock).
+    """
+    if not profiling_enabled():
+        yield None
+        return
+
+    completed = False
+    with _render_lock:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _state.stack = stack = [_Frame(ProfileNode(""))]
+        try:
+            with _Section(stack, page) as root:
+                yield root
+            completed = True
+        finally:
+            _state.stack = None
+    if completed:
+        st.session_state.setdefault(PROFILES_SESSION_KEY, {})[page] = root
+
+
+def page_profiles() -> Dict[str, ProfileNode]:
+    return st.session_state.get(PROFILES_SESSION_KEY, {})
@@ -168,10 +168,13 @@ def Admin():
                                                 st.session_state.impersonating_company = (
                                                     company.name
                                                 )
+                                                st.session_state.impersonating_company_id = (
+                                                    company.id
+                                                )
 
                                                 # Set token in HTTP client
                                                 http_client.set_auth_token(
-                                                    impersonate_token.token
+                                                    impersonate_token.token, company.id
                                                 )
 
                                                 # Redirect to Dashboard
@@ -370,9 +373,14 @@ def Admin():
                 # Clear impersonate data
                 del st.session_state.impersonate_token
                 del st.session_state.impersonating_company
+                st.session_state.pop("impersonating_company_id", None)
 
                 # Restore super admin token
-                http_client.set_auth_token(st.session_state.access_token)
+                current_user = st.session_state.get("current_user")
+                http_client.set_auth_token(
+                    st.session_state.access_token,
+                    current_user.company_id if current_user else None,
+                )
 
                 # Stay on Admin page
                 st.session_state.current_page = "Admin"
@@ -1,7 +1,11 @@
 import streamlit as st
 from datetime import datetime
 from dependencies import get_container
+from domain.money import format_brl
+from domain.entities.bank_limit import BankLimit
+from presentation.changeset import diff_rows
 from presentation.components.page_header import render_page_header
+from presentation.profiler import section
 
 
 def render():
@@ -27,7 +31,8 @@ def _render_limites_bancarios(container):
     bank_limit_use_cases = container.bank_limit_use_cases
 
     try:
-        bank_limits = bank_limit_use_cases.list_bank_limits()
+        with section("fetch"):
+            bank_limits = bank_limit_use_cases.list_bank_limits()
     except Exception as e:
         st.error(f"Erro ao carregar limites: {str(e)}")
         bank_limits = []
@@ -52,11 +57,7 @@ def _render_limites_bancarios(container):
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            total_rot_avail_fmt = (
-                f"R$ {total_rotativo_available:,.2f}".replace(",", "X")
-                .replace(".", ",")
-                .replace("X", ".")
-            )
+            total_rot_avail_fmt = format_brl(total_rotativo_available)
             st.markdown(
                 f"""
                 <div style="border: 2px solid #28a745; border-radius: 8px; padding: 15px; background: #d4edda; text-align: center;">
@@ -68,11 +69,7 @@ def _render_limites_bancarios(container):
             )
 
         with col2:
-            total_rot_used_fmt = (
-                f"R$ {total_rotativo_used:,.2f}".replace(",", "X")
-                .replace(".", ",")
-                .replace("X", ".")
-            )
+            total_rot_used_fmt = format_brl(total_rotativo_used)
             st.markdown(
                 f"""
                 <div style="border: 2px solid #6c757d; border-radius: 8px; padding: 15px; background: #e2e3e5; text-align: center;">
@@ -84,11 +81,7 @@ def _render_limites_bancarios(container):
             )
 
         with col3:
-            total_cheq_avail_fmt = (
-                f"R$ {total_cheque_available:,.2f}".replace(",", "X")
-                .replace(".", ",")
-                .replace("X", ".")
-            )
+            total_cheq_avail_fmt = format_brl(total_cheque_available)
             st.markdown(
                 f"""
                 <div style="border: 2px solid #dc3545; border-radius: 8px; padding: 15px; background: #f8d7da; text-align: center;">
@@ -100,11 +93,7 @@ def _render_limites_bancarios(container):
             )
 
         with col4:
-            total_cheq_used_fmt = (
-                f"R$ {total_cheque_used:,.2f}".replace(",", "X")
-                .replace(".", ",")
-                .replace("X", ".")
-            )
+            total_cheq_used_fmt = format_brl(total_cheque_used)
             st.markdown(
                 f"""
                 <div style="border: 2px solid #6c757d; border-radius: 8px; padding: 15px; background: #e2e3e5; text-align: center;">
@@ -189,49 +178,49 @@ def _render_limites_bancarios(container):
             key="bank_limits_table",
         )
 
-        # Detectar mudanças e atualizar
-        # Converter edited_df para lista de dicts (se necessário)
-        if hasattr(edited_df, "to_dict"):
-            edited_data = edited_df.to_dict("records")
-        else:
-            edited_data = edited_df
-
-        for idx, (original, edited) in enumerate(zip(table_data, edited_data)):
-            # Comparar apenas os campos editáveis
-            campos_editaveis = [
-                "Rotativo Disponível",
-                "Rotativo Em Uso",
-                "Taxa Rotativo (%)",
-                "Cheque Disponível",
-                "Cheque Em Uso",
-                "Taxa Cheque (%)",
-            ]
-
-            mudou = any(original[campo] != edited[campo] for campo in campos_editaveis)
-
-            if mudou:
-                bank_id = bank_map.get(idx)
-
-                if not bank_id:
-                    st.error(f"Erro: ID do banco não encontrado para índice {idx}")
-                    continue
+        # Detectar mudanças (só campos editáveis) e salvar todas de uma vez
+        campos_editaveis = [
+            "Rotativo Disponível",
+            "Rotativo Em Uso",
+            "Taxa Rotativo (%)",
+            "Cheque Disponível",
+            "Cheque Em Uso",
+            "Taxa Cheque (%)",
+        ]
+        changes = diff_rows(
+            table_data,
+            edited_df,
+            [bank_map[idx] for idx in range(len(table_data))],
+            campos_editaveis,
+        )
 
-                try:
-                    bank_limit_use_cases.update_bank_limit(
-                        bank_id,
-                        edited["Banco"],
-                        edited["Rotativo Disponível"],
-                        edited["Rotativo Em Uso"],
-                        edited["Cheque Disponível"],
-                        edited["Cheque Em Uso"],
-                        edited["Taxa Rotativo (%)"],
-                        edited["Taxa Cheque (%)"],
-                        0.0,  # interest_rate mantido para compatibilidade
+        if changes:
+            limits = [
+                BankLimit(
+                    id=change.key,
+                    bank_name=change.row["Banco"],
+                    rotativo_available=change.row["Rotativo Disponível"],
+                    rotativo_used=change.row["Rotativo Em Uso"],
+                    cheque_available=change.row["Cheque Disponível"],
+                    cheque_used=change.row["Cheque Em Uso"],
+                    rotativo_rate=change.row["Taxa Rotativo (%)"],
+                    cheque_rate=change.row["Taxa Cheque (%)"],
+                    interest_rate=0.0,  # mantido para compatibilidade
+                )
+                for change in changes
+            ]
+            try:
+                result = bank_limit_use_cases.update_bank_limits(limits)
+                for index in result.failed_rows:
+                    st.error(
+                        f"Erro ao atualizar '{limits[index].bank_name}': {result.errors[index]}"
                     )
-                    st.success(f"Banco '{edited['Banco']}' atualizado com sucesso!")
+                if result.ok:
+                    names = ", ".join(f"'{limit.bank_name}'" for limit in limits)
+                    st.success(f"Banco(s) {names} atualizado(s) com sucesso!")
                     st.rerun()
-                except Exception as e:
-                    st.error(f"Erro ao atualizar: {str(e)}")
+            except Exception as e:
+                st.error(f"Erro ao atualizar: {str(e)}")
 
     else:
         st.info(
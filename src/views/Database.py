@@ -1,7 +1,10 @@
 import streamlit as st
 from datetime import datetime, timedelta
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.components.entry_grid import render_entry_grid
+from presentation.profiler import section
 
 
 def render():
@@ -17,7 +20,9 @@ def render():
     entry_use_cases = container.financial_entry_use_cases
 
     try:
-        modalities = modality_use_cases.list_active_modalities()
+        with section("fetch"):
+            catalog = modality_use_cases.catalog()
+        modalities = catalog.active
 
         if not modalities:
             st.warning(
@@ -57,11 +62,7 @@ def render():
                 )
 
             # Criar opções com formato "nome (banco)" - apenas modalidades ativas
-            modality_options = {}
-            for m in modalities:
-                if m.is_active:  # Apenas modalidades ativas
-                    display_name = f"{m.name} ({m.bank_name})" if m.bank_name else m.name
-                    modality_options[display_name] = m
+            modality_options = {m.display_name: m for m in modalities}
 
             selected_display_name = st.selectbox(
                 "Modalidade",
@@ -151,7 +152,7 @@ def render():
                         entry_datetime = datetime.combine(date, datetime.min.time())
 
                         # Nome da modalidade com banco se disponível
-                        modality_display_name = f"{selected_modality.name} ({selected_modality.bank_name})" if selected_modality.bank_name else selected_modality.name
+                        modality_display_name = selected_modality.display_name
 
                         result = entry_use_cases.create_entry(
                             value=value,
@@ -165,13 +166,13 @@ def render():
                         )
 
                         # Formatar valor para exibição
-                        value_formatted = f"R$ {value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                        value_formatted = format_brl(value)
                         date_formatted = entry_datetime.strftime("%d/%m/%Y")
 
                         # Salvar mensagem de sucesso no session_state para exibir após rerun
                         if installments_count and installments_count >= 1:
                             installment_value = value / installments_count
-                            installment_value_formatted = f"R$ {installment_value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                            installment_value_formatted = format_brl(installment_value)
 
                             st.session_state.success_message = (
                                 f"✅ **Crediário criado com sucesso!**\n\n"
@@ -257,150 +258,24 @@ def render():
                 datetime.combine(end_date, datetime.max.time()) if end_date else None
             )
 
-            entries = entry_use_cases.list_entries(start_datetime, end_datetime)
+            with section("fetch"):
+                entries = entry_use_cases.list_entries(start_datetime, end_datetime)
 
-            # Criar mapeamento de modality_id para cor, nome e banco
-            modality_color_map = {m.id: m.color for m in modalities}
-            modality_name_map = {}
-            for m in modalities:
-                # Incluir banco no nome se disponível
-                display_name = f"{m.name} ({m.bank_name})" if m.bank_name else m.name
-                modality_name_map[m.id] = display_name
+            # Mapeamentos de modality_id para cor e nome (com banco), já montados no catálogo
+            modality_color_map = catalog.colors
+            modality_name_map = catalog.names
 
             if not entries:
                 st.info("Nenhum lançamento encontrado no período selecionado.")
             else:
                 # Calcular total diretamente dos lançamentos filtrados
-                total = sum(e.value for e in entries)
+                total = entries.total()
                 st.markdown(
-                    f"### Total Geral: R$ {total:,.2f}".replace(",", "X")
-                    .replace(".", ",")
-                    .replace("X", ".")
+                    f"### Total Geral: {format_brl(total)}"
                 )
                 st.divider()
 
-                entries_by_date = {}
-                # Ordena por created_at crescente (primeiro lançamento embaixo, mais recente em cima)
-                for entry in sorted(entries, key=lambda x: x.created_at or x.date, reverse=False):
-                    date_str = entry.date.strftime("%d/%m/%Y")
-                    if date_str not in entries_by_date:
-                        entries_by_date[date_str] = []
-                    entries_by_date[date_str].append(entry)
-
-                max_entries = max(
-                    len(date_entries) for date_entries in entries_by_date.values()
-                )
-
-                # Ordena as datas usando datetime para comparação correta
-                dates_sorted = sorted(
-                    entries_by_date.keys(),
-                    key=lambda d: datetime.strptime(d, "%d/%m/%Y"),
-                    reverse=True,
-                )
-
-                html_content = """
-                <style>
-                .scroll-container {
-                    overflow-x: auto;
-                    max-height: 700px;
-                    overflow-y: auto;
-                    margin: 20px 0;
-                }
-                .scroll-container::-webkit-scrollbar {
-                    height: 12px;
-                    width: 12px;
-                }
-                .scroll-container::-webkit-scrollbar-track {
-                    background: #f1f1f1;
-                    border-radius: 10px;
-                }
-                .scroll-container::-webkit-scrollbar-thumb {
-                    background: #9333EA;
-                    border-radius: 10px;
-                }
-                .scroll-container::-webkit-scrollbar-thumb:hover {
-                    background: #7c2cc9;
-                }
-                </style>
-                <div class='scroll-container'>"""
-
-                html_content += "<table style='border-collapse: collapse;'>"
-
-                html_content += "<thead><tr>"
-                for date_str in dates_sorted:
-                    date_entries = entries_by_date[date_str]
-                    daily_total = sum(e.value for e in date_entries)
-                    header_label = (
-                        f"{date_str} - Total: R$ {daily_total:,.2f}".replace(",", "X")
-                        .replace(".", ",")
-                        .replace("X", ".")
-                    )
-                    html_content += f"<th colspan='2' style='background-color: #f0f0f0; padding: 12px; text-align: center; border: 1px solid #ddd; font-weight: bold;'>{header_label}</th>"
-                html_content += "</tr></thead>"
-
-                html_content += "<tbody>"
-
-                # Criar estrutura para rastrear IDs dos entries por posição
-                entries_grid = {}  # {(row_idx, col_idx): entry}
-
-                for i in range(max_entries):
-                    html_content += "<tr>"
-                    for col_idx, date_str in enumerate(dates_sorted):
-                        date_entries = entries_by_date[date_str]
-                        if i < len(date_entries):
-                            entry = date_entries[i]
-                            entries_grid[(i, col_idx)] = entry
-
-                            value_formatted = (
-                                f"R$ {entry.value:,.2f}".replace(",", "X")
-                                .replace(".", ",")
-                                .replace("X", ".")
-                            )
-
-                            # Usar a cor da modalidade atual, não a cor salva no entry
-                            modality_color = modality_color_map.get(
-                                entry.modality_id, entry.modality_color
-                            )
-                            modality_name = modality_name_map.get(
-                                entry.modality_id, entry.modality_name
-                            )
-
-                            html_content += f"<td style='padding: 10px; text-align: right; border: 1px solid #ddd; min-width: 180px; white-space: nowrap;'>{value_formatted}</td>"
-
-                            # Converter cor hex para rgba com 60% opacidade
-                            def hex_to_rgba(hex_color, opacity=0.6):
-                                hex_color = hex_color.lstrip("#")
-                                r, g, b = tuple(
-                                    int(hex_color[i : i + 2], 16) for i in (0, 2, 4)
-                                )
-                                return f"rgba({r}, {g}, {b}, {opacity})"
-
-                            # Se for pagamento de crediário, usar cor verde; senão, usar cor da modalidade
-                            if entry.credit_payment:
-                                # Verde para recebimento de crediário
-                                bg_color = "rgba(34, 197, 94, 0.7)"  # Verde mais forte
-                                display_text = f"Recebimento Crediário<br><span style='font-size: 11px; font-weight: normal;'>{modality_name}</span>"
-                            elif entry.is_credit_plan:
-                                # Mostrar "Pgto Crediário" abaixo do nome da modalidade
-                                bg_color = hex_to_rgba(modality_color, 0.6)
-                                display_text = f"{modality_name}<br><span style='font-size: 11px; font-weight: normal;'>Pgto Crediário</span>"
-                            else:
-                                bg_color = hex_to_rgba(modality_color, 0.6)
-                                display_text = modality_name
-
-                            html_content += (
-                                f"<td style='padding: 10px; text-align: center; border: 1px solid #ddd; min-width: 180px; white-space: nowrap; "
-                                f"background-color: {bg_color}; color: #333; font-weight: bold;'>"
-                                f"{display_text}</td>"
-                            )
-                        else:
-                            html_content += "<td style='padding: 10px; border: 1px solid #ddd; min-width: 180px;'></td>"
-                            html_content += "<td style='padding: 10px; border: 1px solid #ddd; min-width: 180px;'></td>"
-                    html_content += "</tr>"
-                html_content += "</tbody></table>"
-                html_content += "</div>"
-
-                st.markdown(html_content, unsafe_allow_html=True)
+                render_entry_grid(entries, catalog.rgba, modality_name_map)
 
                 # Modal de confirmação
                 if st.session_state.get("show_delete_modal", False):
@@ -468,7 +343,7 @@ def render():
                     )
 
                     data_str = entry.date.strftime("%d/%m/%Y")
-                    valor_str = f"R$ {entry.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+                    valor_str = format_brl(entry.value)
                     option_label = f"{data_str} - {modality_name} - {valor_str}"
 
                     df_data.append(
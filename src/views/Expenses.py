@@ -1,7 +1,12 @@
+import uuid
 import streamlit as st
 from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.components.account_month_list import render_account_month_list
+from presentation.profiler import section
 
 
 def render():
@@ -17,6 +22,8 @@ def render():
         with col3:
             if st.button("Lançamento", use_container_width=True, type="primary"):
                 st.session_state.show_expense_modal = True
+                st.session_state.pop("expense_batch_key", None)
+                st.session_state.pop("expense_batch_created", None)
 
         # Filtros de data
         col1, col2, col3 = st.columns([2, 2, 1])
@@ -57,8 +64,8 @@ def render():
         )
 
         # Buscar apenas despesas (type=payment)
-        all_accounts = account_use_cases.list_accounts(start_datetime, end_datetime)
-        expenses = [acc for acc in all_accounts if acc.type == "payment"]
+        with section("fetch"):
+            expenses = account_use_cases.list_accounts(start_datetime, end_datetime, "payment")
 
         st.divider()
 
@@ -117,11 +124,7 @@ def _render_cards_resumo(expenses, today):
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_a_pagar_fmt = (
-            f"R$ {total_a_pagar:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_a_pagar_fmt = format_brl(total_a_pagar)
         st.markdown(
             f"""
             <div style="border: 3px solid #DC2626; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%); text-align: center;">
@@ -134,11 +137,7 @@ def _render_cards_resumo(expenses, today):
         )
 
     with col2:
-        total_a_vencer_fmt = (
-            f"R$ {total_a_vencer:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_a_vencer_fmt = format_brl(total_a_vencer)
         st.markdown(
             f"""
             <div style="border: 3px solid #6B7280; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f9fafb 0%, #f3f4f6 100%); text-align: center;">
@@ -151,11 +150,7 @@ def _render_cards_resumo(expenses, today):
         )
 
     with col3:
-        total_pago_fmt = (
-            f"R$ {total_pago:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_pago_fmt = format_brl(total_pago)
         st.markdown(
             f"""
             <div style="border: 3px solid #10B981; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); text-align: center;">
@@ -168,11 +163,7 @@ def _render_cards_resumo(expenses, today):
         )
 
     with col4:
-        total_geral_fmt = (
-            f"R$ {total_geral:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_geral_fmt = format_brl(total_geral)
         st.markdown(
             f"""
             <div style="border: 3px solid #F59E0B; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%); text-align: center;">
@@ -186,120 +177,20 @@ def _render_cards_resumo(expenses, today):
 
 
 def _render_expenses_table(expenses, account_use_cases):
-    """Renderiza tabela de despesas com data_editor agrupada por mês"""
+    """Renderiza despesas agrupadas por mês, paginadas e editáveis (valor e pago)"""
     if not expenses:
         st.info("Nenhuma despesa encontrada no período selecionado.")
         return
 
     st.subheader("Lista de Despesas por Mês", anchor=False)
 
-    # Agrupar despesas por mês
-    expenses_by_month = {}
-    for expense in expenses:
-        month_key = expense.date.strftime("%Y-%m")
-        month_label = expense.date.strftime("%b/%Y")
-
-        if month_key not in expenses_by_month:
-            expenses_by_month[month_key] = {"label": month_label, "expenses": []}
-
-        expenses_by_month[month_key]["expenses"].append(expense)
-
-    # Ordenar meses (mais antigo primeiro - ordem crescente)
-    sorted_months = sorted(expenses_by_month.keys(), reverse=False)
-
-    # Renderizar cada mês em um expander com data_editor
-    for month_key in sorted_months:
-        month_data = expenses_by_month[month_key]
-        month_expenses = sorted(
-            month_data["expenses"], key=lambda x: x.date, reverse=False
-        )
-
-        # Calcular total do mês
-        month_total = sum(exp.value for exp in month_expenses)
-        month_total_fmt = f"R$ {month_total:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-
-        with st.expander(f"📅 {month_data['label']} - {month_total_fmt}", expanded=True):
-            # Renderizar todas as despesas sem paginação
-            for expense in month_expenses:
-                _render_expense_row(expense, account_use_cases)
-
-            # Padding inferior dentro do expander
-            st.markdown("<div style='padding-bottom: 20px;'></div>", unsafe_allow_html=True)
-
-
-def _render_expense_row(expense, account_use_cases):
-    """Renderiza uma linha de despesa com checkbox e botões de ação"""
-    col1, col2, col3, col4, col5 = st.columns([0.5, 1.8, 3.5, 2, 1])
+    def request_delete(expense):
+        st.session_state.delete_expense_id = expense.id
+        st.session_state.show_delete_expense_modal = True
 
-    with col1:
-        # Botão de delete
-        if st.button("🗑️", key=f"delete_btn_expense_{expense.id}", help="Excluir despesa"):
-            st.session_state.delete_expense_id = expense.id
-            st.session_state.show_delete_expense_modal = True
-            st.rerun()
-
-    with col2:
-        st.text(expense.date.strftime("%d/%m/%Y"))
-
-    with col3:
-        st.text(expense.description)
-
-    with col4:
-        # Valor editável inline
-        value_key = f"expense_value_{expense.id}"
-        value_sync_key = f"expense_value_sync_{expense.id}"
-
-        # Inicializar sync_key com valor do banco
-        if value_sync_key not in st.session_state:
-            st.session_state[value_sync_key] = float(expense.value)
-
-        # Inicializar value_key
-        if value_key not in st.session_state:
-            st.session_state[value_key] = st.session_state[value_sync_key]
-
-        new_value = st.number_input(
-            "Valor",
-            min_value=0.01,
-            step=0.01,
-            format="%.2f",
-            key=value_key,
-            label_visibility="collapsed"
-        )
-
-        # Atualizar banco quando valor muda
-        if abs(new_value - st.session_state[value_sync_key]) > 0.001:
-            try:
-                account_use_cases.update_account(expense.id, value=new_value)
-                st.session_state[value_sync_key] = new_value
-                st.rerun()
-            except Exception as e:
-                st.error(f"Erro: {str(e)}")
-
-    with col5:
-        checkbox_key = f"expense_paid_{expense.id}"
-        sync_key = f"expense_sync_{expense.id}"
-
-        # Inicializar sync_key com valor do banco (só na primeira vez)
-        if sync_key not in st.session_state:
-            st.session_state[sync_key] = expense.paid
-
-        # Inicializar checkbox com valor sincronizado
-        if checkbox_key not in st.session_state:
-            st.session_state[checkbox_key] = st.session_state[sync_key]
-
-        new_paid = st.checkbox(
-            "Pago",
-            key=checkbox_key,
-            label_visibility="collapsed"
-        )
-
-        # Atualizar banco quando valor muda (comparar com sync_key)
-        if new_paid != st.session_state[sync_key]:
-            try:
-                account_use_cases.update_account(expense.id, paid=new_paid)
-                st.session_state[sync_key] = new_paid
-            except Exception as e:
-                st.error(f"Erro: {str(e)}")
+    render_account_month_list(
+        expenses, account_use_cases, key="expenses_table", on_delete=request_delete
+    )
 
 
 @st.dialog("Nova Despesa")
@@ -342,19 +233,37 @@ def _render_cadastro_modal(account_use_cases):
             else:
                 try:
                     date_datetime = datetime.combine(data_despesa, datetime.min.time())
-                    account_use_cases.create_recurring_account(
+                    # Mesma chave enquanto o modal estiver aberto: reenviar após
+                    # uma falha parcial só cria os meses que faltaram
+                    if "expense_batch_key" not in st.session_state:
+                        st.session_state.expense_batch_key = uuid.uuid4().hex
+                        st.session_state.expense_batch_created = {}
+                    result = account_use_cases.create_recurring_account(
                         value=valor,
                         date=date_datetime,
                         description=descricao.strip(),
                         account_type="payment",
                         recurrence=int(recorrencia),
+                        batch_key=st.session_state.expense_batch_key,
+                        created=st.session_state.expense_batch_created,
                     )
-                    if recorrencia > 1:
-                        st.success(f"Despesa cadastrada para {int(recorrencia)} meses!")
+                    if not result.ok:
+                        st.error(
+                            f"{len(result.errors)} de {result.total} mês(es) não foram salvos. "
+                            "Clique em Salvar novamente para tentar só os que faltaram."
+                        )
+                        for index in result.failed_rows:
+                            month = (date_datetime + relativedelta(months=index)).strftime("%m/%Y")
+                            st.caption(f"{month}: {result.errors[index]}")
                     else:
-                        st.success("Despesa cadastrada com sucesso!")
-                    st.session_state.show_expense_modal = False
-                    st.rerun()
+                        if recorrencia > 1:
+                            st.success(f"Despesa cadastrada para {int(recorrencia)} meses!")
+                        else:
+                            st.success("Despesa cadastrada com sucesso!")
+                        del st.session_state.expense_batch_key
+                        del st.session_state.expense_batch_created
+                        st.session_state.show_expense_modal = False
+                        st.rerun()
                 except Exception as e:
                     st.error(f"Erro ao salvar: {str(e)}")
 
@@ -374,8 +283,7 @@ def _render_edit_modal(account_use_cases):
 
     try:
         # Buscar despesa
-        all_accounts = account_use_cases.list_accounts(None, None)
-        expense = next((acc for acc in all_accounts if acc.id == expense_id and acc.type == "payment"), None)
+        expense = account_use_cases.get_account(expense_id, "payment")
 
         if not expense:
             st.error("Despesa não encontrada!")
@@ -443,8 +351,7 @@ def _render_delete_modal(account_use_cases):
 
     try:
         # Buscar despesa
-        all_accounts = account_use_cases.list_accounts(None, None)
-        expense = next((acc for acc in all_accounts if acc.id == expense_id and acc.type == "payment"), None)
+        expense = account_use_cases.get_account(expense_id, "payment")
 
         if not expense:
             st.error("Despesa não encontrada!")
@@ -452,7 +359,7 @@ def _render_delete_modal(account_use_cases):
             st.rerun()
             return
 
-        value_str = f"R$ {expense.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        value_str = format_brl(expense.value)
         date_str = expense.date.strftime("%d/%m/%Y")
 
         st.write("Tem certeza que deseja excluir esta despesa?")
@@ -497,7 +404,7 @@ def _render_delete_section(expenses, account_use_cases):
 
     # Ordenar por data decrescente (mais recentes primeiro no select)
     for expense in sorted(expenses, key=lambda x: x.date, reverse=True):
-        value_str = f"R$ {expense.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        value_str = format_brl(expense.value)
         date_str = expense.date.strftime("%d/%m/%Y")
         status_str = "✅ Paga" if expense.paid else "⏳ Pendente"
 
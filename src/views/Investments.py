@@ -2,7 +2,10 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime, timedelta
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.components.account_month_list import render_account_month_list
+from presentation.profiler import section
 
 
 def render():
@@ -56,8 +59,8 @@ def render():
         )
 
         # Buscar apenas investimentos
-        all_accounts = account_use_cases.list_accounts(start_datetime, end_datetime)
-        investments = [acc for acc in all_accounts if acc.type == "investment"]
+        with section("fetch"):
+            investments = account_use_cases.list_accounts(start_datetime, end_datetime, "investment")
 
         st.divider()
 
@@ -98,7 +101,7 @@ def _render_cards_resumo(investments, today):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        total_realizado_fmt = f"R$ {total_realizado:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        total_realizado_fmt = format_brl(total_realizado)
         st.markdown(
             f"""
             <div style="border: 3px solid #10B981; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); text-align: center;">
@@ -111,7 +114,7 @@ def _render_cards_resumo(investments, today):
         )
 
     with col2:
-        total_pendente_fmt = f"R$ {total_pendente:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        total_pendente_fmt = format_brl(total_pendente)
         st.markdown(
             f"""
             <div style="border: 3px solid #F59E0B; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%); text-align: center;">
@@ -124,7 +127,7 @@ def _render_cards_resumo(investments, today):
         )
 
     with col3:
-        total_geral_fmt = f"R$ {total_geral:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        total_geral_fmt = format_brl(total_geral)
         st.markdown(
             f"""
             <div style="border: 3px solid #9333EA; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f5f3ff 0%, #ede9fe 100%); text-align: center;">
@@ -138,87 +141,20 @@ def _render_cards_resumo(investments, today):
 
 
 def _render_investments_table(investments, account_use_cases):
-    """Renderiza tabela de investimentos com data_editor agrupada por mês"""
+    """Renderiza investimentos agrupados por mês (mais recente primeiro), paginados e editáveis"""
     if not investments:
         st.info("Nenhum investimento encontrado no período selecionado.")
         return
 
     st.subheader("Lista de Investimentos por Mês", anchor=False)
 
-    # Agrupar investimentos por mês
-    investments_by_month = {}
-    for investment in investments:
-        month_key = investment.date.strftime("%Y-%m")
-        month_label = investment.date.strftime("%b/%Y")
-
-        if month_key not in investments_by_month:
-            investments_by_month[month_key] = {
-                "label": month_label,
-                "investments": []
-            }
-
-        investments_by_month[month_key]["investments"].append(investment)
-
-    # Ordenar meses (mais recente primeiro)
-    sorted_months = sorted(investments_by_month.keys(), reverse=True)
-
-    # Renderizar cada mês em um expander com data_editor
-    for month_key in sorted_months:
-        month_data = investments_by_month[month_key]
-        month_investments = sorted(
-            month_data["investments"], key=lambda x: x.date, reverse=True
-        )
-
-        # Calcular total do mês
-        month_total = sum(inv.value for inv in month_investments)
-        month_total_fmt = f"R$ {month_total:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-
-        with st.expander(f"📅 {month_data['label']} - {month_total_fmt}", expanded=True):
-            # Preparar dados para o data_editor
-            table_data = []
-            investment_map = {}  # Para mapear índices de volta aos IDs
-
-            for idx, investment in enumerate(month_investments):
-                value_str = (
-                    f"R$ {investment.value:,.2f}".replace(",", "X")
-                    .replace(".", ",")
-                    .replace("X", ".")
-                )
-                table_data.append({
-                    "Data": investment.date.strftime("%d/%m/%Y"),
-                    "Descrição": investment.description,
-                    "Valor": value_str,
-                    "Realizado": investment.paid
-                })
-                investment_map[idx] = investment.id
-
-            # Renderizar tabela editável
-            edited_df = st.data_editor(
-                table_data,
-                use_container_width=True,
-                hide_index=True,
-                disabled=["Data", "Descrição", "Valor"],
-                column_config={
-                    "Data": st.column_config.TextColumn("Data", width="small"),
-                    "Descrição": st.column_config.TextColumn(
-                        "Descrição", width="medium"
-                    ),
-                    "Valor": st.column_config.TextColumn("Valor", width="small"),
-                    "Realizado": st.column_config.CheckboxColumn("Realizado", width="small")
-                },
-                key=f"investments_table_{month_key}"
-            )
-
-            # Detectar mudanças e atualizar
-            for idx, (original, edited) in enumerate(zip(table_data, edited_df)):
-                if original["Realizado"] != edited["Realizado"]:
-                    investment_id = investment_map[idx]
-                    try:
-                        account_use_cases.update_account(investment_id, paid=edited["Realizado"])
-                        st.success(f"Status atualizado para: {edited['Descrição']}")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Erro ao atualizar: {str(e)}")
+    render_account_month_list(
+        investments,
+        account_use_cases,
+        key="investments_table",
+        paid_label="Realizado",
+        newest_first=True,
+    )
 
 
 @st.dialog("Novo Investimento")
@@ -286,7 +222,7 @@ def _render_delete_section(investments, account_use_cases):
     investment_map = {}
 
     for investment in sorted(investments, key=lambda x: x.date, reverse=True):
-        value_str = f"R$ {investment.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        value_str = format_brl(investment.value)
         date_str = investment.date.strftime("%d/%m/%Y")
         status_str = "✅ Realizado" if investment.paid else "⏳ Pendente"
 
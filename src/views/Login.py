@@ -57,7 +57,9 @@ def Login():
                             auth_token.token, auth_token.refresh_token, auth_token.user
                         )
 
-                        http_client.set_auth_token(auth_token.token)
+                        http_client.set_auth_token(
+                            auth_token.token, auth_token.user.company_id
+                        )
 
                         if auth_token.user.is_super_admin:
                             st.session_state.current_page = "Admin"
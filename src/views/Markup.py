@@ -1,6 +1,8 @@
 import streamlit as st
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.profiler import section
 
 
 @st.dialog("Configurações Padrão")
@@ -73,7 +75,8 @@ def render():
 
     try:
         # Buscar configurações
-        settings = platform_settings_use_cases.get_settings()
+        with section("fetch"):
+            settings = platform_settings_use_cases.get_settings()
 
         # Verificar se usuário é admin ou super admin
         current_user = st.session_state.get("current_user")
@@ -167,8 +170,8 @@ def render():
             margem_tab1 = ((preco_venda_tab1 - valor_compra_tab1) / preco_venda_tab1 * 100) if preco_venda_tab1 > 0 else 0
 
             # Formatações
-            preco_venda_fmt = f"R$ {preco_venda_tab1:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            lucro_fmt = f"R$ {lucro_bruto_tab1:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+            preco_venda_fmt = format_brl(preco_venda_tab1)
+            lucro_fmt = format_brl(lucro_bruto_tab1)
 
             # Card com resultado
             st.markdown(f"""
@@ -255,9 +258,9 @@ def render():
             margem_tab2 = ((preco_venda_tab2 - preco_compra_calculado) / preco_venda_tab2 * 100) if preco_venda_tab2 > 0 else 0
 
             # Formatações
-            preco_compra_fmt = f"R$ {preco_compra_calculado:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            preco_venda_fmt2 = f"R$ {preco_venda_tab2:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            lucro_fmt2 = f"R$ {lucro_bruto_tab2:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+            preco_compra_fmt = format_brl(preco_compra_calculado)
+            preco_venda_fmt2 = format_brl(preco_venda_tab2)
+            lucro_fmt2 = format_brl(lucro_bruto_tab2)
 
             # Validações e avisos
             warnings2 = []
@@ -361,8 +364,8 @@ def render():
             margem_tab3 = ((preco_venda_tab3 - valor_compra_tab3) / preco_venda_tab3 * 100) if preco_venda_tab3 > 0 else 0
 
             # Formatações
-            preco_venda_fmt3 = f"R$ {preco_venda_tab3:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-            lucro_fmt3 = f"R$ {lucro_bruto_tab3:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+            preco_venda_fmt3 = format_brl(preco_venda_tab3)
+            lucro_fmt3 = format_brl(lucro_bruto_tab3)
 
             # Validações e avisos
             warnings3 = []
@@ -1,6 +1,8 @@
 import streamlit as st
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.profiler import section
 from collections import defaultdict
 
 
@@ -43,7 +45,8 @@ def _render_modalities_by_bank(use_cases):
     st.subheader("Modalidades por Banco", anchor=False)
 
     try:
-        modalities = use_cases.list_modalities()
+        with section("fetch"):
+            modalities = use_cases.list_modalities()
 
         if not modalities:
             st.info("Nenhuma modalidade cadastrada ainda.")
@@ -105,11 +108,7 @@ def _render_modality_card_compact(modality):
     # Format rental
     rental_row = ""
     if modality.rental_fee > 0:
-        rental_formatted = (
-            f"R$ {modality.rental_fee:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        rental_formatted = format_brl(modality.rental_fee)
         rental_row = f'<p style="margin: 0; font-size: 11px; color: #e74c3c;"><strong>Aluguel:</strong> {rental_formatted}</p>'
 
     # Build complete HTML (single line to avoid whitespace issues)
@@ -246,8 +245,7 @@ def _show_edit_modality_modal(use_cases):
         return
 
     # Buscar modalidade
-    modalities = use_cases.list_modalities()
-    selected_modality = next((m for m in modalities if m.id == modality_id), None)
+    selected_modality = use_cases.catalog().by_id.get(modality_id)
 
     if not selected_modality:
         st.error("Modalidade não encontrada")
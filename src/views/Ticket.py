@@ -1,7 +1,10 @@
 import streamlit as st
 from datetime import datetime, timedelta
 from dependencies import get_container
+from domain.money import format_brl
 from presentation.components.page_header import render_page_header
+from presentation.components.account_month_list import render_account_month_list
+from presentation.profiler import section
 
 
 def render():
@@ -57,8 +60,8 @@ def render():
         )
 
         # Buscar apenas boletos (type=boleto)
-        all_accounts = account_use_cases.list_accounts(start_datetime, end_datetime)
-        boletos = [acc for acc in all_accounts if acc.type == "boleto"]
+        with section("fetch"):
+            boletos = account_use_cases.list_accounts(start_datetime, end_datetime, "boleto")
 
         st.divider()
 
@@ -117,11 +120,7 @@ def _render_cards_resumo(boletos, today):
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        total_a_pagar_fmt = (
-            f"R$ {total_a_pagar:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_a_pagar_fmt = format_brl(total_a_pagar)
         st.markdown(
             f"""
             <div style="border: 3px solid #DC2626; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%); text-align: center;">
@@ -134,11 +133,7 @@ def _render_cards_resumo(boletos, today):
         )
 
     with col2:
-        total_a_vencer_fmt = (
-            f"R$ {total_a_vencer:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_a_vencer_fmt = format_brl(total_a_vencer)
         st.markdown(
             f"""
             <div style="border: 3px solid #6B7280; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f9fafb 0%, #f3f4f6 100%); text-align: center;">
@@ -151,11 +146,7 @@ def _render_cards_resumo(boletos, today):
         )
 
     with col3:
-        total_pago_fmt = (
-            f"R$ {total_pago:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_pago_fmt = format_brl(total_pago)
         st.markdown(
             f"""
             <div style="border: 3px solid #10B981; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%); text-align: center;">
@@ -168,11 +159,7 @@ def _render_cards_resumo(boletos, today):
         )
 
     with col4:
-        total_geral_fmt = (
-            f"R$ {total_geral:,.2f}".replace(",", "X")
-            .replace(".", ",")
-            .replace("X", ".")
-        )
+        total_geral_fmt = format_brl(total_geral)
         st.markdown(
             f"""
             <div style="border: 3px solid #F59E0B; border-radius: 12px; padding: 20px; background: linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%); text-align: center;">
@@ -186,120 +173,20 @@ def _render_cards_resumo(boletos, today):
 
 
 def _render_boletos_table(boletos, account_use_cases):
-    """Renderiza tabela de boletos com data_editor agrupada por mês"""
+    """Renderiza boletos agrupados por mês, paginados e editáveis (valor e pago)"""
     if not boletos:
         st.info("Nenhum boleto encontrado no período selecionado.")
         return
 
     st.subheader("Lista de Boletos por Mês", anchor=False)
 
-    # Agrupar boletos por mês
-    boletos_by_month = {}
-    for boleto in boletos:
-        month_key = boleto.date.strftime("%Y-%m")
-        month_label = boleto.date.strftime("%b/%Y")
-
-        if month_key not in boletos_by_month:
-            boletos_by_month[month_key] = {"label": month_label, "boletos": []}
-
-        boletos_by_month[month_key]["boletos"].append(boleto)
-
-    # Ordenar meses (mais antigo primeiro - ordem crescente)
-    sorted_months = sorted(boletos_by_month.keys(), reverse=False)
-
-    # Renderizar cada mês em um expander com data_editor
-    for month_key in sorted_months:
-        month_data = boletos_by_month[month_key]
-        month_boletos = sorted(
-            month_data["boletos"], key=lambda x: x.date, reverse=False
-        )
-
-        # Calcular total do mês
-        month_total = sum(bol.value for bol in month_boletos)
-        month_total_fmt = f"R$ {month_total:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
-
-        with st.expander(f"📅 {month_data['label']} - {month_total_fmt}", expanded=True):
-            # Renderizar todos os boletos sem paginação
-            for boleto in month_boletos:
-                _render_boleto_row(boleto, account_use_cases)
-
-            # Padding inferior dentro do expander
-            st.markdown("<div style='padding-bottom: 20px;'></div>", unsafe_allow_html=True)
-
-
-def _render_boleto_row(boleto, account_use_cases):
-    """Renderiza uma linha de boleto com checkbox e botões de ação"""
-    col1, col2, col3, col4, col5 = st.columns([0.5, 1.8, 3.5, 2, 1])
-
-    with col1:
-        # Botão de delete
-        if st.button("🗑️", key=f"delete_btn_boleto_{boleto.id}", help="Excluir boleto"):
-            st.session_state.delete_boleto_id = boleto.id
-            st.session_state.show_delete_boleto_modal = True
-            st.rerun()
-
-    with col2:
-        st.text(boleto.date.strftime("%d/%m/%Y"))
-
-    with col3:
-        st.text(boleto.description)
-
-    with col4:
-        # Valor editável inline
-        value_key = f"boleto_value_{boleto.id}"
-        value_sync_key = f"boleto_value_sync_{boleto.id}"
-
-        # Inicializar sync_key com valor do banco
-        if value_sync_key not in st.session_state:
-            st.session_state[value_sync_key] = float(boleto.value)
-
-        # Inicializar value_key
-        if value_key not in st.session_state:
-            st.session_state[value_key] = st.session_state[value_sync_key]
-
-        new_value = st.number_input(
-            "Valor",
-            min_value=0.01,
-            step=0.01,
-            format="%.2f",
-            key=value_key,
-            label_visibility="collapsed"
-        )
-
-        # Atualizar banco quando valor muda
-        if abs(new_value - st.session_state[value_sync_key]) > 0.001:
-            try:
-                account_use_cases.update_account(boleto.id, value=new_value)
-                st.session_state[value_sync_key] = new_value
-                st.rerun()
-            except Exception as e:
-                st.error(f"Erro: {str(e)}")
-
-    with col5:
-        checkbox_key = f"boleto_paid_{boleto.id}"
-        sync_key = f"boleto_sync_{boleto.id}"
-
-        # Inicializar sync_key com valor do banco (só na primeira vez)
-        if sync_key not in st.session_state:
-            st.session_state[sync_key] = boleto.paid
+    def request_delete(boleto):
+        st.session_state.delete_boleto_id = boleto.id
+        st.session_state.show_delete_boleto_modal = True
 
-        # Inicializar checkbox com valor sincronizado
-        if checkbox_key not in st.session_state:
-            st.session_state[checkbox_key] = st.session_state[sync_key]
-
-        new_paid = st.checkbox(
-            "Pago",
-            key=checkbox_key,
-            label_visibility="collapsed"
-        )
-
-        # Atualizar banco quando valor muda (comparar com sync_key)
-        if new_paid != st.session_state[sync_key]:
-            try:
-                account_use_cases.update_account(boleto.id, paid=new_paid)
-                st.session_state[sync_key] = new_paid
-            except Exception as e:
-                st.error(f"Erro: {str(e)}")
+    render_account_month_list(
+        boletos, account_use_cases, key="boletos_table", on_delete=request_delete
+    )
 
 
 @st.dialog("Novo Boleto")
@@ -364,8 +251,7 @@ def _render_edit_modal(account_use_cases):
 
     try:
         # Buscar boleto
-        all_accounts = account_use_cases.list_accounts(None, None)
-        boleto = next((acc for acc in all_accounts if acc.id == boleto_id and acc.type == "boleto"), None)
+        boleto = account_use_cases.get_account(boleto_id, "boleto")
 
         if not boleto:
             st.error("Boleto não encontrado!")
@@ -433,8 +319,7 @@ def _render_delete_modal(account_use_cases):
 
     try:
         # Buscar boleto
-        all_accounts = account_use_cases.list_accounts(None, None)
-        boleto = next((acc for acc in all_accounts if acc.id == boleto_id and acc.type == "boleto"), None)
+        boleto = account_use_cases.get_account(boleto_id, "boleto")
 
         if not boleto:
             st.error("Boleto não encontrado!")
@@ -442,7 +327,7 @@ def _render_delete_modal(account_use_cases):
             st.rerun()
             return
 
-        value_str = f"R$ {boleto.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        value_str = format_brl(boleto.value)
         date_str = boleto.date.strftime("%d/%m/%Y")
 
         st.write("Tem certeza que deseja excluir este boleto?")
@@ -487,7 +372,7 @@ def _render_delete_section(boletos, account_use_cases):
 
     # Ordenar por data decrescente (mais recentes primeiro no select)
     for boleto in sorted(boletos, key=lambda x: x.date, reverse=True):
-        value_str = f"R$ {boleto.value:,.2f}".replace(",", "X").replace(".", ",").replace("X", ".")
+        value_str = format_brl(boleto.value)
         date_str = boleto.date.strftime("%d/%m/%Y")
         status_str = "✅ Pago" if boleto.paid else "⏳ Pendente"
 
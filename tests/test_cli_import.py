@@ -0,0 +1,114 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from cli.journal import ImportJournal  # noqa: E402
+from cli.pipeline import ImportRow, ImportStats, Rejected, dedupe  # noqa: E402
+
+
+class ImportJournalTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "import.journal.jsonl")
+
+    def read_lines(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read().splitlines()
+
+    def test_reload_keeps_committed_rows(self):
+        journal = ImportJournal(self.path, "entries")
+        journal.commit([("a-0", "id1"), ("b-0", None)])
+        journal.commit([("c-0", "id3")])
+
+        reloaded = ImportJournal(self.path, "entries")
+        self.assertEqual(reloaded.done, {"a-0": "id1", "b-0": None, "c-0": "id3"})
+        self.assertEqual(reloaded.batches, 2)
+
+    def test_torn_last_line_is_dropped(self):
+        journal = ImportJournal(self.path, "entries")
+        journal.commit([("a-0", "id1")])
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"batch": 2, "rows": {"b-0": "id')
+
+        reloaded = ImportJournal(self.path, "entries")
+        self.assertEqual(reloaded.done, {"a-0": "id1"})
+        self.assertEqual(len(self.read_lines()), 2)
+
+        # O lote perdido é reenviado e gravado em uma linha nova e válida
+        reloaded.commit([("b-0", "id2")])
+        lines = self.read_lines()
+        self.assertEqual(json.loads(lines[-1])["rows"], {"b-0": "id2"})
+        self.assertEqual(ImportJournal(self.path, "entries").done, {"a-0": "id1", "b-0": "id2"})
+
+    def test_complete_last_line_without_newline(self):
+        journal = ImportJournal(self.path, "entries")
+        journal.commit([("a-0", "id1")])
+        with open(self.path, "rb+") as f:
+            f.seek(-1, os.SEEK_END)
+            f.truncate()
+
+        reloaded = ImportJournal(self.path, "entries")
+        self.assertEqual(reloaded.done, {"a-0": "id1"})
+        reloaded.commit([("b-0", "id2")])
+        self.assertEqual(len(self.read_lines()), 3)
+
+    def test_corruption_before_last_line_raises(self):
+        journal = ImportJournal(self.path, "entries")
+        journal.commit([("a-0", "id1")])
+        lines = self.read_lines()
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("\n".join([lines[0], "{broken", lines[1]]) + "\n")
+
+        with self.assertRaises(ValueError):
+            ImportJournal(self.path, "entries")
+
+    def test_other_kind_raises(self):
+        ImportJournal(self.path, "entries")
+        with self.assertRaises(ValueError):
+            ImportJournal(self.path, "accounts")
+
+
+class DedupeTest(unittest.TestCase):
+    def test_skips_journaled_rows_and_counts_rejections(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        journal = ImportJournal(os.path.join(directory.name, "j.jsonl"), "entries")
+        journal.commit([("done-0", "id1")])
+
+        invalid = Rejected(3, "Valor inválido")
+        ignored = Rejected(4, "Crediário", ignored=True)
+        rows = [
+            ImportRow(1, "done-0", None),
+            ImportRow(2, "new-0", None),
+            invalid,
+            ignored,
+            ImportRow(5, "new-1", None),
+        ]
+        stats = ImportStats()
+
+        pending = list(dedupe(rows, journal, stats))
+        self.assertEqual([row.key for row in pending], ["new-0", "new-1"])
+        self.assertEqual(stats.valid, 3)
+        self.assertEqual(stats.already_done, 1)
+        self.assertEqual(stats.invalid, [invalid])
+        self.assertEqual(stats.ignored, [ignored])
+
+    def test_is_lazy(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        journal = ImportJournal(os.path.join(directory.name, "j.jsonl"), "entries")
+        stats = ImportStats()
+
+        pending = dedupe(iter([ImportRow(1, "a-0", None), ImportRow(2, "b-0", None)]), journal, stats)
+        self.assertEqual(next(pending).key, "a-0")
+        self.assertEqual(stats.valid, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
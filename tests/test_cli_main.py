@@ -0,0 +1,87 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from cli.main import main  # noqa: E402
+from config.environment import Environment  # noqa: E402
+
+DELETE_DRY_RUN = ["delete", "--period", "01/01/2026", "31/01/2026", "--dry-run"]
+
+
+class _Backend(BaseHTTPRequestHandler):
+    """Responde [] a qualquer GET e guarda os caminhos pedidos"""
+
+    paths = []
+
+    def do_GET(self):
+        self.paths.append(self.path)
+        body = json.dumps([]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class BaseUrlFlagTest(unittest.TestCase):
+    def setUp(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Backend)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_address[1]}"
+        _Backend.paths = []
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.env_path = Path(directory.name) / ".env"
+
+        # Environment é um singleton que lê o .env uma vez: cada teste começa do zero
+        patcher = mock.patch.dict(os.environ)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        for name in ("BASE_URL", "PORT", "RENDER"):
+            os.environ.pop(name, None)
+        patcher = mock.patch.object(Environment, "ENV_PATH", self.env_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.reset_environment()
+        self.addCleanup(self.reset_environment)
+
+    @staticmethod
+    def reset_environment():
+        Environment._Environment__instance = None
+
+    def run_cli(self, *argv):
+        with redirect_stdout(io.StringIO()):
+            return main(["--base-url", self.url, "--token", "t", *argv])
+
+    def test_flag_wins_over_env_file(self):
+        self.env_path.write_text("BASE_URL=http://127.0.0.1:1\n", encoding="utf-8")
+
+        self.assertEqual(self.run_cli(*DELETE_DRY_RUN), 0)
+        self.assertEqual(len(_Backend.paths), 1)
+        self.assertTrue(_Backend.paths[0].startswith("/api/financial-entries?"))
+
+    def test_flag_without_env_file(self):
+        self.assertFalse(self.env_path.exists())
+
+        self.assertEqual(self.run_cli(*DELETE_DRY_RUN), 0)
+        self.assertEqual(len(_Backend.paths), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
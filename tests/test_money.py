@@ -0,0 +1,68 @@
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from domain.money import format_brl, format_brl_array, parse_brl  # noqa: E402
+
+
+class ParseBrlTest(unittest.TestCase):
+    def test_comma_is_decimal_and_dots_are_thousands(self):
+        self.assertEqual(parse_brl("R$ 1.234,56"), 1234.56)
+        self.assertEqual(parse_brl("1234,56"), 1234.56)
+        self.assertEqual(parse_brl("R$ 1.234.567,89"), 1234567.89)
+
+    def test_dot_groups_of_three_are_thousands(self):
+        self.assertEqual(parse_brl("R$ 1.234"), 1234.0)
+        self.assertEqual(parse_brl("1.234.567"), 1234567.0)
+        self.assertEqual(parse_brl("-R$ 12.000"), -12000.0)
+
+    def test_dot_with_one_or_two_decimals(self):
+        self.assertEqual(parse_brl("1234.5"), 1234.5)
+        self.assertEqual(parse_brl("1234.56"), 1234.56)
+        self.assertEqual(parse_brl("0.99"), 0.99)
+
+    def test_sign_before_or_after_currency(self):
+        self.assertEqual(parse_brl("-R$ 4.037,61"), -4037.61)
+        self.assertEqual(parse_brl("R$ -4.037,61"), -4037.61)
+        self.assertEqual(parse_brl("R$-1,00"), -1.0)
+
+    def test_empty_cells(self):
+        for text in (None, "", " ", "-", "R$", "R$ -", "\\"):
+            with self.subTest(text=text):
+                self.assertIsNone(parse_brl(text))
+
+    def test_invalid_values(self):
+        for text in ("1.2345", "12.", ".5", "1e5", "abc", "1.23.4", "1-"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    parse_brl(text)
+
+    def test_round_trip_with_format_brl(self):
+        for value in (0.0, 0.5, 12.34, 1234.5, -4037.61, 1234567.89):
+            with self.subTest(value=value):
+                self.assertEqual(parse_brl(format_brl(value)), value)
+
+
+class FormatBrlArrayTest(unittest.TestCase):
+    def test_matches_format_brl(self):
+        values = [0.0, 0.005, 1.0, -1.0, 12.345, 999.995, 1234.5, -4037.61, 1234567.891]
+        self.assertEqual(format_brl_array(values).tolist(), [format_brl(v) for v in values])
+
+    def test_keeps_shape_and_series_index(self):
+        import pandas as pd
+
+        self.assertEqual(format_brl_array(np.zeros((2, 3))).shape, (2, 3))
+        series = format_brl_array(pd.Series([1.5, 2.0], index=["a", "b"]))
+        self.assertEqual(series.to_dict(), {"a": "R$ 1,50", "b": "R$ 2,00"})
+
+    def test_rejects_nan(self):
+        with self.assertRaises(ValueError):
+            format_brl_array([1.0, float("nan")])
+
+
+if __name__ == "__main__":
+    unittest.main()